@@ -0,0 +1,96 @@
+"""基準測試：比較原本的逐步清理與 CleaningSpec 的單次清理
+
+比較三種做法讀取並清理計價工作表的時間，並確認結果完全相同:
+  逐步清理  read_sheet 後依序 dropna、iloc[2:]、iloc[:-1]、重新命名、排序（原本 main.py 的做法）
+  spec.clean  read_sheet 後以 CleaningSpec.clean 一次遮罩與 take
+  spec.read   CleaningSpec.read 在讀取時完成欄位選取與列篩選
+
+用法:
+    python benchmarks/bench_cleaning.py [工作簿路徑 ...] [--sheet 2] [--repeat 3]
+
+未指定工作簿時使用 config.py 的 INPUT_FILE_PATH。
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 將專案根目錄與 src 加入路徑以便導入 config 與模組
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "src"))
+
+import pandas as pd
+
+from config import INPUT_FILE_PATH, DEFAULT_SHEET_INDEX
+from data_pipeline import CleaningSpec, sort_by_item
+from excel_reader import ExcelReader
+
+
+def stepwise(path: Path, sheet: int, spec: CleaningSpec) -> pd.DataFrame:
+    """原本的逐步清理"""
+    with ExcelReader(path, cache_max_bytes=0) as reader:
+        df = reader.read_sheet(sheet, usecols=spec.usecols)
+    df = df.dropna(subset=[df.columns[spec.required_column]])
+    df = df.iloc[spec.head_rows:]
+    df = df.iloc[:-spec.tail_rows] if spec.tail_rows else df
+    df = df.rename(columns=dict(zip(df.columns, [spec.rename_map[i] for i in range(len(df.columns))])))
+    return sort_by_item(df)
+
+
+def spec_clean(path: Path, sheet: int, spec: CleaningSpec) -> pd.DataFrame:
+    """讀入後以 CleaningSpec.clean 清理"""
+    with ExcelReader(path, cache_max_bytes=0) as reader:
+        return spec.clean(reader.read_sheet(sheet, usecols=spec.usecols))
+
+
+def spec_read(path: Path, sheet: int, spec: CleaningSpec) -> pd.DataFrame:
+    """以 CleaningSpec.read 在讀取時完成清理"""
+    with ExcelReader(path, cache_max_bytes=0) as reader:
+        return spec.read(reader, sheet)
+
+
+def best_time(method, path: Path, sheet: int, spec: CleaningSpec, repeat: int):
+    """重複執行並返回 (最佳耗時秒數, 結果)"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = method(path, sheet, spec)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比較逐步清理與 CleaningSpec 的速度")
+    parser.add_argument("paths", nargs="*", type=Path, default=[INPUT_FILE_PATH],
+                        help="要測試的工作簿路徑")
+    parser.add_argument("--sheet", type=int, default=DEFAULT_SHEET_INDEX, help="工作表索引")
+    parser.add_argument("--repeat", type=int, default=3, help="每種做法重複次數（取最佳值）")
+    args = parser.parse_args()
+    
+    spec = CleaningSpec.from_config()
+    methods = [("逐步清理", stepwise), ("spec.clean", spec_clean), ("spec.read", spec_read)]
+    
+    for path in args.paths:
+        size_mb = path.stat().st_size / 1024 / 1024
+        print("=" * 50)
+        print(f"{path.name}（{size_mb:.1f} MB）")
+        print("=" * 50)
+        
+        baseline_time, baseline = None, None
+        for name, method in methods:
+            elapsed, result = best_time(method, path, args.sheet, spec, args.repeat)
+            if baseline is None:
+                baseline_time, baseline = elapsed, result
+                print(f"  {name:<10} {elapsed:8.3f} 秒  {len(result)} 列")
+                continue
+            
+            same = result.equals(baseline) and (result.dtypes == baseline.dtypes).all()
+            print(f"  {name:<10} {elapsed:8.3f} 秒  {baseline_time / elapsed:5.2f}x  "
+                  f"{'✓ 結果相同' if same else '✗ 結果不同'}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""基準測試：比較各解析引擎讀取計價工作簿的速度
+
+用法:
+    python benchmarks/bench_excel_engines.py [工作簿路徑 ...] [--repeat 3]
+
+未指定工作簿時使用 config.py 的 INPUT_FILE_PATH。
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 將專案根目錄與 src 加入路徑以便導入 config 與模組
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "src"))
+
+from config import INPUT_FILE_PATH, DEFAULT_SHEET_INDEX, COLUMNS_TO_READ
+from excel_reader import ExcelReader, available_engines
+
+
+def time_engine(path: Path, engine: str, sheet: int, repeat: int) -> float:
+    """以指定引擎開啟工作簿並讀取計價欄位，返回最佳耗時（秒）"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with ExcelReader(path, engine=engine, cache_max_bytes=0) as reader:
+            sheet_name = reader.get_sheet_names()[sheet]
+            reader.read_sheet(sheet_name, usecols=COLUMNS_TO_READ)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比較 Excel 解析引擎的速度")
+    parser.add_argument("paths", nargs="*", type=Path, default=[INPUT_FILE_PATH],
+                        help="要測試的工作簿路徑")
+    parser.add_argument("--sheet", type=int, default=DEFAULT_SHEET_INDEX, help="工作表索引")
+    parser.add_argument("--repeat", type=int, default=3, help="每個引擎重複次數（取最佳值）")
+    args = parser.parse_args()
+    
+    for path in args.paths:
+        engines = available_engines(path.suffix)
+        size_mb = path.stat().st_size / 1024 / 1024
+        print("=" * 50)
+        print(f"{path.name}（{size_mb:.1f} MB）")
+        print("=" * 50)
+        
+        timings = {}
+        for engine in engines:
+            try:
+                timings[engine] = time_engine(path, engine, args.sheet, args.repeat)
+                print(f"  {engine:<10} {timings[engine]:8.3f} 秒")
+            except Exception as e:
+                print(f"  {engine:<10} 失敗: {e}")
+        
+        if timings:
+            winner = min(timings, key=timings.get)
+            with ExcelReader(path) as reader:
+                auto = reader.engine
+            print(f"\n  最快: {winner}（自動選擇: {auto}）")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""基準測試：在本機模擬頁面上測量 WebFormFiller 的填寫速度
+
+報告每秒處理筆數、每筆的 WebDriver 指令數，以及各階段（啟動、開啟頁面、填寫）的耗時。
+瀏覽器模式需要本機安裝 Chrome；--backend http 改以 HttpFormFiller 填寫伺服器端表單
+（/PP_MRS_3010.aspx），指令數為每筆的 HTTP 請求數。
+
+用法:
+    python benchmarks/bench_filler.py [--rows 100 1000 5000] [--latency 200] [--batch-size 200]
+    python benchmarks/bench_filler.py --backend http [--batch-size 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 將 src 加入路徑以便導入模組
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT / "src"))
+
+from standin_server import form_url, generate_rows, login_cookies, page_url, start_server
+from http_form_filler import HttpFormFiller
+from web_form_filler import WebFormFiller
+
+
+def count_commands(driver) -> dict:
+    """包裝 driver.execute，統計送出的 WebDriver 指令數"""
+    counter = {'commands': 0}
+    execute = driver.execute
+    
+    def counting_execute(*args, **kwargs):
+        counter['commands'] += 1
+        return execute(*args, **kwargs)
+    
+    # WebElement 也經由 driver.execute 送出指令，因此一併計入
+    driver.execute = counting_execute
+    return counter
+
+
+def count_requests(session) -> dict:
+    """包裝 session.request，統計送出的 HTTP 請求數"""
+    counter = {'commands': 0}
+    request = session.request
+    
+    def counting_request(*args, **kwargs):
+        counter['commands'] += 1
+        return request(*args, **kwargs)
+    
+    session.request = counting_request
+    return counter
+
+
+def run_http_once(base_url: str, rows: int, latency: int, delay: float, batch_size,
+                  pagesize: int = 0) -> dict:
+    """以 HttpFormFiller 執行一次填寫並返回測量結果（'startup' 為建立連線與登入）"""
+    df = generate_rows(rows)
+    phases = {}
+    
+    filler = HttpFormFiller(cookies=login_cookies(base_url))
+    try:
+        started = time.perf_counter()
+        filler.start_browser()
+        phases['startup'] = time.perf_counter() - started
+        
+        counter = count_requests(filler.session)
+        
+        started = time.perf_counter()
+        filler.open_url(form_url(base_url, rows, latency=latency, pagesize=pagesize), wait_time=30)
+        phases['open'] = time.perf_counter() - started
+        
+        counter['commands'] = 0
+        started = time.perf_counter()
+        results = filler.process_dataframe(df, delay=delay, batch_size=batch_size)
+        phases['fill'] = time.perf_counter() - started
+    finally:
+        filler.close_browser()
+    
+    return {
+        'rows': rows,
+        'success': results['success'],
+        'rows_per_sec': rows / phases['fill'] if phases['fill'] else float('inf'),
+        'commands_per_row': counter['commands'] / rows,
+        'phases': phases
+    }
+
+
+def run_once(base_url: str, rows: int, latency: int, delay: float, batch_size,
+             pagesize: int = 0) -> dict:
+    """以一組參數執行一次填寫並返回測量結果"""
+    df = generate_rows(rows)
+    phases = {}
+    
+    filler = WebFormFiller(headless=True)
+    try:
+        started = time.perf_counter()
+        filler.start_browser()
+        phases['startup'] = time.perf_counter() - started
+        
+        counter = count_commands(filler.driver)
+        
+        started = time.perf_counter()
+        filler.open_url(page_url(base_url, rows, latency=latency, pagesize=pagesize), wait_time=30)
+        phases['open'] = time.perf_counter() - started
+        
+        counter['commands'] = 0
+        started = time.perf_counter()
+        results = filler.process_dataframe(df, delay=delay, batch_size=batch_size)
+        phases['fill'] = time.perf_counter() - started
+    finally:
+        filler.close_browser()
+    
+    return {
+        'rows': rows,
+        'success': results['success'],
+        'rows_per_sec': rows / phases['fill'] if phases['fill'] else float('inf'),
+        'commands_per_row': counter['commands'] / rows,
+        'phases': phases
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="在本機模擬頁面上測量填寫速度")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 5000], help="資料筆數")
+    parser.add_argument("--latency", type=int, default=200, help="postback 延遲（毫秒）")
+    parser.add_argument("--delay", type=float, default=0.0, help="每筆資料之間的延遲（秒）")
+    parser.add_argument("--batch-size", type=int, default=None, help="批次模式每批筆數")
+    parser.add_argument("--pagesize", type=int, default=0, help="表格每頁筆數，0 表示不分頁")
+    parser.add_argument("--backend", choices=["browser", "http"], default="browser",
+                        help="填寫方式：browser 使用 Chrome，http 直接送出 postback")
+    args = parser.parse_args()
+    
+    run = run_http_once if args.backend == "http" else run_once
+    server, base_url = start_server()
+    measurements = []
+    try:
+        for rows in args.rows:
+            measurements.append(run(base_url, rows, args.latency, args.delay, args.batch_size,
+                                    args.pagesize))
+    finally:
+        server.shutdown()
+    
+    print("\n" + "=" * 78)
+    print(f"{'筆數':>6} {'成功':>6} {'筆/秒':>8} {'指令/筆':>8} "
+          f"{'啟動(秒)':>9} {'開啟(秒)':>9} {'填寫(秒)':>9}")
+    print("=" * 78)
+    for m in measurements:
+        print(f"{m['rows']:>6} {m['success']:>6} {m['rows_per_sec']:>8.1f} {m['commands_per_row']:>8.1f} "
+              f"{m['phases']['startup']:>9.2f} {m['phases']['open']:>9.2f} {m['phases']['fill']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""基準測試：量測各進入點的啟動時間與匯入的重量級套件
+
+以 python -X importtime 在子行程中執行每個進入點，列出累計匯入時間最長的模組，
+並檢查不應在啟動時載入的套件（例如只匯入 web_form_filler 時不應載入 selenium 與 pandas）。
+有任何進入點載入了不應載入的套件時，以結束碼 1 結束。
+
+用法:
+    python benchmarks/bench_startup.py [--top 10]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+# (名稱, 執行參數, 不應載入的頂層套件)
+ENTRY_POINTS = [
+    ("import web_form_filler", ["-c", "import web_form_filler"],
+     ("selenium", "webdriver_manager", "pandas")),
+    ("import example_web_fill", ["-c", "import example_web_fill"],
+     ("selenium", "webdriver_manager")),
+    ("batch_main.py --help", [str(SRC / "batch_main.py"), "--help"],
+     ("pandas", "selenium")),
+    ("import excel_reader", ["-c", "import excel_reader"],
+     ("selenium", "webdriver_manager")),
+    ("import http_form_filler", ["-c", "import http_form_filler"],
+     ("selenium", "webdriver_manager", "pandas", "requests")),
+]
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    解析 -X importtime 的輸出
+
+    Returns:
+        (模組名稱, 自身微秒, 累計微秒) 的列表
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure(args: list) -> tuple:
+    """在子行程中執行進入點，返回 (牆鐘時間秒數, 匯入記錄)"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(SRC), str(ROOT), env.get("PYTHONPATH", "")])
+
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-X", "importtime", *args],
+                               cwd=SRC, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    return elapsed, parse_importtime(completed.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="量測各進入點的啟動時間")
+    parser.add_argument("--top", type=int, default=10, help="列出累計匯入時間最長的模組數")
+    args = parser.parse_args()
+
+    violations = []
+    for label, entry_args, forbidden in ENTRY_POINTS:
+        elapsed, modules = measure(entry_args)
+        loaded = {name.split(".")[0] for name, _, _ in modules}
+        total_ms = sum(self_us for _, self_us, _ in modules) / 1000
+
+        print("=" * 50)
+        print(f"{label}: {elapsed * 1000:.0f} ms（匯入 {total_ms:.0f} ms，{len(modules)} 個模組）")
+        print("=" * 50)
+        for name, _, cumulative_us in sorted(modules, key=lambda m: m[2], reverse=True)[:args.top]:
+            print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+        unexpected = sorted(loaded & set(forbidden))
+        if unexpected:
+            print(f"  ✗ 不應在啟動時載入: {', '.join(unexpected)}")
+            violations.append(label)
+        else:
+            print(f"  ✓ 未載入: {', '.join(forbidden)}")
+        print()
+
+    if violations:
+        print(f"✗ {len(violations)} 個進入點載入了不必要的套件")
+        sys.exit(1)
+    print("✓ 所有進入點都未載入不必要的套件")
+
+
+if __name__ == "__main__":
+    main()
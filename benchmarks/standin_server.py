@@ -0,0 +1,317 @@
+"""PP_MRS_3010 收料頁面的本機模擬伺服器
+
+以 HTTP 提供 benchmarks/fixtures 目錄，頁面的查詢參數說明見 pp_mrs_3010.html。
+
+另外在 /PP_MRS_3010.aspx 提供由伺服器產生的 WebForms 版本，供 HttpFormFiller 測試:
+  - 先 GET /Login.aspx 取得 .ASPXAUTH 登入 cookie，未登入時導向登入頁
+  - 表單包含 __VIEWSTATE、__EVENTVALIDATION 等隱藏欄位，每次回應都會更新，
+    送出過期的值時回應 500（與 ASP.NET 的 viewstate 驗證失敗相同）
+  - 每次 POST 依送出的欄位值更新數量與複價（狀態依 ASP.NET_SessionId 保存），
+    並延遲 latency 毫秒；__EVENTTARGET 為 gvReceive、__EVENTARGUMENT 為 Page$N 時換頁
+  - 查詢參數 rows、latency、pagesize 與靜態頁面相同，於建立工作階段時套用
+
+用法:
+    python benchmarks/standin_server.py [--port 8000]
+"""
+
+import argparse
+import html
+import secrets
+import threading
+import time
+from functools import partial
+from http.cookies import SimpleCookie
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlencode, urlsplit
+
+import pandas as pd
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def generate_rows(rows: int) -> pd.DataFrame:
+    """
+    產生與模擬頁面一致的填寫資料
+    
+    Args:
+        rows: 筆數
+    
+    Returns:
+        包含「項次」、「數量」、「複價」欄位的 DataFrame
+    """
+    records = []
+    for i in range(rows):
+        price = (i % 7) + 1 + (0.5 if i % 5 == 0 else 0)
+        quantity = (i % 13) + 1
+        records.append({
+            '項次': f"{i // 10 + 1}-{i % 10 + 1}",
+            '數量': quantity,
+            '複價': quantity * price
+        })
+    return pd.DataFrame(records)
+
+
+class _ReceivingSession:
+    """一個 ASP.NET_SessionId 的收料表格狀態"""
+    
+    def __init__(self, rows: int, latency: int, pagesize: int):
+        self.records = [{
+            'item': f"{i // 10 + 1}-{i % 10 + 1}",
+            'price': (i % 7) + 1 + (0.5 if i % 5 == 0 else 0),
+            'qty': '',
+            'amt': ''
+        } for i in range(rows)]
+        self.latency = latency
+        self.pagesize = pagesize
+        self.page = 1
+        self.saved = 0
+        self.viewstate = None
+        self.event_validation = None
+    
+    @property
+    def page_count(self) -> int:
+        if self.pagesize <= 0:
+            return 1
+        return max(1, -(-len(self.records) // self.pagesize))
+    
+    def page_rows(self) -> range:
+        """目前頁面上的資料在 records 中的位置"""
+        if self.pagesize <= 0:
+            return range(len(self.records))
+        first = (self.page - 1) * self.pagesize
+        return range(first, min(len(self.records), first + self.pagesize))
+    
+    def apply_postback(self, form: dict) -> bool:
+        """
+        套用一次 postback 的欄位值與事件
+        
+        Returns:
+            viewstate 與 event validation 有效返回 True
+        """
+        if (form.get('__VIEWSTATE') != self.viewstate
+                or form.get('__EVENTVALIDATION') != self.event_validation):
+            return False
+        
+        for row, n in enumerate(self.page_rows()):
+            record = self.records[n]
+            record['qty'] = form.get(f'gvReceive$ctl{row + 2:02d}$txtRecvQty', record['qty'])
+            record['amt'] = form.get(f'gvReceive$ctl{row + 2:02d}$txtRecvAmt', record['amt'])
+        
+        argument = form.get('__EVENTARGUMENT', '')
+        if form.get('__EVENTTARGET') == 'gvReceive' and argument.startswith('Page$'):
+            self.page = min(max(1, int(argument[5:])), self.page_count)
+        if 'btnSave' in form:
+            self.saved += 1
+        return True
+    
+    def render(self, action: str) -> str:
+        """產生目前狀態的頁面，並發出新的 viewstate"""
+        self.viewstate = secrets.token_urlsafe(24)
+        self.event_validation = secrets.token_urlsafe(12)
+        
+        rows = ['<tr><th scope="col">項次</th><th scope="col">單價</th>'
+                '<th scope="col">數量</th><th scope="col">複價</th></tr>']
+        for row, n in enumerate(self.page_rows()):
+            record = self.records[n]
+            name = f'gvReceive$ctl{row + 2:02d}'
+            rows.append(
+                f'<tr><td><span id="gvReceive_lblItem_{row}">{record["item"]}</span></td>'
+                f'<td>{record["price"]}</td>'
+                f'<td><input name="{name}$txtRecvQty" type="text" value="{html.escape(record["qty"])}"'
+                f' id="gvReceive_txtRecvQty_{row}" /></td>'
+                f'<td><input name="{name}$txtRecvAmt" type="text" value="{html.escape(record["amt"])}"'
+                f' onchange="javascript:__doPostBack(&#39;{name}$txtRecvAmt&#39;,&#39;&#39;)"'
+                f' id="gvReceive_txtRecvAmt_{row}" /></td></tr>'
+            )
+        
+        if self.page_count > 1:
+            links = []
+            for page in range(1, self.page_count + 1):
+                if page == self.page:
+                    links.append(f'<td><span>{page}</span></td>')
+                else:
+                    links.append(f'<td><a href="javascript:__doPostBack(&#39;gvReceive&#39;,'
+                                 f'&#39;Page${page}&#39;)">{page}</a></td>')
+            rows.append(f'<tr class="pager"><td colspan="4"><table><tr>{"".join(links)}</tr></table></td></tr>')
+        
+        return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>PP_MRS_3010</title></head>
+<body>
+<form method="post" action="{html.escape(action)}" id="form1">
+<div class="aspNetHidden">
+<input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="" />
+<input type="hidden" name="__EVENTARGUMENT" id="__EVENTARGUMENT" value="" />
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{self.viewstate}" />
+</div>
+<div class="aspNetHidden">
+<input type="hidden" name="__VIEWSTATEGENERATOR" id="__VIEWSTATEGENERATOR" value="5A7B1E3C" />
+<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="{self.event_validation}" />
+</div>
+<select name="ddlWarehouse" id="ddlWarehouse">
+<option value="A1">A1 倉</option>
+<option selected="selected" value="B2">B2 倉</option>
+</select>
+<table id="gvReceive">
+<tr><th>項次</th><th>單價</th><th>數量</th><th>複價</th></tr>
+{chr(10).join(rows)}
+</table>
+<input type="submit" name="btnSave" value="儲存" id="btnSave" />
+</form>
+</body>
+</html>
+"""
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """
+    提供 fixtures 目錄的靜態檔案，以及 /PP_MRS_3010.aspx 的伺服器端表單
+    
+    不輸出每個請求的記錄。
+    """
+    
+    # 標頭與內容分兩次寫出，關閉 Nagle 演算法避免每個回應多等一次延遲 ACK
+    disable_nagle_algorithm = True
+    sessions = {}
+    logins = set()
+    lock = threading.Lock()
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _cookies(self) -> dict:
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        return {name: morsel.value for name, morsel in cookie.items()}
+    
+    def _send_html(self, status: int, body: str, cookies: dict = None):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (cookies or {}).items():
+            self.send_header('Set-Cookie', f'{name}={value}; path=/; HttpOnly')
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def _redirect_to_login(self):
+        self.send_response(302)
+        self.send_header('Location', f'/Login.aspx?ReturnUrl={quote(self.path, safe="")}')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/Login.aspx':
+            token = secrets.token_hex(16)
+            with self.lock:
+                self.logins.add(token)
+            self._send_html(200, '<html><body>已登入</body></html>', {'.ASPXAUTH': token})
+            return
+        if url.path != '/PP_MRS_3010.aspx':
+            super().do_GET()
+            return
+        
+        cookies = self._cookies()
+        if cookies.get('.ASPXAUTH') not in self.logins:
+            self._redirect_to_login()
+            return
+        
+        query = parse_qs(url.query)
+        with self.lock:
+            session_id = cookies.get('ASP.NET_SessionId')
+            issued = {}
+            if session_id not in self.sessions:
+                session_id = secrets.token_hex(12)
+                issued['ASP.NET_SessionId'] = session_id
+                self.sessions[session_id] = _ReceivingSession(
+                    rows=int(query.get('rows', ['100'])[0]),
+                    latency=int(query.get('latency', ['200'])[0]),
+                    pagesize=int(query.get('pagesize', ['0'])[0])
+                )
+            body = self.sessions[session_id].render(self.path)
+        self._send_html(200, body, issued)
+    
+    def do_POST(self):
+        url = urlsplit(self.path)
+        cookies = self._cookies()
+        length = int(self.headers.get('Content-Length', 0))
+        form = {name: values[-1] for name, values in
+                parse_qs(self.rfile.read(length).decode('utf-8'), keep_blank_values=True).items()}
+        
+        session = self.sessions.get(cookies.get('ASP.NET_SessionId'))
+        if url.path != '/PP_MRS_3010.aspx' or session is None \
+                or cookies.get('.ASPXAUTH') not in self.logins:
+            self._redirect_to_login()
+            return
+        
+        time.sleep(session.latency / 1000)
+        with self.lock:
+            if not session.apply_postback(form):
+                self._send_html(500, '<html><body>Validation of viewstate MAC failed.</body></html>')
+                return
+            body = session.render(self.path)
+        self._send_html(200, body)
+
+
+def start_server(port: int = 0):
+    """
+    在背景執行緒啟動模擬伺服器
+    
+    Args:
+        port: 連接埠，0 表示自動選擇
+    
+    Returns:
+        (伺服器物件, 根網址)
+    """
+    handler = partial(_QuietHandler, directory=str(FIXTURES_DIR))
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def page_url(base_url: str, rows: int, latency: int = 200, pagesize: int = 0,
+             rerender: bool = True) -> str:
+    """組合模擬頁面的網址"""
+    query = urlencode({'rows': rows, 'latency': latency, 'pagesize': pagesize,
+                       'rerender': int(rerender)})
+    return f"{base_url}/pp_mrs_3010.html?{query}"
+
+
+def form_url(base_url: str, rows: int, latency: int = 200, pagesize: int = 0) -> str:
+    """組合伺服器端表單（/PP_MRS_3010.aspx）的網址"""
+    query = urlencode({'rows': rows, 'latency': latency, 'pagesize': pagesize})
+    return f"{base_url}/PP_MRS_3010.aspx?{query}"
+
+
+def login_cookies(base_url: str) -> list:
+    """
+    登入模擬伺服器，取得瀏覽器格式（與 WebFormFiller.get_cookies 相同）的登入 cookies
+    
+    Returns:
+        cookie 字典列表
+    """
+    import requests
+    
+    response = requests.get(f"{base_url}/Login.aspx", timeout=10)
+    host = urlsplit(base_url).hostname
+    return [{'name': cookie.name, 'value': cookie.value, 'domain': host, 'path': cookie.path}
+            for cookie in response.cookies]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="啟動 PP_MRS_3010 本機模擬伺服器")
+    parser.add_argument("--port", type=int, default=8000, help="連接埠")
+    args = parser.parse_args()
+    
+    server, base_url = start_server(args.port)
+    print(f"✓ 模擬伺服器已啟動: {page_url(base_url, rows=100)}")
+    print(f"  伺服器端表單: {form_url(base_url, rows=100)}（先開啟 {base_url}/Login.aspx 登入）")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,22 @@ OUTPUT_DIR = Path("C:\\Users\\03010430\\Documents")
 # 已處理的資料檔案路徑（如果有現成的處理後資料）
 PROCESSED_FILE_PATH = Path("C:\\Users\\03010430\\Documents\\processed_data_20251206_032835.xlsx")
 
+# 處理後資料的快取目錄（來源檔案內容改變時自動失效）
+CACHE_DIR = OUTPUT_DIR / ".mrs_cache"
+
+# 填寫日誌目錄（每個來源工作表一個日誌，記錄已完成的項次，中斷後重新執行時略過）
+JOURNAL_DIR = OUTPUT_DIR / "fill_journals"
+
+# ============ 瀏覽器設定 ============
+# 連接已登入的 Chrome（以 chrome.exe --remote-debugging-port=9222 啟動），None 表示啟動新的瀏覽器
+CHROME_DEBUGGER_ADDRESS = None  # 例如 "127.0.0.1:9222"
+
+# Chrome 使用者資料目錄，保留登入狀態供下次執行使用，None 表示每次使用全新設定檔
+CHROME_USER_DATA_DIR = None  # 例如 OUTPUT_DIR / "chrome_profile"
+
+# 收料頁面的儲存按鈕 id（平行填寫時各工作者以此按鈕儲存，請以實際頁面確認）
+SAVE_BUTTON_ID = "btnSave"
+
 # ============ 其他設定 ============
 # 預設工作表索引或名稱
 DEFAULT_SHEET_INDEX = 2  # 第三個工作表
@@ -26,3 +42,11 @@ COLUMN_RENAME_MAP = {
     1: '數量',  # 第二欄
     2: '複價'   # 第三欄
 }
+
+# ============ 清理規則 ============
+# 必須有值的欄位（COLUMNS_TO_READ 中的位置），該欄空白的列會被刪除
+REQUIRED_COLUMN = 1  # T 欄（數量）
+
+# 刪除空白列後，再刪除的開頭列數（表頭說明）與結尾列數（合計列）
+HEAD_ROWS_TO_DROP = 2
+TAIL_ROWS_TO_DROP = 1
@@ -0,0 +1,185 @@
+"""批次處理 - 平行解析多個廠商計價工作簿並彙整輸出
+
+用法:
+    python src/batch_main.py <目錄或萬用字元> [--output-dir 目錄] [--workers N]
+
+例如:
+    python src/batch_main.py "C:\\計價\\第10期\\*.xls" --workers 4
+"""
+
+import argparse
+import glob
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+# 將專案根目錄加入路徑以便導入 config
+sys.path.append(str(Path(__file__).parent.parent))
+from config import OUTPUT_DIR, DEFAULT_SHEET_INDEX, COLUMNS_TO_READ, COLUMN_RENAME_MAP
+
+
+def find_workbooks(source: str) -> list:
+    """
+    依目錄或萬用字元找出要處理的工作簿
+    
+    Args:
+        source: 目錄路徑（處理其中所有 .xls/.xlsx）或萬用字元（如 "*.xls"）
+    
+    Returns:
+        排序後的檔案路徑列表（略過 Excel 開啟中產生的 ~$ 暫存檔）
+    """
+    path = Path(source)
+    if path.is_dir():
+        candidates = [p for p in path.iterdir() if p.suffix.lower() in ('.xls', '.xlsx')]
+    else:
+        candidates = [Path(p) for p in glob.glob(source)]
+    return sorted(p for p in candidates if not p.name.startswith('~$'))
+
+
+def output_names(files: list) -> dict:
+    """
+    決定各工作簿處理結果的輸出檔名
+    
+    檔名為「原檔名_processed.xlsx」；不同目錄中有相同檔名（stem）的工作簿時，
+    這些檔案的輸出檔名前加上在輸入列表中的序號，避免互相覆蓋。
+    
+    Args:
+        files: 工作簿路徑列表
+    
+    Returns:
+        工作簿路徑 → 輸出檔名的字典
+    """
+    counts = Counter(path.stem for path in files)
+    return {
+        path: (f"{index:03d}_{path.stem}_processed.xlsx" if counts[path.stem] > 1
+               else f"{path.stem}_processed.xlsx")
+        for index, path in enumerate(files, start=1)
+    }
+
+
+def process_workbook(file_path: Path, sheet_index: int, usecols: str, rename_map: dict) -> dict:
+    """
+    在工作程序中讀取並清理單一工作簿
+    
+    Returns:
+        包含 path、data（DataFrame 或 None）、elapsed 與 error 的字典
+    """
+    from data_pipeline import load_material_data
+    
+    started = time.perf_counter()
+    try:
+        data = load_material_data(file_path, sheet_index, usecols, rename_map)
+        error = None
+    except Exception as e:
+        data = None
+        error = f"{type(e).__name__}: {e}"
+    
+    return {
+        'path': file_path,
+        'data': data,
+        'elapsed': time.perf_counter() - started,
+        'error': error
+    }
+
+
+def run_batch(files: list, output_dir: Path, workers: int = None,
+              sheet_index: int = DEFAULT_SHEET_INDEX, usecols: str = COLUMNS_TO_READ,
+              rename_map: dict = COLUMN_RENAME_MAP) -> list:
+    """
+    以多個程序平行處理工作簿，輸出各檔案結果與彙整檔
+    
+    單一檔案失敗不會中斷整個批次，錯誤會記錄在報告中。工作程序異常結束時
+    （BrokenProcessPool），尚未完成的檔案都會記為失敗，已完成的結果照常輸出。
+    
+    Args:
+        files: 工作簿路徑列表
+        output_dir: 輸出目錄
+        workers: 程序數量，None 表示使用 CPU 核心數
+        sheet_index: 工作表索引
+        usecols: 要讀取的欄位
+        rename_map: 欄位重新命名對應
+    
+    Returns:
+        每個檔案一筆的報告列表（path、output、rows、elapsed、error）
+    """
+    import pandas as pd
+    from main import save_to_excel
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    batch_dir = Path(output_dir) / f"batch_{timestamp}"
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(process_workbook, path, sheet_index, usecols, rename_map): path
+                   for path in files}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # 工作程序異常結束（例如 BrokenProcessPool）或結果無法傳回時，記錄後繼續
+                result = {'path': futures[future], 'data': None, 'elapsed': 0.0,
+                          'error': f"{type(e).__name__}: {e}"}
+            status = f"✓ {len(result['data'])} 筆" if result['error'] is None else f"✗ {result['error']}"
+            print(f"{result['path'].name}: {status}（{result['elapsed']:.2f} 秒）")
+            results.append(result)
+    
+    # 依輸入順序輸出，使彙整檔的內容順序固定
+    results.sort(key=lambda result: files.index(result['path']))
+    
+    names = output_names(files)
+    frames = []
+    for result in results:
+        if result['data'] is None:
+            continue
+        save_to_excel(result['data'], batch_dir / names[result['path']], sheet_name='處理後資料')
+        frames.append(result['data'].assign(來源檔案=result['path'].name))
+    
+    if frames:
+        save_to_excel(pd.concat(frames, ignore_index=True), batch_dir / "consolidated.xlsx",
+                      sheet_name='彙整資料')
+    
+    report = [{
+        'path': str(result['path']),
+        'output': '' if result['data'] is None else names[result['path']],
+        'rows': 0 if result['data'] is None else len(result['data']),
+        'elapsed': round(result['elapsed'], 3),
+        'error': result['error'] or ''
+    } for result in results]
+    if report:
+        save_to_excel(pd.DataFrame(report), batch_dir / "batch_report.xlsx", sheet_name='處理報告')
+    
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="平行處理多個計價工作簿")
+    parser.add_argument("source", help="工作簿所在目錄，或萬用字元（如 \"*.xls\"）")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR, help="輸出目錄")
+    parser.add_argument("--workers", type=int, default=None, help="程序數量（預設為 CPU 核心數）")
+    args = parser.parse_args()
+    
+    files = find_workbooks(args.source)
+    if not files:
+        print(f"✗ 找不到任何工作簿: {args.source}")
+        return
+    
+    print("=" * 50)
+    print(f"批次處理 {len(files)} 個工作簿")
+    print("=" * 50)
+    
+    started = time.perf_counter()
+    report = run_batch(files, args.output_dir, workers=args.workers)
+    
+    failed = [entry for entry in report if entry['error']]
+    print("\n" + "=" * 50)
+    print(f"完成: 成功 {len(report) - len(failed)} 個，失敗 {len(failed)} 個，"
+          f"共 {sum(entry['rows'] for entry in report)} 筆，耗時 {time.perf_counter() - started:.2f} 秒")
+    for entry in failed:
+        print(f"  - {Path(entry['path']).name}: {entry['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+"""資料處理流程模組 - 項次正規化與排序、數值前處理"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+
+
+def normalize_item(value) -> str:
+    """
+    正規化項次文字，作為網頁與 Excel 項次比對的鍵
+    
+    Args:
+        value: 項次值（例如 "2-1"、" 3 " 或 Excel 讀入的 3.0）
+    
+    Returns:
+        去除空白後的項次字串
+    """
+    text = str(value).strip().replace(' ', '')
+    # Excel 單層項次可能被讀成浮點數（3.0）
+    if text.endswith('.0') and text[:-2].isdigit():
+        text = text[:-2]
+    return text
+
+
+def normalize_items(items: pd.Series) -> pd.Series:
+    """
+    以向量化方式正規化整欄項次，規則與 normalize_item 相同
+    
+    Args:
+        items: 項次欄位
+    
+    Returns:
+        正規化後的項次字串欄位（空值保留為 NaN）
+    """
+    text = items.astype('string').str.replace(r'\s+', '', regex=True)
+    text = text.str.replace(r'^(\d+)\.0$', r'\1', regex=True)
+    return text.astype(object).where(items.notna(), np.nan)
+
+
+def to_numeric_text(values: pd.Series) -> pd.Series:
+    """
+    將網頁欄位文字或試算表的值轉換為數字（忽略千分位逗號與空白）
+    
+    Args:
+        values: 文字或數字欄位
+    
+    Returns:
+        float64 欄位，無法解析或空白時為 NaN
+    """
+    text = values.astype('string').str.replace(',', '', regex=False).str.strip()
+    return pd.to_numeric(text, errors='coerce').astype(np.float64)
+
+
+def parse_item_keys(items: pd.Series) -> pd.DataFrame:
+    """
+    將項次（例如 "3"、"2-1"、"2-1-4"）拆解為整數排序鍵
+    
+    以單一 str.extract 完成解析，層數依資料中最深的項次決定。
+    較淺的項次在缺少的層級填入 -1，因此 "3" 會排在 "3-1" 之前。
+    
+    Args:
+        items: 項次欄位
+    
+    Returns:
+        每層一欄（key1、key2、...）的 int64 DataFrame，與 items 相同的索引；
+        無法解析的項次（例如「合計」或空值）所有層級皆為 -1，並在 valid 欄標記為 False
+    """
+    text = normalize_items(items)
+    depth = int(text.str.count('-').max()) + 1 if text.notna().any() else 1
+    
+    pattern = r'^(\d+)' + r'(?:-(\d+))?' * (depth - 1) + r'$'
+    keys = text.str.extract(pattern)
+    keys.columns = [f'key{level + 1}' for level in range(depth)]
+    
+    valid = keys['key1'].notna()
+    keys = keys.apply(pd.to_numeric).fillna(-1).astype(np.int64)
+    keys['valid'] = valid
+    return keys
+
+
+def item_dtype(items: pd.Series) -> pd.CategoricalDtype:
+    """
+    建立依項次自然排序的有序類別型別
+    
+    Args:
+        items: 項次欄位
+    
+    Returns:
+        類別依自然排序排列的 CategoricalDtype，可供後續查找重複使用
+    """
+    unique = pd.Series(normalize_items(items).dropna().unique())
+    keys = parse_item_keys(unique)
+    order = _natural_order(keys)
+    return pd.CategoricalDtype(categories=unique.take(order).tolist(), ordered=True)
+
+
+def _natural_order(keys: pd.DataFrame) -> np.ndarray:
+    """依 parse_item_keys 的結果計算自然排序的位置（無法解析的項次排在最後）"""
+    columns = [keys[column].to_numpy() for column in keys.columns if column != 'valid']
+    # np.lexsort 以最後一個鍵為主要排序鍵
+    return np.lexsort(columns[::-1] + [~keys['valid'].to_numpy()])
+
+
+def sort_by_item(df: pd.DataFrame, column: str = '項次', categorical: bool = False,
+                 dtype: Optional[pd.CategoricalDtype] = None) -> pd.DataFrame:
+    """
+    依項次自然排序 DataFrame（支援任意層數，例如 "3"、"2-1"、"2-1-4"）
+    
+    Args:
+        df: 包含項次欄位的 DataFrame
+        column: 項次欄位名稱
+        categorical: 是否將項次欄位轉換為正規化後的有序類別型別
+        dtype: 已建立的項次類別型別（categorical 為 True 時使用，None 表示依資料建立）
+    
+    Returns:
+        排序後並重置索引的 DataFrame
+    """
+    keys = parse_item_keys(df[column])
+    df = df.take(_natural_order(keys)).reset_index(drop=True)
+    
+    if categorical:
+        if dtype is None:
+            dtype = item_dtype(df[column])
+        df[column] = normalize_items(df[column]).astype(dtype)
+    
+    return df
+
+
+class CleaningSpec:
+    """
+    計價工作表的清理規格
+    
+    描述要讀取的欄位、必須有值的欄位、要刪除的開頭與結尾列數及欄位名稱。
+    read() 把欄位選取與列篩選交給 ExcelReader.read_sheet_filtered 在讀取時完成；
+    clean() 對已讀入的 DataFrame 以一次遮罩與 take 完成相同的清理。
+    """
+    
+    def __init__(self, usecols: str = "C,T,U", rename_map: Optional[dict] = None,
+                 required_column: int = 1, head_rows: int = 2, tail_rows: int = 1,
+                 skiprows=None, nrows: Optional[int] = None):
+        """
+        初始化 CleaningSpec
+        
+        Args:
+            usecols: 要讀取的欄位（Excel 欄位字母）
+            rename_map: 欄位位置 → 欄位名稱的對應，None 表示「項次」、「數量」、「複價」
+            required_column: 必須有值的欄位位置，該欄為空值的列會被刪除
+            head_rows: 刪除空值列後，再刪除的開頭列數（表頭說明）
+            tail_rows: 刪除空值列後，再刪除的結尾列數（合計列）
+            skiprows: 讀取時跳過的工作表列數或列號列表（在標題列之前套用）
+            nrows: 讀取時最多讀取的資料列數，None 表示讀到最後
+        """
+        self.usecols = usecols
+        self.rename_map = rename_map if rename_map is not None else {0: '項次', 1: '數量', 2: '複價'}
+        self.required_column = required_column
+        self.head_rows = head_rows
+        self.tail_rows = tail_rows
+        self.skiprows = skiprows
+        self.nrows = nrows
+    
+    @classmethod
+    def from_config(cls, **overrides) -> 'CleaningSpec':
+        """
+        依 config.py 的欄位與清理規則建立規格
+        
+        Args:
+            **overrides: 要取代 config 設定的參數（與 __init__ 相同），值為 None 時沿用 config
+        """
+        import config
+        
+        options = {
+            'usecols': config.COLUMNS_TO_READ,
+            'rename_map': config.COLUMN_RENAME_MAP,
+            'required_column': config.REQUIRED_COLUMN,
+            'head_rows': config.HEAD_ROWS_TO_DROP,
+            'tail_rows': config.TAIL_ROWS_TO_DROP
+        }
+        options.update({name: value for name, value in overrides.items() if value is not None})
+        return cls(**options)
+    
+    def cache_params(self) -> dict:
+        """
+        影響清理結果的所有設定，作為 ProcessedDataCache 快取鍵的參數
+        
+        清理規則改變時快取鍵隨之改變，不會載入以舊規則產生的資料。
+        """
+        return {
+            'usecols': self.usecols,
+            'rename_map': self.rename_map,
+            'required_column': self.required_column,
+            'head_rows': self.head_rows,
+            'tail_rows': self.tail_rows,
+            'skiprows': self.skiprows,
+            'nrows': self.nrows
+        }
+    
+    def _finish(self, df: pd.DataFrame) -> pd.DataFrame:
+        """重新命名欄位並依項次排序"""
+        df.columns = [self.rename_map[i] for i in range(len(df.columns))]
+        return sort_by_item(df)
+    
+    def read(self, reader, sheet) -> pd.DataFrame:
+        """
+        以單次串流讀取工作表並完成清理
+        
+        Args:
+            reader: ExcelReader 實例
+            sheet: 工作表名稱或索引
+        
+        Returns:
+            清理並排序後的 DataFrame
+        """
+        df = reader.read_sheet_filtered(sheet, self.usecols, skiprows=self.skiprows, nrows=self.nrows,
+                                        required=self.required_column,
+                                        drop_head=self.head_rows, drop_tail=self.tail_rows)
+        return self._finish(df)
+    
+    def clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        清理已以 usecols 讀入的 DataFrame
+        
+        Args:
+            df: 以 usecols 讀取的原始 DataFrame
+        
+        Returns:
+            清理並排序後的 DataFrame
+        """
+        keep = np.flatnonzero(df.iloc[:, self.required_column].notna().to_numpy())
+        keep = keep[self.head_rows:len(keep) - self.tail_rows]
+        return self._finish(df.take(keep))
+
+
+def clean_material_sheet(df: pd.DataFrame, rename_map: dict) -> pd.DataFrame:
+    """
+    清理計價工作表的 C、T、U 欄資料
+    
+    刪除數量（第二欄）為空值的列、前兩列與最後一列（表頭說明與合計），
+    依 rename_map 重新命名欄位後依項次自然排序。
+    
+    Args:
+        df: 以 usecols 讀取的原始 DataFrame
+        rename_map: 欄位位置 → 欄位名稱的對應
+    
+    Returns:
+        清理並排序後的 DataFrame
+    """
+    return CleaningSpec(rename_map=rename_map).clean(df)
+
+
+def load_material_data(file_path, sheet_index: int, usecols: str, rename_map: dict,
+                       cache=None, required_column: Optional[int] = None,
+                       head_rows: Optional[int] = None, tail_rows: Optional[int] = None) -> pd.DataFrame:
+    """
+    讀取並清理計價工作表，提供快取時優先從快取載入
+    
+    欄位選取與列篩選在讀取時完成（CleaningSpec.read），不先建立整張工作表的 DataFrame。
+    清理規則未指定時使用 config.py 的 REQUIRED_COLUMN、HEAD_ROWS_TO_DROP 與
+    TAIL_ROWS_TO_DROP，與 main.py 相同。
+    
+    Args:
+        file_path: 來源 Excel 檔案路徑
+        sheet_index: 工作表索引
+        usecols: 要讀取的欄位（Excel 欄位字母）
+        rename_map: 欄位位置 → 欄位名稱的對應
+        cache: ProcessedDataCache 實例，None 表示不使用快取
+        required_column: 必須有值的欄位位置，None 表示使用 config
+        head_rows: 刪除的開頭列數，None 表示使用 config
+        tail_rows: 刪除的結尾列數，None 表示使用 config
+    
+    Returns:
+        清理並排序後的 DataFrame
+    """
+    from excel_reader import ExcelReader
+    
+    spec = CleaningSpec.from_config(usecols=usecols, rename_map=rename_map,
+                                    required_column=required_column,
+                                    head_rows=head_rows, tail_rows=tail_rows)
+    
+    def build():
+        with ExcelReader(file_path) as reader:
+            return spec.read(reader, sheet_index)
+    
+    if cache is None:
+        return build()
+    
+    return cache.load_or_build(file_path, sheet_index, build, **spec.cache_params())
+
+
+def prepare_fill_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    填寫前的資料準備：一次把數量與複價轉換為數字，並預先算好要輸入的文字
+    
+    在啟動瀏覽器操作之前就找出無法轉換的列，填寫迴圈只需逐列讀取現成的值。
+    
+    Args:
+        df: 包含「項次」、「數量」、「複價」欄位的 DataFrame
+    
+    Returns:
+        (可填寫的資料, 無法轉換的列)。可填寫的資料包含正規化的「項次」、
+        float64 的「數量」與「複價」，以及要輸入的整數文字 qty_text、amt_text；
+        兩者皆保留 df 原本的索引
+    """
+    quantity = to_numeric_text(df['數量'])
+    amount = to_numeric_text(df['複價'])
+    valid = np.isfinite(quantity) & np.isfinite(amount)
+    
+    prepared = pd.DataFrame({
+        '項次': normalize_items(df['項次']),
+        '數量': quantity,
+        '複價': amount
+    }, index=df.index)[valid]
+    
+    # 與 int() 相同，向零截斷
+    prepared['qty_text'] = prepared['數量'].astype(np.int64).astype(str)
+    prepared['amt_text'] = prepared['複價'].astype(np.int64).astype(str)
+    
+    return prepared, df[~valid]
+
+
+def downcast_numeric(values: pd.Series) -> pd.Series:
+    """
+    依數值範圍選擇最小的數字型別
+    
+    全為整數時使用能容納範圍的最小整數型別（int8 ~ int64）；含小數時，
+    若 float32 能精確保留到小數第二位則使用 float32，否則保留 float64。
+    
+    Args:
+        values: 數字或數字文字欄位
+    
+    Returns:
+        縮減型別後的欄位
+    """
+    numeric = to_numeric_text(values)
+    finite = numeric.dropna()
+    
+    if len(finite) == len(numeric) and (finite == np.trunc(finite)).all():
+        return pd.to_numeric(numeric.astype(np.int64), downcast='integer')
+    
+    as_float32 = numeric.astype(np.float32)
+    if np.allclose(as_float32.astype(np.float64), numeric, rtol=0, atol=0.005, equal_nan=True):
+        return as_float32
+    return numeric
+
+
+def compact_material_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    將清理後的資料轉換為精簡的記憶體表示
+    
+    項次轉為依自然排序的有序類別，數量與複價依數值範圍縮減型別。
+    
+    Args:
+        df: 包含「項次」、「數量」、「複價」欄位的 DataFrame
+    
+    Returns:
+        精簡後的 DataFrame（新物件，不修改 df）
+    """
+    compact = df.copy()
+    compact['項次'] = normalize_items(df['項次']).astype(item_dtype(df['項次']))
+    for column in ('數量', '複價'):
+        compact[column] = downcast_numeric(df[column])
+    return compact
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    比較兩個 DataFrame 各欄位的型別與記憶體用量
+    
+    Args:
+        before: 原始 DataFrame
+        after: 精簡後的 DataFrame
+    
+    Returns:
+        每欄一列（含「合計」列），欄位為原始型別、原始大小、精簡型別、精簡大小（位元組）與縮減比例
+    """
+    before_bytes = before.memory_usage(index=False, deep=True)
+    after_bytes = after.memory_usage(index=False, deep=True)
+    
+    report = pd.DataFrame({
+        '原始型別': before.dtypes.astype(str),
+        '原始大小': before_bytes,
+        '精簡型別': after.dtypes.astype(str),
+        '精簡大小': after_bytes
+    })
+    report.loc['合計'] = ['', before_bytes.sum(), '', after_bytes.sum()]
+    report['縮減比例'] = 1 - report['精簡大小'] / report['原始大小']
+    report.index.name = '欄位'
+    return report
@@ -1,15 +1,26 @@
 """範例：使用 WebFormFiller 自動填寫網頁表單"""
 
-from excel_reader import ExcelReader
+from data_pipeline import load_material_data
+from processed_cache import ProcessedDataCache
+from fill_journal import FillJournal
 from web_form_filler import WebFormFiller, fill_web_form_from_dataframe
+from http_form_filler import HttpFormFiller
+from parallel_filler import fill_in_parallel
+from pipelined_runner import BackgroundBrowser
 from pathlib import Path
 import pandas as pd
 from datetime import datetime
+import logging
 import sys
 
 # 將專案根目錄加入路徑以便導入 config
 sys.path.append(str(Path(__file__).parent.parent))
-from config import INPUT_FILE_PATH, DEFAULT_SHEET_INDEX, COLUMNS_TO_READ, COLUMN_RENAME_MAP, PROCESSED_FILE_PATH
+from config import INPUT_FILE_PATH, DEFAULT_SHEET_INDEX, COLUMNS_TO_READ, COLUMN_RENAME_MAP, PROCESSED_FILE_PATH, CACHE_DIR, OUTPUT_DIR, JOURNAL_DIR
+from config import CHROME_DEBUGGER_ADDRESS, CHROME_USER_DATA_DIR, SAVE_BUTTON_ID
+
+# 顯示 DEBUG 記錄的本專案模組
+PROJECT_LOGGERS = ('web_form_filler', 'http_form_filler', 'parallel_filler', 'pipelined_runner',
+                   'processed_cache')
 
 
 def example_basic_usage():
@@ -23,31 +34,13 @@ def example_basic_usage():
     # 從 config.py 讀取檔案路徑
     file_path = INPUT_FILE_PATH
     
-    with ExcelReader(file_path) as reader:
-        sheet_names = reader.get_sheet_names()
-        sheet_name = sheet_names[DEFAULT_SHEET_INDEX]  # 從 config 讀取工作表索引
-        
-        # 從 config 讀取要處理的欄位
-        df = reader.read_sheet(sheet_name, usecols=COLUMNS_TO_READ)
-        
-        # 資料處理
-        df = df.dropna(subset=[df.columns[1]])  # 刪除 T 欄空值
-        df = df.iloc[2:]  # 刪除前兩列
-        df = df.iloc[:-1]  # 刪除最後一列
-        
-        # 從 config 讀取欄位名稱對應
-        df.columns = [COLUMN_RENAME_MAP[i] for i in range(len(df.columns))]
-        
-        # 排序
-        df['sort_key1'] = df['項次'].astype(str).str.split('-').str[0].astype(float)
-        df['sort_key2'] = df['項次'].astype(str).str.split('-').str[1].astype(float)
-        df = df.sort_values(by=['sort_key1', 'sort_key2'])
-        df = df.drop(columns=['sort_key1', 'sort_key2'])
-        df = df.reset_index(drop=True)
-        
-        print(f"✓ 已載入 {len(df)} 筆資料")
-        print("\n前 5 筆資料:")
-        print(df.head())
+    # 讀取並清理資料（來源檔案未變更時直接從快取載入）
+    df = load_material_data(file_path, DEFAULT_SHEET_INDEX, COLUMNS_TO_READ, COLUMN_RENAME_MAP,
+                            cache=ProcessedDataCache(CACHE_DIR))
+    
+    print(f"✓ 已載入 {len(df)} 筆資料")
+    print("\n前 5 筆資料:")
+    print(df.head())
     
     # 2. 填寫網頁表單
     print("\n" + "=" * 50)
@@ -81,98 +74,110 @@ def example_manual_control():
     
     data_choice = input("\n請選擇資料來源 (1/2): ").strip()
     
+    if data_choice not in ("1", "2"):
+        print("無效的選項")
+        return
+    
+    if data_choice == "2" and not PROCESSED_FILE_PATH.exists():
+        print(f"✗ 檔案不存在: {PROCESSED_FILE_PATH}")
+        print("提示: 請在 config.py 中設定正確的 PROCESSED_FILE_PATH")
+        return
+    
+    # 建立 WebFormFiller 實例（config 設定時連接已登入的瀏覽器或沿用使用者資料目錄）
+    filler = WebFormFiller(headless=False,
+                           debugger_address=CHROME_DEBUGGER_ADDRESS,
+                           user_data_dir=CHROME_USER_DATA_DIR)
+    
+    # 在背景啟動瀏覽器並開啟網頁，同時在這裡讀取 Excel；可在讀取期間先登入
+    url = "https://ctcieip.ctci.com/pp_mrs/PP_MRS_3010.aspx?ParentAPPL=F:$VSTS02_CCC$PMS$&HostUrl=ctcieip.ctci.com"
+    browser = BackgroundBrowser(filler, url, wait_time=10)
+    
+    try:
+        run_manual_fill(browser, data_choice)
+    finally:
+        # 關閉瀏覽器
+        browser.close()
+
+
+def run_manual_fill(browser: BackgroundBrowser, data_choice: str):
+    """手動控制範例：讀取資料、等待瀏覽器就緒後填寫"""
+    
     if data_choice == "1":
         # 未處理資料路徑 - 從原始 Excel 讀取並處理
         print("\n讀取未處理的資料...")
         file_path = INPUT_FILE_PATH
         
-        with ExcelReader(file_path) as reader:
-            sheet_names = reader.get_sheet_names()
-            sheet_name = sheet_names[DEFAULT_SHEET_INDEX]  # 從 config 讀取工作表索引
-            
-            # 從 config 讀取要處理的欄位
-            df = reader.read_sheet(sheet_name, usecols=COLUMNS_TO_READ)
-            
-            # 資料處理
-            df = df.dropna(subset=[df.columns[1]])  # 刪除 T 欄空值
-            df = df.iloc[2:]  # 刪除前兩列
-            df = df.iloc[:-1]  # 刪除最後一列
-            
-            # 從 config 讀取欄位名稱對應
-            df.columns = [COLUMN_RENAME_MAP[i] for i in range(len(df.columns))]
-            
-            # 排序
-            df['sort_key1'] = df['項次'].astype(str).str.split('-').str[0].astype(float)
-            df['sort_key2'] = df['項次'].astype(str).str.split('-').str[1].astype(float)
-            df = df.sort_values(by=['sort_key1', 'sort_key2'])
-            df = df.drop(columns=['sort_key1', 'sort_key2'])
-            df = df.reset_index(drop=True)
-            
-            print(f"✓ 已載入 {len(df)} 筆資料")
-            print("\n前 5 筆資料:")
-            print(df.head())
+        # 來源檔案未變更時直接從快取載入
+        df = load_material_data(file_path, DEFAULT_SHEET_INDEX, COLUMNS_TO_READ, COLUMN_RENAME_MAP,
+                                cache=ProcessedDataCache(CACHE_DIR))
+        journal = FillJournal.for_source(JOURNAL_DIR, file_path, DEFAULT_SHEET_INDEX)
+        
+        print(f"✓ 已載入 {len(df)} 筆資料")
+        print("\n前 5 筆資料:")
+        print(df.head())
     
     elif data_choice == "2":
         # 已處理資料路徑 - 直接從 config 讀取
         print("\n讀取已處理的資料...")
         processed_file_path = PROCESSED_FILE_PATH
         
-        if not processed_file_path.exists():
-            print(f"✗ 檔案不存在: {processed_file_path}")
-            print("提示: 請在 config.py 中設定正確的 PROCESSED_FILE_PATH")
-            return
-        
-        # 直接讀取為 DataFrame
-        df = pd.read_excel(processed_file_path)
+        # 讀取為 DataFrame（檔案未變更時直接從快取載入）
+        cache = ProcessedDataCache(CACHE_DIR)
+        df = cache.load_or_build(processed_file_path, 0, lambda: pd.read_excel(processed_file_path))
+        journal = FillJournal.for_source(JOURNAL_DIR, processed_file_path, 0)
         print(f"✓ 已從 {processed_file_path.name} 載入 {len(df)} 筆資料")
         print("\n前 5 筆資料:")
         print(df.head())
     
-    else:
-        print("無效的選項")
-        return
+    # 等待背景啟動的瀏覽器開啟網頁（通常在讀取 Excel 期間已完成）
+    filler = browser.wait()
     
-    # 建立 WebFormFiller 實例
-    filler = WebFormFiller(headless=False)
+    # 如果需要登入或其他操作，可以在這裡手動處理
+    # 連接已登入的瀏覽器或沿用使用者資料目錄時，通常不需要再登入
+    input("請確認已登入網站，完成後按 Enter 繼續...")
     
-    try:
-        # 啟動瀏覽器
-        filler.start_browser()
-        
-        # 開啟網頁
-        url = "https://ctcieip.ctci.com/pp_mrs/PP_MRS_3010.aspx?ParentAPPL=F:$VSTS02_CCC$PMS$&HostUrl=ctcieip.ctci.com"
-        filler.open_url(url, wait_time=10)
-        
-        # 如果需要登入或其他操作，可以在這裡手動處理
-        # 例如：
-        input("請手動登入網站，完成後按 Enter 繼續...")
-        
-        # 開始計時
-        start_time = datetime.now()
-        print(f"\n開始時間: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # 處理資料
-        results = filler.process_dataframe(df, delay=0.1)
-        
-        # 結束計時
-        end_time = datetime.now()
-        elapsed_time = end_time - start_time
-        print(f"\n結束時間: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"總耗時: {elapsed_time.total_seconds():.2f} 秒 ({elapsed_time})")
-        
-        # 在這裡可以做其他操作
-        # 例如點擊儲存按鈕等
-        # save_button = filler.driver.find_element(By.ID, "btnSave")
-        # save_button.click()
-        
-        print("\n處理結果:", results)
-        
-        # 讓瀏覽器保持開啟，方便檢查結果
-        input("\n按 Enter 關閉瀏覽器...")
-        
-    finally:
-        # 關閉瀏覽器
-        filler.close_browser()
+    # 開始計時
+    start_time = datetime.now()
+    print(f"\n開始時間: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    # 處理資料（中斷後重新執行時，依這個來源工作表的填寫日誌略過網頁上已完成的項次）
+    with journal:
+        # 依伺服器回應速度自動調整每筆之間的延遲，回應快時不再固定等待
+        results = filler.process_dataframe(df, delay=0.1, journal=journal, adaptive=True)
+    
+    # 結束計時
+    end_time = datetime.now()
+    elapsed_time = end_time - start_time
+    print(f"\n結束時間: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"總耗時: {elapsed_time.total_seconds():.2f} 秒 ({elapsed_time})")
+    
+    # 匯出每筆資料各階段的耗時，供分析時間花在哪裡
+    timing_path = OUTPUT_DIR / f"fill_timing_{start_time.strftime('%Y%m%d_%H%M%S')}.json"
+    filler.telemetry.to_json(timing_path)
+    print(f"✓ 耗時記錄已匯出至: {timing_path}")
+    
+    # 在這裡可以做其他操作
+    # 例如點擊儲存按鈕等
+    # save_button = filler.driver.find_element(By.ID, "btnSave")
+    # save_button.click()
+    
+    print("\n處理結果:", results)
+    
+    # 核對網頁上的數值是否與試算表一致，不一致的項次輸出為報告
+    report_path = OUTPUT_DIR / f"reconciliation_{start_time.strftime('%Y%m%d_%H%M%S')}.xlsx"
+    mismatches = filler.reconcile(df, report_path)
+    if mismatches.empty:
+        print("✓ 網頁上的數值與試算表一致")
+        # 全部填寫成功，不再需要續跑用的日誌
+        if not results['failed'] and not results['not_found']:
+            journal.clear()
+            print(f"✓ 已刪除填寫日誌: {journal.path}")
+    else:
+        print(f"✗ {len(mismatches)} 個項次不一致，詳見: {report_path}")
+        print(mismatches.head(20))
+    
+    # 讓瀏覽器保持開啟，方便檢查結果
+    input("\n按 Enter 關閉瀏覽器...")
 
 
 def example_with_login():
@@ -181,16 +186,7 @@ def example_with_login():
     # 讀取資料
     file_path = Path("C:\\Users\\YA\\Downloads\\16P2759A-M0008-003-伸泰-電線電纜(第10期次計價)-114.11.29複製.xls")
     
-    with ExcelReader(file_path) as reader:
-        sheet_name = reader.get_sheet_names()[2]
-        df = reader.read_sheet(sheet_name, usecols="C,T,U")
-        df = df.dropna(subset=[df.columns[1]]).iloc[2:-1]
-        df.columns = ['項次', '數量', '複價']
-        
-        # 排序
-        df['sort_key1'] = df['項次'].astype(str).str.split('-').str[0].astype(float)
-        df['sort_key2'] = df['項次'].astype(str).str.split('-').str[1].astype(float)
-        df = df.sort_values(by=['sort_key1', 'sort_key2']).drop(columns=['sort_key1', 'sort_key2']).reset_index(drop=True)
+    df = load_material_data(file_path, 2, "C,T,U", {0: '項次', 1: '數量', 2: '複價'})
     
     # 建立填寫器
     with WebFormFiller(headless=False) as filler:
@@ -213,7 +209,61 @@ def example_with_login():
         input("按 Enter 關閉瀏覽器...")
 
 
+def example_parallel(df: pd.DataFrame, workers: int = 3):
+    """平行填寫範例：先在一個瀏覽器登入，再把 cookies 分享給多個工作者"""
+    
+    url = "https://ctcieip.ctci.com/pp_mrs/PP_MRS_3010.aspx?ParentAPPL=F:$VSTS02_CCC$PMS$&HostUrl=ctcieip.ctci.com"
+    
+    # 在可見的瀏覽器中手動登入，取得驗證 cookies 與表格各項次所在的分頁
+    with WebFormFiller(headless=False) as login_filler:
+        login_filler.open_url(url, wait_time=10)
+        input("請手動登入網站，完成後按 Enter 繼續...")
+        cookies = login_filler.get_cookies()
+        grid = login_filler.scan_pages()
+    
+    # 依分頁分配給各工作者，每填完一頁就在該頁儲存，不會覆蓋其他工作者的分頁
+    results = fill_in_parallel(
+        df,
+        url=url,
+        workers=workers,
+        cookies=cookies,
+        headless=True,
+        delay=0.1,
+        save_button_id=SAVE_BUTTON_ID,
+        grid=grid
+    )
+    
+    print("\n處理結果:", results)
+
+
+def example_http(df: pd.DataFrame, save_button: str = None):
+    """HTTP 填寫範例：在瀏覽器登入後，改以 HTTP postback 填寫，不再操作瀏覽器"""
+    
+    url = "https://ctcieip.ctci.com/pp_mrs/PP_MRS_3010.aspx?ParentAPPL=F:$VSTS02_CCC$PMS$&HostUrl=ctcieip.ctci.com"
+    
+    # 在可見的瀏覽器中手動登入，沿用其 cookies 與 User-Agent
+    with WebFormFiller(headless=False) as login_filler:
+        login_filler.open_url(url, wait_time=10)
+        input("請手動登入網站並開啟收料頁面，完成後按 Enter 繼續...")
+        http_filler = HttpFormFiller.from_browser(login_filler)
+    
+    with http_filler:
+        results = http_filler.process_dataframe(df, delay=0.0, batch_size=50)
+        http_filler.reconcile(df)
+        
+        # 填入的值只存在這個 HTTP 工作階段，須按下頁面上的儲存按鈕（填入按鈕的 name 屬性）
+        if save_button:
+            http_filler.submit(save_button)
+    
+    print("\n處理結果:", results)
+
+
 if __name__ == "__main__":
+    # 其他套件（selenium、urllib3）維持 INFO，避免每個 WebDriver 指令都輸出記錄；
+    # 只有本專案的模組顯示每筆資料的處理過程，正式環境可改為 INFO 只顯示摘要
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    for name in PROJECT_LOGGERS:
+        logging.getLogger(name).setLevel(logging.DEBUG)
     example_manual_control()
     # print("網頁表單自動填寫範例\n")
     # print("請選擇要執行的範例:")
@@ -1,23 +1,203 @@
 """Excel Reader Module for Material Receiving and Issuing System"""
 
+import itertools
+import numpy as np
 import pandas as pd
+from pandas.io.parsers import TextParser
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Optional, Iterator, Tuple
+
+
+# 解析後工作表快取的預設記憶體上限（位元組）
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# 各副檔名可使用的解析引擎，依自動選擇的優先順序排列
+#   calamine: Rust 實作的解析器，需安裝 python-calamine 且 pandas >= 2.2
+#   openpyxl: pandas 以 read_only 串流模式開啟 .xlsx
+#   xlrd:     .xls（BIFF）格式
+ENGINES_BY_SUFFIX = {
+    '.xlsx': ['calamine', 'openpyxl'],
+    '.xls': ['calamine', 'xlrd'],
+}
+
+# 檔案小於此大小時，引擎差異不明顯，直接使用 pandas 預設引擎
+CALAMINE_MIN_BYTES = 1024 * 1024
+
+
+def available_engines(suffix: str) -> List[str]:
+    """
+    取得指定副檔名目前可用的解析引擎
+    
+    Args:
+        suffix: 副檔名（".xlsx" 或 ".xls"）
+    
+    Returns:
+        已安裝且 pandas 支援的引擎名稱列表
+    """
+    engines = []
+    for engine in ENGINES_BY_SUFFIX.get(suffix.lower(), []):
+        # pandas 2.2 之前沒有 calamine 引擎
+        if engine not in pd.ExcelFile._engines:
+            continue
+        module = 'python_calamine' if engine == 'calamine' else engine
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        engines.append(engine)
+    return engines
+
+
+def select_engine(file_path: Union[str, Path], engine: str = 'auto') -> str:
+    """
+    依副檔名與檔案大小選擇解析引擎
+    
+    Args:
+        file_path: Excel 檔案路徑
+        engine: 'auto' 表示自動選擇，或指定 'calamine'、'openpyxl'、'xlrd'
+    
+    Returns:
+        要傳給 pandas 的引擎名稱
+    
+    Raises:
+        ValueError: 如果指定的引擎不支援此格式或未安裝
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    engines = available_engines(suffix)
+    
+    if engine != 'auto':
+        if engine not in ENGINES_BY_SUFFIX.get(suffix, []):
+            raise ValueError(f"引擎 '{engine}' 不支援 {suffix} 格式")
+        if engine not in engines:
+            raise ValueError(f"引擎 '{engine}' 未安裝或目前的 pandas 版本不支援")
+        return engine
+    
+    if not engines:
+        raise ValueError(f"沒有可用的引擎可讀取 {suffix} 格式，請安裝 requirements.txt 中的套件")
+    
+    # 小檔案使用格式的預設引擎，大檔案優先使用 calamine
+    if engines[0] == 'calamine' and len(engines) > 1 \
+            and file_path.stat().st_size < CALAMINE_MIN_BYTES:
+        return engines[1]
+    return engines[0]
+
+
+def _column_letter_to_position(letters: str) -> int:
+    """將 Excel 欄位字母轉換為從 0 開始的位置（例如 "A" → 0、"T" → 19）"""
+    position = 0
+    for char in letters.strip().upper():
+        if not 'A' <= char <= 'Z':
+            raise ValueError(f"無效的 Excel 欄位: {letters}")
+        position = position * 26 + (ord(char) - ord('A') + 1)
+    return position - 1
+
+
+def _usecols_to_positions(usecols) -> Optional[List[int]]:
+    """
+    將 Excel 欄位範圍字串（如 "C,T,U" 或 "A:C"）或位置列表轉換為欄位位置列表
+    
+    Returns:
+        排序後的欄位位置列表；usecols 為欄位名稱或函式時返回 None
+    """
+    if isinstance(usecols, str):
+        positions = set()
+        for part in usecols.split(','):
+            if ':' in part:
+                first, last = part.split(':')
+                positions.update(range(_column_letter_to_position(first),
+                                       _column_letter_to_position(last) + 1))
+            else:
+                positions.add(_column_letter_to_position(part))
+        return sorted(positions)
+    
+    if isinstance(usecols, (list, tuple)) and all(isinstance(col, int) for col in usecols):
+        return sorted(set(usecols))
+    
+    return None
+
+
+def _make_column_names(header_values: list) -> list:
+    """
+    依 pandas 的規則由標題列產生欄位名稱
+    
+    空白標題命名為 "Unnamed: 位置"，重複的名稱依序加上 ".1"、".2"
+    """
+    names = []
+    seen = {}
+    for position, value in enumerate(header_values):
+        if value is None or (isinstance(value, str) and not value.strip()):
+            name = f"Unnamed: {position}"
+        else:
+            name = value
+        
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _xlrd_cell_value(cell, datemode: int):
+    """將 xlrd 儲存格轉換為與 pandas 讀取結果相同的 Python 值"""
+    import xlrd
+    
+    if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+        return None
+    if cell.ctype == xlrd.XL_CELL_DATE:
+        return xlrd.xldate_as_datetime(cell.value, datemode)
+    if cell.ctype == xlrd.XL_CELL_BOOLEAN:
+        return bool(cell.value)
+    if cell.ctype == xlrd.XL_CELL_NUMBER and cell.value == int(cell.value):
+        return int(cell.value)
+    if cell.ctype == xlrd.XL_CELL_TEXT and not cell.value:
+        return None
+    return cell.value
+
+
+def _openpyxl_cell_value(value):
+    """與 pandas 相同，將 openpyxl 讀到的整數浮點數轉為 int、空字串轉為 None"""
+    if value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _take_filtered(df: pd.DataFrame, required: Optional[int], drop_head: int, drop_tail: int) -> pd.DataFrame:
+    """刪除 required 欄為空值的列，再刪除前 drop_head 列與後 drop_tail 列（一次 take）"""
+    keep = np.arange(len(df))
+    if required is not None:
+        keep = np.flatnonzero(df.iloc[:, required].notna().to_numpy())
+    keep = keep[drop_head:len(keep) - drop_tail]
+    return df.take(keep)
+
+
+def _hashable(value):
+    """將列表參數轉換為可作為快取鍵的 tuple"""
+    return tuple(value) if isinstance(value, list) else value
 
 
 class ExcelReader:
     """讀取 Excel 檔案的類別，支援多工作表檔案"""
     
-    def __init__(self, file_path: Union[str, Path]):
+    def __init__(self, file_path: Union[str, Path], cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                 engine: str = 'auto'):
         """
         初始化 ExcelReader
         
         Args:
             file_path: Excel 檔案路徑
+            cache_max_bytes: 解析後工作表快取的記憶體上限（位元組），0 表示不快取
+            engine: 解析引擎，'auto' 依副檔名與檔案大小自動選擇，
+                    或指定 'calamine'、'openpyxl'、'xlrd'
         
         Raises:
             FileNotFoundError: 如果檔案不存在
-            ValueError: 如果檔案格式不正確
+            ValueError: 如果檔案格式不正確或引擎無法使用
         """
         self.file_path = Path(file_path)
         
@@ -27,16 +207,53 @@ class ExcelReader:
         if self.file_path.suffix not in ['.xlsx', '.xls']:
             raise ValueError(f"不支援的檔案格式: {self.file_path.suffix}，請使用 .xlsx 或 .xls")
         
-        self._excel_file = pd.ExcelFile(self.file_path)
+        self.engine = select_engine(self.file_path, engine)
+        # 活頁簿延到第一次讀取工作表時才開啟，只查詢工作表名稱或結構時不需解析整個檔案
+        self._workbook = None
+        self._sheet_names = None
+        
+        # 解析後的 DataFrame 快取：(工作表名稱, header, skiprows, usecols) → DataFrame
+        self.cache_max_bytes = cache_max_bytes
+        self._cache = OrderedDict()
+        self._cache_sizes = {}
+        self._cache_bytes = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    @property
+    def _excel_file(self) -> pd.ExcelFile:
+        """第一次存取時才開啟的 pd.ExcelFile"""
+        if self._workbook is None:
+            self._workbook = pd.ExcelFile(self.file_path, engine=self.engine)
+        return self._workbook
     
     def get_sheet_names(self) -> List[str]:
         """
         取得所有工作表名稱
         
+        活頁簿尚未開啟時只讀取活頁簿目錄（openpyxl read_only、xlrd on_demand），
+        不會載入工作表內容。
+        
         Returns:
             工作表名稱列表
         """
-        return self._excel_file.sheet_names
+        if self._workbook is not None:
+            return self._workbook.sheet_names
+        
+        if self._sheet_names is None:
+            if self.file_path.suffix.lower() == '.xlsx':
+                import openpyxl
+                
+                workbook = openpyxl.load_workbook(self.file_path, read_only=True)
+                self._sheet_names = workbook.sheetnames
+                workbook.close()
+            else:
+                import xlrd
+                
+                book = xlrd.open_workbook(str(self.file_path), on_demand=True)
+                self._sheet_names = book.sheet_names()
+                book.release_resources()
+        return self._sheet_names
     
     def read_sheet(self, 
                    sheet: Union[str, int], 
@@ -65,18 +282,113 @@ class ExcelReader:
         if isinstance(sheet, int) and (sheet < 0 or sheet >= len(self.get_sheet_names())):
             raise ValueError(f"工作表索引 {sheet} 超出範圍。有效範圍: 0-{len(self.get_sheet_names())-1}")
         
+        sheet_name = sheet if isinstance(sheet, str) else self.get_sheet_names()[sheet]
+        
+        # 先查快取：完全相同的讀取，或可由完整讀取切出的欄位子集
+        cached = self._cache_lookup(sheet_name, header, skiprows, usecols)
+        if cached is not None:
+            return cached
+        
         # 讀取工作表
         try:
             df = pd.read_excel(
                 self._excel_file,
-                sheet_name=sheet,
+                sheet_name=sheet_name,
                 header=header,
                 skiprows=skiprows,
                 usecols=usecols
             )
-            return df
         except Exception as e:
             raise RuntimeError(f"讀取工作表時發生錯誤: {str(e)}")
+        
+        self._cache_store((sheet_name, header, _hashable(skiprows), _hashable(usecols)), df)
+        return df.copy()
+    
+    def _cache_lookup(self, sheet_name: str, header, skiprows, usecols) -> Optional[pd.DataFrame]:
+        """從快取取得 DataFrame 的副本，未命中時返回 None"""
+        key = (sheet_name, header, _hashable(skiprows), _hashable(usecols))
+        full_key = (sheet_name, header, _hashable(skiprows), None)
+        
+        try:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return self._cache[key].copy()
+            
+            # 由快取中的完整讀取切出較少的欄位
+            if usecols is not None and full_key in self._cache:
+                full = self._cache[full_key]
+                positions = _usecols_to_positions(usecols)
+                if positions is not None and positions[-1] < len(full.columns):
+                    subset = full.iloc[:, positions].copy()
+                elif positions is None and isinstance(usecols, (list, tuple)) \
+                        and all(col in full.columns for col in usecols):
+                    subset = full[[col for col in full.columns if col in usecols]].copy()
+                else:
+                    subset = None
+                
+                if subset is not None:
+                    self._cache.move_to_end(full_key)
+                    self._cache_hits += 1
+                    return subset
+        except (TypeError, ValueError):
+            # 無法作為快取鍵或無法解析的 usecols（例如函式），直接讀取
+            pass
+        
+        self._cache_misses += 1
+        return None
+    
+    def _is_cached(self, sheet_name: str, header, skiprows, usecols) -> bool:
+        """檢查讀取是否可由快取提供（不計入命中統計）"""
+        try:
+            return ((sheet_name, header, _hashable(skiprows), _hashable(usecols)) in self._cache
+                    or (sheet_name, header, _hashable(skiprows), None) in self._cache)
+        except TypeError:
+            return False
+    
+    def _cache_store(self, key: tuple, df: pd.DataFrame):
+        """將 DataFrame 存入快取，超過記憶體上限時淘汰最久未使用的項目"""
+        try:
+            hash(key)
+        except TypeError:
+            return
+        
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.cache_max_bytes:
+            return
+        
+        if key in self._cache:
+            del self._cache[key]
+            self._cache_bytes -= self._cache_sizes.pop(key)
+        
+        self._cache[key] = df
+        self._cache_sizes[key] = size
+        self._cache_bytes += size
+        
+        while self._cache_bytes > self.cache_max_bytes:
+            old_key, _ = self._cache.popitem(last=False)
+            self._cache_bytes -= self._cache_sizes.pop(old_key)
+    
+    def cache_info(self) -> dict:
+        """
+        取得快取統計資訊
+        
+        Returns:
+            包含命中次數、未命中次數、快取筆數與使用記憶體的字典
+        """
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'entries': len(self._cache),
+            'bytes': self._cache_bytes,
+            'max_bytes': self.cache_max_bytes
+        }
+    
+    def clear_cache(self):
+        """清除已解析工作表的快取"""
+        self._cache.clear()
+        self._cache_sizes.clear()
+        self._cache_bytes = 0
     
     def read_sheet_with_preprocessing(self,
                                      sheet: Union[str, int],
@@ -114,10 +426,277 @@ class ExcelReader:
         
         return df
     
+    def _iter_raw_rows(self, sheet_name: str,
+                       positions: Optional[List[int]] = None,
+                       prefix_row: Optional[int] = None) -> Tuple[Optional[int], int, Iterator[tuple]]:
+        """
+        以串流方式逐列讀取工作表的原始儲存格值，不建立整張工作表的 DataFrame
+        
+        .xlsx 使用 openpyxl 的 read_only 模式，逐列從檔案解析，記憶體用量與工作表大小無關。
+        .xls 使用 xlrd 的 on_demand 模式，但 on_demand 只延後載入其他工作表：開啟這張
+        工作表時 xlrd 仍會把它的所有儲存格載入記憶體，串流只省下建立 DataFrame 的部分。
+        列數與欄數取自活頁簿記錄的工作表範圍（xlrd 的 nrows/ncols、openpyxl 的
+        dimension），不需走訪儲存格；.xlsx 未記錄範圍時列數為 None。
+        
+        Args:
+            sheet_name: 工作表名稱
+            positions: 只讀取這些欄位位置（每列依序產生這些欄位的值），None 表示整列
+            prefix_row: 這一列（原始列號）改為產生第一欄到 positions 最後一欄的所有值，
+                        供標題列依 read_excel 的規則命名；只在指定 positions 時有效
+        
+        Returns:
+            (工作表列數, 工作表欄數, 逐列產生 tuple 的迭代器)
+        """
+        if self.file_path.suffix.lower() == '.xlsx':
+            import openpyxl
+            
+            workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+            worksheet = workbook[sheet_name]
+            
+            def rows():
+                try:
+                    if positions is None:
+                        for row in worksheet.iter_rows(values_only=True):
+                            yield tuple(_openpyxl_cell_value(value) for value in row)
+                        return
+                    
+                    prefix = None
+                    if prefix_row is not None:
+                        prefix = next(worksheet.iter_rows(min_row=prefix_row + 1, max_row=prefix_row + 1,
+                                                          max_col=positions[-1] + 1, values_only=True), ())
+                        prefix = tuple(_openpyxl_cell_value(value) for value in prefix)
+                    
+                    # 只建立 positions 範圍內的儲存格
+                    first = positions[0]
+                    for index, row in enumerate(worksheet.iter_rows(min_col=first + 1, max_col=positions[-1] + 1,
+                                                                    values_only=True)):
+                        if index == prefix_row:
+                            yield prefix
+                            continue
+                        yield tuple(_openpyxl_cell_value(row[position - first])
+                                    if position - first < len(row) else None
+                                    for position in positions)
+                finally:
+                    workbook.close()
+            
+            return worksheet.max_row, worksheet.max_column or 0, rows()
+        
+        import xlrd
+        
+        book = xlrd.open_workbook(str(self.file_path), on_demand=True)
+        worksheet = book.sheet_by_name(sheet_name)
+        
+        def rows():
+            try:
+                if positions is None:
+                    for index in range(worksheet.nrows):
+                        yield tuple(_xlrd_cell_value(cell, book.datemode) for cell in worksheet.row(index))
+                    return
+                
+                # 只轉換需要的儲存格
+                for index in range(worksheet.nrows):
+                    width = worksheet.row_len(index)
+                    if index == prefix_row:
+                        yield tuple(_xlrd_cell_value(worksheet.cell(index, position), book.datemode)
+                                    if position < width else None
+                                    for position in range(positions[-1] + 1))
+                        continue
+                    yield tuple(_xlrd_cell_value(worksheet.cell(index, position), book.datemode)
+                                if position < width else None
+                                for position in positions)
+            finally:
+                book.release_resources()
+        
+        return worksheet.nrows, worksheet.ncols, rows()
+    
+    def iter_sheet_chunks(self,
+                          sheet: Union[str, int],
+                          chunksize: int = 10000,
+                          header: Optional[int] = 0,
+                          skiprows: Union[int, List[int]] = None,
+                          usecols: Union[str, List] = None,
+                          dropna_subset: List = None) -> Iterator[pd.DataFrame]:
+        """
+        以固定筆數的 DataFrame 區塊串流讀取工作表
+        
+        每次只建立一個區塊的 DataFrame。記憶體上限依格式而不同（見 _iter_raw_rows）:
+        .xlsx 只保留一個區塊；.xls 由 xlrd 載入整張工作表的原始儲存格，另加一個區塊，
+        仍低於 read_sheet 的完整 DataFrame，但與工作表大小成正比。usecols 與
+        dropna_subset 會在每個區塊上套用；區塊的索引延續整張工作表的列號，
+        與 read_sheet 的結果一致。各區塊的資料型別分別推斷，可能與整張讀取不同。
+        
+        目前的清理、填寫與輸出流程都使用完整的 DataFrame，沒有經由此介面讀取；
+        適合自行逐區塊彙總大型帳本時使用。
+        
+        Args:
+            sheet: 工作表名稱或索引
+            chunksize: 每個區塊的列數
+            header: 標題列位置（套用 skiprows 之後），None 表示沒有標題列
+            skiprows: 跳過前幾列，或要跳過的列號列表
+            usecols: 要讀取的欄位，Excel 欄位範圍（如 "C,T,U"）、位置列表或欄位名稱列表
+            dropna_subset: 這些欄位為空值的列會被刪除
+        
+        Yields:
+            每個區塊的 DataFrame
+        """
+        if chunksize <= 0:
+            raise ValueError("chunksize 必須大於 0")
+        
+        sheet_name = sheet if isinstance(sheet, str) else self.get_sheet_names()[sheet]
+        if sheet_name not in self.get_sheet_names():
+            raise ValueError(f"工作表 '{sheet}' 不存在。可用的工作表: {', '.join(self.get_sheet_names())}")
+        
+        _, width, raw_rows = self._iter_raw_rows(sheet_name)
+        
+        if isinstance(skiprows, int):
+            skip = set(range(skiprows))
+        else:
+            skip = set(skiprows or [])
+        rows = (row for number, row in enumerate(raw_rows) if number not in skip)
+        
+        # 讀取標題列
+        header_values = []
+        if header is not None:
+            for _ in range(header):
+                next(rows, None)
+            header_values = list(next(rows, ()))
+        width = max(width, len(header_values))
+        header_values += [None] * (width - len(header_values))
+        names = _make_column_names(header_values) if header is not None else list(range(width))
+        
+        # 決定要保留的欄位位置
+        positions = _usecols_to_positions(usecols) if usecols is not None else list(range(width))
+        if positions is None:
+            positions = [position for position, name in enumerate(names) if name in usecols]
+        positions = [position for position in positions if position < width]
+        columns = [names[position] for position in positions]
+        
+        def build(batch, start):
+            # 與 read_excel 相同經由 TextParser 推斷型別（數字字串轉為數值、空字串轉為 NaN）
+            chunk = TextParser(batch, header=None, names=columns).read()
+            chunk.index = pd.RangeIndex(start, start + len(batch))
+            if dropna_subset is not None:
+                chunk = chunk.dropna(subset=dropna_subset)
+            return chunk
+        
+        batch = []
+        blank_run = []
+        start = 0
+        for row in rows:
+            values = [row[position] if position < len(row) and row[position] is not None else ''
+                      for position in positions]
+            
+            # 與 read_excel 相同，工作表結尾的整列空白不輸出：先暫存，遇到非空白列才補上
+            if all(value is None for value in row):
+                blank_run.append(values)
+                continue
+            
+            for pending in blank_run + [values]:
+                batch.append(pending)
+                if len(batch) == chunksize:
+                    yield build(batch, start)
+                    start += len(batch)
+                    batch = []
+            blank_run = []
+        
+        if batch:
+            yield build(batch, start)
+    
+    def read_sheet_filtered(self,
+                            sheet: Union[str, int],
+                            usecols: Union[str, List[int]],
+                            header: Optional[int] = 0,
+                            skiprows: Union[int, List[int]] = None,
+                            nrows: Optional[int] = None,
+                            required: Optional[int] = None,
+                            drop_head: int = 0,
+                            drop_tail: int = 0) -> pd.DataFrame:
+        """
+        以單次串流讀取工作表，並在讀取時完成欄位選取與列篩選
+        
+        usecols、skiprows 與 nrows 在讀取階段套用：只轉換選取欄位的儲存格，
+        讀滿 nrows 列即停止。其餘步驟在建立 DataFrame 後以一次遮罩與 take 完成：
+        刪除 required 欄為空值的列後，再刪除前 drop_head 列與後 drop_tail 列。
+        結果（含欄位名稱）與 read_sheet(usecols=...) 後依序 dropna、iloc 相同：
+        標題列依 read_excel 的規則由整列（到最後一個選取欄位為止）命名後再選取，
+        空白標題為 "Unnamed: 原始欄位位置"；沒有標題列時欄位名稱為原始欄位位置。
+        
+        逐格串流只在 openpyxl/xlrd 上實作。引擎為 calamine 時，整張解析已比逐格
+        串流快，工作表已在快取中時也不需重新解析，這兩種情況改由 read_sheet
+        （使用 self.engine 與快取）讀取選取欄位後再篩選。
+        
+        Args:
+            sheet: 工作表名稱或索引
+            usecols: 要讀取的欄位，Excel 欄位範圍（如 "C,T,U"）或位置列表
+            header: 標題列位置（套用 skiprows 之後），None 表示沒有標題列
+            skiprows: 跳過前幾列，或要跳過的列號列表
+            nrows: 最多讀取的資料列數，None 表示讀到最後
+            required: 選取欄位中的位置（從 0 開始），該欄為空值的列會被刪除
+            drop_head: 篩選後再刪除的開頭列數
+            drop_tail: 篩選後再刪除的結尾列數
+        
+        Returns:
+            篩選後的 DataFrame，索引為在工作表資料列中的位置（與 read_sheet 一致）
+        """
+        positions = _usecols_to_positions(usecols)
+        if positions is None:
+            raise ValueError("read_sheet_filtered 的 usecols 須為 Excel 欄位範圍或位置列表")
+        
+        sheet_name = sheet if isinstance(sheet, str) else self.get_sheet_names()[sheet]
+        if sheet_name not in self.get_sheet_names():
+            raise ValueError(f"工作表 '{sheet}' 不存在。可用的工作表: {', '.join(self.get_sheet_names())}")
+        
+        if self.engine == 'calamine' or self._is_cached(sheet_name, header, skiprows, usecols):
+            df = self.read_sheet(sheet_name, header=header, skiprows=skiprows, usecols=usecols)
+            if nrows is not None:
+                df = df.iloc[:nrows]
+            return _take_filtered(df, required, drop_head, drop_tail)
+        
+        if isinstance(skiprows, int):
+            skip = set(range(skiprows))
+        else:
+            skip = set(skiprows or [])
+        # 標題列在工作表中的原始列號（跳過 skiprows 後的第 header 列）
+        header_row = None
+        if header is not None:
+            header_row = next(itertools.islice((number for number in itertools.count() if number not in skip),
+                                               header, None))
+        
+        _, _, raw_rows = self._iter_raw_rows(sheet_name, positions, prefix_row=header_row)
+        try:
+            rows = (row for number, row in enumerate(raw_rows) if number not in skip)
+            
+            # 讀取標題列：與 read_excel 相同，以整列命名（空白與重複的名稱依原始位置處理）後再選取
+            names = list(positions)
+            if header is not None:
+                for _ in range(header):
+                    next(rows, None)
+                header_values = list(next(rows, ()))
+                header_values += [None] * (positions[-1] + 1 - len(header_values))
+                all_names = _make_column_names(header_values)
+                names = [all_names[position] for position in positions]
+            
+            if nrows is not None:
+                rows = itertools.islice(rows, nrows)
+            data = [['' if value is None else value for value in row] for row in rows]
+        finally:
+            raw_rows.close()
+        
+        # 結尾在選取欄位中全為空白的列不計入（與 read_excel 略過結尾空白列相同）
+        while data and all(value == '' for value in data[-1]):
+            data.pop()
+        
+        # 與 read_excel 相同經由 TextParser 推斷型別
+        df = TextParser(data, header=None, names=names).read() if data else pd.DataFrame(columns=names)
+        return _take_filtered(df, required, drop_head, drop_tail)
+    
     def get_sheet_info(self, sheet: Union[str, int]) -> dict:
         """
         取得工作表的基本資訊
         
+        需要解析整張工作表以推斷資料型別；只需要列數、欄位名稱時請使用
+        get_sheet_metadata。
+        
         Args:
             sheet: 工作表名稱或索引
         
@@ -135,9 +714,73 @@ class ExcelReader:
             '空值統計': df.isnull().sum().to_dict()
         }
     
+    def get_sheet_metadata(self, sheet: Union[str, int], null_counts: bool = False) -> dict:
+        """
+        只讀取工作表結構取得基本資訊，不建立 DataFrame
+        
+        列數與欄數取自活頁簿記錄的工作表範圍，欄位名稱只讀取標題列，因此
+        即使是大型活頁簿也幾乎不需時間。記錄的範圍可能包含結尾的空白列；
+        需要與 read_sheet 完全一致的列數時，請指定 null_counts=True 以串流
+        走訪整張工作表（仍不建立 DataFrame）。
+        
+        Args:
+            sheet: 工作表名稱或索引
+            null_counts: 是否串流走訪所有列，計算各欄空白儲存格數與實際列數
+        
+        Returns:
+            包含工作表名稱、總列數、總欄數、欄位名稱的字典；
+            null_counts=True 時另含「空值統計」
+        """
+        sheet_name = sheet if isinstance(sheet, str) else self.get_sheet_names()[sheet]
+        if sheet_name not in self.get_sheet_names():
+            raise ValueError(f"工作表 '{sheet}' 不存在。可用的工作表: {', '.join(self.get_sheet_names())}")
+        
+        nrows, width, rows = self._iter_raw_rows(sheet_name)
+        try:
+            header_values = list(next(rows, ()))
+            width = max(width, len(header_values))
+            # 空白工作表在 openpyxl 仍記錄為 A1 範圍，與 read_excel 相同視為沒有欄位
+            if (nrows or 0) <= 1 and all(value is None for value in header_values):
+                header_values, width = [], 0
+            names = _make_column_names(header_values + [None] * (width - len(header_values)))
+            
+            # 未記錄工作表範圍，或需要空值統計時，才走訪其餘各列
+            if nrows is None or null_counts:
+                data_rows = 0
+                blank_run = 0
+                nulls = [0] * width
+                for row in rows:
+                    # 與 read_excel 相同，結尾的整列空白不計入：先累計，遇到非空白列才補上
+                    if all(value is None for value in row):
+                        blank_run += 1
+                        continue
+                    data_rows += blank_run + 1
+                    for position in range(width):
+                        if position >= len(row) or row[position] is None:
+                            nulls[position] += 1
+                        if blank_run:
+                            nulls[position] += blank_run
+                    blank_run = 0
+                nrows = data_rows + 1
+        finally:
+            rows.close()
+        
+        info = {
+            '工作表名稱': sheet_name,
+            '總列數': max(nrows - 1, 0),
+            '總欄數': width,
+            '欄位名稱': names
+        }
+        if null_counts:
+            info['空值統計'] = dict(zip(names, nulls))
+        return info
+    
     def close(self):
         """關閉 Excel 檔案"""
-        self._excel_file.close()
+        self.clear_cache()
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
     
     def __enter__(self):
         """支援 with 語句"""
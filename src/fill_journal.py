@@ -0,0 +1,115 @@
+"""填寫紀錄模組 - 以僅附加的日誌記錄已完成的項次，供中斷後續跑"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Union
+
+
+class FillJournal:
+    """
+    僅附加（append-only）的填寫日誌
+    
+    每完成一筆就寫入一行 JSON 並 fsync，瀏覽器當機或工作階段逾時後，
+    重新執行時可依日誌略過已完成的項次。同一項次有多筆紀錄時以最後一筆為準。
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        初始化 FillJournal
+        
+        Args:
+            path: 日誌檔案路徑（.jsonl），不存在時會自動建立
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = None
+    
+    @classmethod
+    def for_source(cls, directory: Union[str, Path], source: Union[str, Path],
+                   sheet: Union[int, str]) -> 'FillJournal':
+        """
+        取得某個來源工作表專用的日誌，不同工作簿或工作表的紀錄互不影響
+        
+        Args:
+            directory: 日誌目錄
+            source: 資料來源的工作簿路徑
+            sheet: 工作表索引或名稱
+        
+        Returns:
+            日誌檔名為「工作簿檔名_工作表_路徑雜湊.jsonl」的 FillJournal
+        """
+        source = Path(source).resolve()
+        digest = hashlib.sha1(str(source).encode('utf-8')).hexdigest()[:8]
+        return cls(Path(directory) / f"{source.stem}_{sheet}_{digest}.jsonl")
+    
+    def entries(self) -> dict:
+        """
+        讀取日誌中已完成的項次
+        
+        Returns:
+            項次 → {'quantity': 數量, 'amount': 複價} 的字典；
+            最後一行若因當機而不完整會被略過
+        """
+        completed = {}
+        if not self.path.exists():
+            return completed
+        
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                completed[record['item']] = {
+                    'quantity': record['quantity'],
+                    'amount': record['amount']
+                }
+        return completed
+    
+    def append(self, item: str, quantity: float, amount: float):
+        """
+        記錄一筆已完成的項次，寫入後立即 fsync
+        
+        Args:
+            item: 正規化後的項次
+            quantity: 填入的數量
+            amount: 試算表中的複價
+        """
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+            # 上次當機留下不完整的最後一行時先換行，避免新紀錄接在後面
+            if self.path.stat().st_size and not self._ends_with_newline():
+                self._file.write('\n')
+        
+        record = {'item': item, 'quantity': quantity, 'amount': amount, 'time': time.time()}
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def _ends_with_newline(self) -> bool:
+        """檢查日誌檔案是否以換行結尾"""
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+    
+    def clear(self):
+        """刪除日誌（例如確認網頁已儲存後）"""
+        self.close()
+        self.path.unlink(missing_ok=True)
+    
+    def close(self):
+        """關閉日誌檔案"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        """支援 with 語句"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """支援 with 語句"""
+        self.close()
@@ -0,0 +1,157 @@
+"""網頁表格比對模組 - 將表格快照與試算表資料做向量化比對"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional, Union
+
+from data_pipeline import normalize_items, sort_by_item, to_numeric_text
+
+# 複價比對的容許誤差：網頁上可能是自動計算的值或手動填入的整數
+AMOUNT_TOLERANCE = 1
+
+
+def grid_to_frame(grid_values: dict) -> pd.DataFrame:
+    """
+    將 WebFormFiller.read_grid_values() 的結果轉換為 DataFrame
+    
+    Args:
+        grid_values: 正規化項次 → {'index', 'quantity', 'amount'} 的字典
+    
+    Returns:
+        包含「項次」、index、page_quantity、page_amount 欄位的 DataFrame（數值已正規化）
+    """
+    frame = pd.DataFrame.from_dict(grid_values, orient='index',
+                                   columns=['index', 'quantity', 'amount'])
+    frame.index.name = '項次'
+    frame = frame.reset_index()
+    return pd.DataFrame({
+        '項次': frame['項次'].astype(object),
+        'index': frame['index'].astype(np.int64),
+        'page_quantity': to_numeric_text(frame['quantity']),
+        'page_amount': to_numeric_text(frame['amount'])
+    })
+
+
+def values_match(page_quantity: Optional[str], page_amount: Optional[str],
+                 quantity: float, amount: float) -> bool:
+    """
+    判斷網頁上某列的數量與複價是否已是要填入的值（單筆版本）
+    
+    數量須等於要填入的整數；複價相差小於 AMOUNT_TOLERANCE 即視為相同
+    """
+    page = to_numeric_text(pd.Series([page_quantity, page_amount], dtype=object))
+    if page.isna().any():
+        return False
+    return page.iloc[0] == int(quantity) and abs(page.iloc[1] - amount) < AMOUNT_TOLERANCE
+
+
+def changed_mask(df: pd.DataFrame, grid: pd.DataFrame) -> pd.Series:
+    """
+    找出網頁上的值與試算表不同、需要重新填寫的列
+    
+    Args:
+        df: 包含「項次」、「數量」、「複價」欄位的 DataFrame
+        grid: grid_to_frame() 的結果
+    
+    Returns:
+        與 df 相同索引的布林欄位；網頁上找不到的項次也標記為 True，
+        讓後續填寫流程回報為未找到
+    """
+    items = normalize_items(df['項次'])
+    page = grid.set_index('項次')
+    page_quantity = items.map(page['page_quantity'])
+    page_amount = items.map(page['page_amount'])
+    
+    quantity = np.trunc(to_numeric_text(df['數量']))
+    amount = to_numeric_text(df['複價'])
+    
+    same = (page_quantity == quantity) & ((page_amount - amount).abs() < AMOUNT_TOLERANCE)
+    return ~same.fillna(False).astype(bool)
+
+
+# 核對報告的狀態
+STATUS_MISSING = '網頁缺少'
+STATUS_EXTRA = '網頁多出'
+STATUS_EMPTY = '網頁未填'
+STATUS_WRONG_QUANTITY = '數量不符'
+STATUS_WRONG_AMOUNT = '複價不符'
+
+
+def reconcile(df: pd.DataFrame, grid: pd.DataFrame) -> pd.DataFrame:
+    """
+    核對網頁表格與試算表，列出所有不一致的項次
+    
+    以項次做一次外部合併後向量化比對，比對規則與 changed_mask 相同：
+    數量須等於要填入的整數，複價相差小於 AMOUNT_TOLERANCE。
+    試算表中同一項次重複時以第一筆為準；網頁上有、試算表沒有的項次
+    只在網頁已填入數量或複價時列為多出。
+    狀態依序判定為網頁缺少、網頁多出、網頁未填（網頁上數量空白）、數量不符、複價不符。
+    
+    Args:
+        df: 包含「項次」、「數量」、「複價」欄位的 DataFrame（數量或複價無法轉換為數字的列不核對）
+        grid: grid_to_frame() 的結果
+    
+    Returns:
+        每個不一致項次一列，欄位為「項次」、「狀態」、「試算表數量」、「網頁數量」、
+        「試算表複價」、「網頁複價」、「複價差額」，依項次排序；全部一致時為空的 DataFrame
+    """
+    sheet = pd.DataFrame({
+        '項次': normalize_items(df['項次']),
+        'sheet_quantity': np.trunc(to_numeric_text(df['數量'])),
+        'sheet_amount': to_numeric_text(df['複價'])
+    })
+    sheet = sheet[np.isfinite(sheet['sheet_quantity']) & np.isfinite(sheet['sheet_amount'])]
+    sheet = sheet.drop_duplicates('項次')
+    
+    merged = sheet.merge(grid[['項次', 'page_quantity', 'page_amount']],
+                         on='項次', how='outer', indicator=True)
+    
+    in_sheet = merged['_merge'] != 'right_only'
+    on_page = merged['_merge'] != 'left_only'
+    entered = merged['page_quantity'].fillna(0).ne(0) | merged['page_amount'].fillna(0).ne(0)
+    amount_diff = merged['page_amount'] - merged['sheet_amount']
+    
+    missing = in_sheet & ~on_page
+    extra = on_page & ~in_sheet & entered
+    empty = in_sheet & on_page & merged['page_quantity'].isna()
+    wrong_quantity = in_sheet & on_page & ~(merged['page_quantity'] == merged['sheet_quantity'])
+    wrong_amount = in_sheet & on_page & ~(amount_diff.abs() < AMOUNT_TOLERANCE)
+    
+    status = np.select([missing, extra, empty, wrong_quantity, wrong_amount],
+                       [STATUS_MISSING, STATUS_EXTRA, STATUS_EMPTY,
+                        STATUS_WRONG_QUANTITY, STATUS_WRONG_AMOUNT],
+                       default='')
+    
+    report = pd.DataFrame({
+        '項次': merged['項次'],
+        '狀態': status,
+        '試算表數量': merged['sheet_quantity'],
+        '網頁數量': merged['page_quantity'],
+        '試算表複價': merged['sheet_amount'],
+        '網頁複價': merged['page_amount'],
+        '複價差額': amount_diff
+    })[status != '']
+    
+    return sort_by_item(report)
+
+
+def save_reconciliation(report: pd.DataFrame, output_path: Union[str, Path]) -> Path:
+    """
+    將核對報告存為 Excel 或 CSV（依副檔名，.csv 以外皆存為 Excel）
+    
+    Args:
+        report: reconcile() 的結果
+        output_path: 輸出檔案路徑
+    
+    Returns:
+        輸出檔案路徑
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if output_path.suffix.lower() == '.csv':
+        report.to_csv(output_path, index=False, encoding='utf-8-sig')
+    else:
+        report.to_excel(output_path, sheet_name='核對結果', index=False)
+    return output_path
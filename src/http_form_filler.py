@@ -0,0 +1,636 @@
+"""HTTP 表單填寫模組 - 不啟動瀏覽器，直接以 postback 請求填寫收料頁面
+
+收料頁面（PP_MRS_3010.aspx）是傳統的 ASP.NET WebForms 頁面，頁面狀態保存在
+__VIEWSTATE、__EVENTVALIDATION 等隱藏欄位中，修改欄位後送出整個表單即可重現
+瀏覽器的 postback。requests 只在建立連線時才匯入。
+"""
+
+from __future__ import annotations
+
+from web_form_filler import WebFormFiller, _is_whole_amount, _parse_number, _to_number
+from html.parser import HTMLParser
+import logging
+import re
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import requests
+
+logger = logging.getLogger(__name__)
+
+
+_ITEM_ID = re.compile(r'^gvReceive_lblItem_(\d+)$')
+
+# 分頁連結為 javascript:__doPostBack('gvReceive','Page$N')
+_PAGE_LINK = re.compile(r"__doPostBack\('([^']*)','Page\$(\d+)'\)")
+
+# 表格中單價欄的表頭文字（<th> 的文字完全相同才視為單價欄）
+PRICE_HEADER = '單價'
+
+
+class _PageBuilder:
+    """
+    收集表單欄位、項次標籤與表格分頁列
+    
+    以 start/end/data/close 接收解析事件，可直接作為 lxml.etree.HTMLParser 的 target，
+    也可由 _StdlibPageParser 轉接標準函式庫的 html.parser。
+    """
+    
+    def __init__(self, price_header: Optional[str] = PRICE_HEADER):
+        self.action = None
+        self.price_header = price_header
+        # 表單送出時會帶上的欄位（名稱 → 值），submit 按鈕另外記錄，只在按下時送出
+        self.fields = {}
+        self.buttons = {}
+        # 元素 id → 欄位名稱（例如 gvReceive_txtRecvQty_0 → gvReceive$ctl02$txtRecvQty）
+        self.ids = {}
+        self.items = []
+        # 項次索引 → 單價（表頭文字為 price_header 的欄位；找不到該欄時為空）
+        self.prices = {}
+        self._price_column = None
+        self.pager = None
+        self._in_form = False
+        self._select = None
+        self._textarea = None
+        # 收集文字中的元素：[標籤, 項次索引（非項次標籤為 None）, 文字片段]
+        self._captures = []
+        # 巢狀的 <tr>：每列收集 span 中的頁碼、分頁連結、儲存格文字（th 與 td）與項次索引
+        self._rows = []
+    
+    def start(self, tag: str, attrs: dict):
+        if tag == 'form' and self.action is None:
+            self.action = attrs.get('action') or ''
+            self._in_form = True
+        elif tag == 'input' and self._in_form:
+            self._input(attrs)
+        elif tag == 'select' and self._in_form:
+            # [名稱, 第一個選項的值, 已選取的值]
+            self._select = [attrs.get('name'), None, None]
+        elif tag == 'option' and self._select is not None:
+            value = attrs.get('value') or ''
+            if self._select[1] is None:
+                self._select[1] = value
+            if 'selected' in attrs:
+                self._select[2] = value
+        elif tag == 'textarea' and self._in_form:
+            self._textarea = [attrs.get('name'), []]
+        elif tag == 'tr':
+            self._rows.append({'numbers': [], 'pages': [], 'target': None, 'cells': [],
+                               'header': False, 'item': None})
+        elif tag == 'a' and self._rows:
+            match = _PAGE_LINK.search(attrs.get('href') or '')
+            if match:
+                row = self._rows[-1]
+                row['target'] = row['target'] or match.group(1)
+                row['pages'].append(int(match.group(2)))
+        
+        match = _ITEM_ID.match(attrs.get('id') or '')
+        if match or tag in ('span', 'td', 'th'):
+            self._captures.append([tag, int(match.group(1)) if match else None, []])
+    
+    def _input(self, attrs: dict):
+        name = attrs.get('name')
+        kind = (attrs.get('type') or 'text').lower()
+        if name and attrs.get('id'):
+            self.ids[attrs['id']] = name
+        if not name or 'disabled' in attrs:
+            return
+        
+        if kind == 'submit':
+            self.buttons[name] = attrs.get('value') or ''
+        elif kind in ('checkbox', 'radio'):
+            if 'checked' in attrs:
+                self.fields[name] = attrs.get('value') or 'on'
+        elif kind not in ('button', 'image', 'reset', 'file'):
+            self.fields[name] = attrs.get('value') or ''
+    
+    def data(self, text: str):
+        for capture in self._captures:
+            capture[2].append(text)
+        if self._textarea is not None:
+            self._textarea[1].append(text)
+    
+    def end(self, tag: str):
+        if tag == 'form':
+            self._in_form = False
+        elif tag == 'select' and self._select is not None:
+            name, first, selected = self._select
+            if name:
+                self.fields[name] = selected if selected is not None else (first or '')
+            self._select = None
+        elif tag == 'textarea' and self._textarea is not None:
+            name, parts = self._textarea
+            if name:
+                self.fields[name] = ''.join(parts)
+            self._textarea = None
+        elif tag == 'tr' and self._rows:
+            row = self._rows.pop()
+            if row['pages'] and self.pager is None:
+                # 目前頁碼是分頁列中沒有連結的數字（<span>N</span>）
+                current = row['numbers'][0] if row['numbers'] else 1
+                self.pager = {'target': row['target'], 'current': current,
+                              'pages': row['pages'] + [current]}
+            if row['header'] and self._price_column is None and self.price_header in row['cells']:
+                self._price_column = row['cells'].index(self.price_header)
+            if row['item'] is not None and self._price_column is not None \
+                    and self._price_column < len(row['cells']):
+                price = _parse_number(row['cells'][self._price_column])
+                if price is not None:
+                    self.prices[row['item']] = price
+        
+        if self._captures and self._captures[-1][0] == tag:
+            _, index, parts = self._captures.pop()
+            text = ''.join(parts).strip()
+            if index is not None:
+                self.items.append((index, text))
+                if self._rows:
+                    self._rows[-1]['item'] = index
+            if tag == 'span' and text.isdigit() and self._rows:
+                self._rows[-1]['numbers'].append(int(text))
+            elif tag in ('td', 'th') and self._rows:
+                self._rows[-1]['cells'].append(text)
+                self._rows[-1]['header'] |= tag == 'th'
+    
+    def close(self) -> dict:
+        return {
+            'action': self.action,
+            'fields': self.fields,
+            'buttons': self.buttons,
+            'ids': self.ids,
+            'items': self.items,
+            'prices': self.prices,
+            'pager': self.pager
+        }
+
+
+class _StdlibPageParser(HTMLParser):
+    """將 html.parser 的事件轉給 _PageBuilder"""
+    
+    def __init__(self, target: _PageBuilder):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+    
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag, dict(attrs))
+    
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+    
+    def handle_data(self, data):
+        self.target.data(data)
+
+
+def parse_form_page(text: str, price_header: Optional[str] = PRICE_HEADER) -> dict:
+    """
+    解析 WebForms 頁面，已安裝 lxml 時使用 lxml，否則使用標準函式庫的 html.parser
+    
+    只走訪一次事件串流，不建立 DOM 樹。
+    
+    Args:
+        text: 頁面 HTML
+        price_header: 單價欄的表頭文字，None 表示不讀取單價
+    
+    Returns:
+        字典，包含 'action'（表單送出網址）、'fields'（欄位名稱 → 值）、
+        'buttons'（submit 按鈕名稱 → 值）、'ids'（元素 id → 欄位名稱）、
+        'items'（(索引, 項次文字) 列表）、'prices'（索引 → 單價，找不到單價欄時為空）與
+        'pager'（分頁資訊，沒有分頁時為 None）
+    """
+    builder = _PageBuilder(price_header)
+    try:
+        from lxml import etree
+    except ImportError:
+        parser = _StdlibPageParser(builder)
+        parser.feed(text)
+        parser.close()
+        return builder.close()
+    
+    parser = etree.HTMLParser(target=builder)
+    parser.feed(text)
+    return parser.close()
+
+
+class HttpFormFiller(WebFormFiller):
+    """
+    以 HTTP postback 填寫收料頁面，不啟動瀏覽器
+    
+    以 requests 的連線池送出表單、以 parse_form_page 解析回應，並覆寫 WebFormFiller
+    存取頁面的方法；process_dataframe、reconcile、填寫日誌與分頁處理的流程與瀏覽器
+    版本相同。登入狀態由瀏覽器的 cookies 取得（見 from_browser）。
+    
+    與瀏覽器版本的差異:
+      - 頁面上的 JavaScript 不會執行，複價不會自動計算；數量與複價都直接送出。
+        複價沿用瀏覽器版本的規則：由表頭為 price_header 的單價欄算出的複價為整數時
+        送出該值，否則（或找不到單價欄時）送出試算表的複價（取整數），這些項次記錄在
+        結果的 'amount_overridden' 中
+      - 批次模式中每一批只送出一次 postback
+      - 填入的值保存在這個 HTTP 工作階段的頁面狀態中，瀏覽器中開啟的頁面看不到，
+        完成後須以 submit() 按下儲存按鈕
+    """
+    
+    def __init__(self, cookies: Optional[List[dict]] = None, user_agent: Optional[str] = None,
+                 timeout: float = 30, pool_size: int = 4, retries: int = 2,
+                 price_header: Optional[str] = PRICE_HEADER):
+        """
+        初始化 HttpFormFiller
+        
+        Args:
+            cookies: 登入後的 cookies（WebFormFiller.get_cookies() 的格式）
+            user_agent: 送出的 User-Agent，None 使用 requests 的預設值
+            timeout: 每個請求的最長等待時間（秒）
+            pool_size: 連線池保留的連線數
+            retries: 連線失敗時的重試次數（postback 不是冪等操作，讀取逾時不重送）
+            price_header: 表格中單價欄的表頭文字，None 表示一律送出試算表的複價
+        """
+        super().__init__(headless=True)
+        self.session = None
+        self.cookies = list(cookies or [])
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.retries = retries
+        self.price_header = price_header
+        # 最近一次回應解析出的頁面（parse_form_page 的結果）
+        self._page = None
+        # 送出的複價取代頁面自動計算值的項次
+        self.amount_overrides = []
+    
+    @classmethod
+    def from_browser(cls, filler: WebFormFiller, **kwargs) -> HttpFormFiller:
+        """
+        沿用已登入瀏覽器的 cookies 與 User-Agent，並開啟瀏覽器目前的網址
+        
+        Args:
+            filler: 已開啟收料頁面的 WebFormFiller
+            **kwargs: 傳給 HttpFormFiller 的其他參數
+        
+        Returns:
+            已開啟頁面的 HttpFormFiller
+        """
+        kwargs.setdefault('user_agent', filler.driver.execute_script("return navigator.userAgent"))
+        http_filler = cls(cookies=filler.get_cookies(), **kwargs)
+        http_filler.open_url(filler.driver.current_url)
+        return http_filler
+    
+    def start_browser(self):
+        """建立 HTTP 連線池並載入 cookies（對應瀏覽器版本的啟動瀏覽器），已建立時不動作"""
+        if self.session is not None:
+            return
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        self.session = requests.Session()
+        retry = Retry(total=None, connect=self.retries, read=0, status=0, other=0,
+                      redirect=5, backoff_factor=0.3)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if self.user_agent:
+            self.session.headers['User-Agent'] = self.user_agent
+        if self.cookies:
+            self.load_cookies(self.cookies)
+        logger.info("✓ HTTP 連線已建立")
+    
+    def open_url(self, url: str, wait_time: int = 10):
+        """
+        以 GET 開啟表單頁面
+        
+        Args:
+            url: 網頁 URL
+            wait_time: 等待回應的最長時間（秒）
+        
+        Raises:
+            RuntimeError: 被導向其他頁面（例如登入頁）或回應不是 WebForms 表單
+            requests.RequestException: 連線失敗或伺服器回應錯誤
+        """
+        if self.session is None:
+            self.start_browser()
+        
+        self._load(self.session.get(url, timeout=wait_time), url)
+        self._page_map = None
+        logger.info(f"✓ 已開啟網址: {url}")
+    
+    def _ensure_started(self):
+        """確認已開啟表單頁面，否則拋出 RuntimeError"""
+        if self._page is None:
+            raise RuntimeError("尚未開啟表單頁面，請先呼叫 open_url()")
+    
+    def _load(self, response: requests.Response, requested_url: str):
+        """檢查並解析回應，成為目前的頁面"""
+        if urlsplit(response.url).path != urlsplit(requested_url).path:
+            raise RuntimeError(f"被導向至 {response.url}，登入狀態可能已失效")
+        response.raise_for_status()
+        
+        page = parse_form_page(response.text, self.price_header)
+        if '__VIEWSTATE' not in page['fields']:
+            raise RuntimeError(f"{response.url} 的回應中沒有 __VIEWSTATE，不是 WebForms 表單頁面")
+        
+        page['action'] = urljoin(response.url, page['action'] or '')
+        self._page = page
+        self.invalidate_item_index()
+    
+    def _postback(self, values: Optional[dict] = None, target: str = '', argument: str = '',
+                  button: Optional[str] = None):
+        """
+        送出整個表單（含目前所有欄位與隱藏欄位），回應成為新的目前頁面
+        
+        Args:
+            values: 要修改的欄位（名稱 → 值）
+            target: __EVENTTARGET，觸發 postback 的控制項名稱
+            argument: __EVENTARGUMENT
+            button: 要按下的 submit 按鈕名稱
+        """
+        form = dict(self._page['fields'])
+        form.update(values or {})
+        form['__EVENTTARGET'] = target
+        form['__EVENTARGUMENT'] = argument
+        if button:
+            form[button] = self._page['buttons'][button]
+        
+        started = time.perf_counter()
+        settled = False
+        try:
+            with self._span('postback'):
+                response = self.session.post(self._page['action'], data=form, timeout=self.timeout)
+            self._load(response, self._page['action'])
+            settled = True
+        finally:
+            if self.throttle is not None:
+                self.throttle.observe_postback(time.perf_counter() - started, settled)
+    
+    def get_cookies(self) -> List[dict]:
+        """
+        取得目前 HTTP 工作階段的 cookies
+        
+        Returns:
+            與 WebFormFiller.get_cookies() 相同格式的 cookie 字典列表
+        """
+        if self.session is None:
+            return list(self.cookies)
+        return [{'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain,
+                 'path': cookie.path, 'secure': bool(cookie.secure)}
+                for cookie in self.session.cookies]
+    
+    def load_cookies(self, cookies: List[dict]):
+        """
+        將 cookies 加入 HTTP 工作階段（尚未建立連線時於建立時載入）
+        
+        Args:
+            cookies: WebFormFiller.get_cookies() 取得的 cookie 字典列表
+        """
+        if self.session is None:
+            self.cookies = list(cookies)
+            return
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+        logger.info(f"✓ 已載入 {len(cookies)} 個 cookies")
+    
+    def _field_name(self, index: int, kind: str) -> Optional[str]:
+        """取得第 index 列數量（Qty）或複價（Amt）欄位的表單名稱"""
+        return self._page['ids'].get(f"gvReceive_txtRecv{kind}_{index}")
+    
+    def _field_value(self, index: int, kind: str) -> Optional[str]:
+        """取得第 index 列數量（Qty）或複價（Amt）欄位目前的值，沒有此欄位時返回 None"""
+        name = self._field_name(index, kind)
+        return self._page['fields'].get(name) if name else None
+    
+    def build_item_index(self) -> dict:
+        """
+        由目前頁面的項次標籤建立「項次 → 索引」對照表
+        
+        Returns:
+            以正規化項次為鍵、網頁索引為值的字典
+        """
+        self.read_grid_values()
+        logger.debug(f"  ✓ 已建立項次索引，共 {len(self._item_index)} 筆")
+        return self._item_index
+    
+    def read_grid_values(self) -> dict:
+        """
+        讀取目前頁面表格中每列的數量與複價，並更新項次索引
+        
+        Returns:
+            正規化項次 → {'index', 'quantity', 'amount'} 的字典（數量與複價為欄位上的文字）
+        """
+        from data_pipeline import normalize_item
+        
+        values = {}
+        for index, text in self._page['items']:
+            values.setdefault(normalize_item(text), {
+                'index': index,
+                'quantity': self._field_value(index, 'Qty'),
+                'amount': self._field_value(index, 'Amt')
+            })
+        
+        self._item_index = {item: row['index'] for item, row in values.items()}
+        return values
+    
+    def discover_pager(self) -> Optional[dict]:
+        """
+        讀取目前頁面表格的分頁列
+        
+        Returns:
+            {'target': postback 目標, 'current': 目前頁碼, 'pages': 排序後的頁碼列表}，
+            表格沒有分頁時返回 None
+        """
+        pager = self._page['pager'] if self._page else None
+        if not pager:
+            return None
+        return {'target': pager['target'], 'current': pager['current'],
+                'pages': sorted(set(pager['pages']))}
+    
+    def go_to_page(self, page: int, timeout: float = 30) -> bool:
+        """
+        以 Page$N postback 切換到表格的指定分頁
+        
+        Args:
+            page: 頁碼（從 1 開始）
+            timeout: 未使用，與 WebFormFiller.go_to_page 的參數一致（逾時由 self.timeout 控制）
+        
+        Returns:
+            已在指定分頁返回 True，否則返回 False
+        """
+        if self._pager is None or page == self._current_page:
+            return page == self._current_page
+        
+        try:
+            with self._span('page_change'):
+                self._postback(target=self._pager['target'], argument=f'Page${page}')
+        except (RuntimeError, OSError) as e:
+            logger.warning(f"  ⚠ 無法切換到第 {page} 頁: {e}")
+            return False
+        
+        pager = self.discover_pager()
+        self._current_page = pager['current'] if pager else 1
+        if self._current_page != page:
+            logger.warning(f"  ⚠ 無法切換到第 {page} 頁（目前在第 {self._current_page} 頁）")
+            return False
+        logger.debug(f"  ✓ 已切換到第 {page} 頁")
+        return True
+    
+    def _fill_row(self, index: int, qty_text: str, amt_text: str) -> bool:
+        """
+        以要輸入的整數文字填入一列的數量和複價，送出一次 postback
+        
+        Returns:
+            伺服器回應的頁面上已是填入的值返回 True，否則返回 False
+        """
+        try:
+            entry = self.fill_batch([(index, qty_text, amt_text)])[0]
+        except (RuntimeError, OSError) as e:
+            logger.warning(f"    ✗ 送出表單時發生錯誤: {e}")
+            return False
+        
+        if entry['found']:
+            logger.debug(f"    ✓ 已填入數量: {entry['quantity']}，複價: {entry['amount']}")
+        return entry['found']
+    
+    def fill_batch(self, entries: List[Tuple[int, float, float]]) -> List[dict]:
+        """
+        以單一 postback 填入多列的數量與複價
+        
+        送出後以伺服器回應的頁面確認每列的值，回應中的值與送出的不同（或頁面上
+        沒有該列的欄位）時該列的 found 為 False。
+        
+        Args:
+            entries: (索引, 數量, 複價) 的列表，數量為數字或要輸入的整數文字
+        
+        Returns:
+            每列一個字典，包含 index、found、quantity、amount（回應頁面上的值）與
+            needs_manual（HTTP 模式直接送出複價，永遠為 False）與 overridden
+            （送出的是試算表的複價而非頁面自動計算的值）
+        
+        Raises:
+            RuntimeError, requests.RequestException: postback 失敗時
+        """
+        values = {}
+        sent = {}
+        overridden = set()
+        target = ''
+        for index, quantity, amount in entries:
+            qty_name, amt_name = self._field_name(index, 'Qty'), self._field_name(index, 'Amt')
+            if qty_name is None or amt_name is None:
+                continue
+            qty_text = quantity if isinstance(quantity, str) else str(int(quantity))
+            
+            # 與瀏覽器版本相同：自動計算的複價為整數時沿用，否則填入試算表的複價
+            price = self._page['prices'].get(index)
+            auto_amount = round(_to_number(qty_text) * price, 2) if price is not None else None
+            if auto_amount is not None and _is_whole_amount(str(auto_amount)):
+                amt_text = str(int(auto_amount))
+            else:
+                amt_text = str(int(_to_number(amount)))
+                overridden.add(index)
+            values[qty_name] = qty_text
+            values[amt_name] = amt_text
+            sent[index] = (_parse_number(qty_text), _parse_number(amt_text))
+            # 以複價欄位作為事件來源，與手動修改複價時觸發的 postback 相同
+            target = amt_name
+        
+        if values:
+            self._postback(values, target=target)
+        
+        labels = dict(self._page['items'])
+        self.amount_overrides.extend(labels.get(index) for index in sorted(overridden))
+        
+        results = []
+        for index, _, _ in entries:
+            qty_text = self._field_value(index, 'Qty')
+            amt_text = self._field_value(index, 'Amt')
+            found = (index in sent
+                     and (_parse_number(qty_text), _parse_number(amt_text)) == sent[index])
+            results.append({
+                'index': index,
+                'found': found,
+                'quantity': qty_text,
+                'amount': amt_text,
+                'needs_manual': False,
+                'overridden': index in overridden
+            })
+        return results
+    
+    def process_dataframe(self, df: pd.DataFrame, *args, **kwargs) -> dict:
+        """
+        與 WebFormFiller.process_dataframe 相同，另記錄複價取代自動計算值的項次
+        
+        Returns:
+            處理結果的字典，另含 'amount_overridden'：送出試算表複價的項次列表
+        """
+        self.amount_overrides = []
+        results = super().process_dataframe(df, *args, **kwargs)
+        results['amount_overridden'] = self.amount_overrides
+        if self.amount_overrides:
+            logger.warning(f"⚠ {len(self.amount_overrides)} 筆項次的複價以試算表的值取代自動計算值，"
+                           f"請於網頁上確認")
+        return results
+    
+    def submit(self, button: str) -> bool:
+        """
+        按下表單上的 submit 按鈕（例如儲存）
+        
+        Args:
+            button: 按鈕的 name 屬性
+        
+        Returns:
+            送出成功返回 True，否則返回 False
+        """
+        self._ensure_started()
+        if button not in self._page['buttons']:
+            logger.warning(f"✗ 頁面上沒有按鈕 '{button}'")
+            return False
+        
+        try:
+            self._postback(button=button)
+        except (RuntimeError, OSError) as e:
+            logger.warning(f"✗ 按下 '{button}' 時發生錯誤: {e}")
+            return False
+        logger.info(f"✓ 已按下 '{button}'")
+        return True
+    
+    def close_browser(self):
+        """關閉 HTTP 連線池"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+            self._page = None
+            logger.info("\n✓ HTTP 連線已關閉")
+
+
+def fill_web_form_over_http(df: pd.DataFrame, url: str, cookies: Optional[List[dict]] = None,
+                            delay: float = 0.0, batch_size: Optional[int] = 50,
+                            save_button: Optional[str] = None,
+                            only_changed: bool = False,
+                            compact: bool = False,
+                            adaptive: bool = False) -> dict:
+    """
+    便捷函式：不啟動瀏覽器，以 HTTP postback 從 DataFrame 填寫網頁表單
+    
+    Args:
+        df: 包含「項次」、「數量」、「複價」欄位的 DataFrame
+        url: 網頁 URL
+        cookies: 登入後的 cookies（WebFormFiller.get_cookies() 的格式）
+        delay: 每筆（批次模式為每批）之間的延遲時間（秒）
+        batch_size: 每次 postback 的筆數，None 表示每筆送出一次
+        save_button: 填寫完成後要按下的儲存按鈕 name 屬性，None 表示不按
+        only_changed: 是否只填寫網頁上數值與試算表不同的列
+        compact: 是否以精簡結構記錄失敗項目
+        adaptive: 是否依伺服器回應速度自動調整延遲（delay 為起始值）
+    
+    Returns:
+        包含處理結果的字典；指定 save_button 時另含 'saved'：是否成功按下
+    """
+    with HttpFormFiller(cookies=cookies) as filler:
+        filler.open_url(url)
+        results = filler.process_dataframe(df, delay=delay, batch_size=batch_size,
+                                           only_changed=only_changed, compact=compact,
+                                           adaptive=adaptive)
+        if save_button:
+            results['saved'] = filler.submit(save_button)
+    
+    return results
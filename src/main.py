@@ -1,14 +1,17 @@
 """主程式 - 展示如何使用 ExcelReader"""
 
 from excel_reader import ExcelReader
+from data_pipeline import CleaningSpec, compact_material_frame, memory_report
+from processed_cache import ProcessedDataCache
 from pathlib import Path
 import pandas as pd
 from datetime import datetime
+import logging
 import sys
 
 # 將專案根目錄加入路徑以便導入 config
 sys.path.append(str(Path(__file__).parent.parent))
-from config import INPUT_FILE_PATH, OUTPUT_DIR, DEFAULT_SHEET_INDEX, COLUMNS_TO_READ, COLUMN_RENAME_MAP
+from config import INPUT_FILE_PATH, OUTPUT_DIR, DEFAULT_SHEET_INDEX, COLUMNS_TO_READ, CACHE_DIR
 
 
 def save_to_excel(df, output_path, sheet_name='Sheet1'):
@@ -96,7 +99,8 @@ def main():
             print("=" * 50)
             print("工作表資訊:")
             print("=" * 50)
-            info = reader.get_sheet_info(sheet_name)
+            # 只讀取工作表範圍與標題列，不解析整張工作表
+            info = reader.get_sheet_metadata(sheet_name, null_counts=True)
             for key, value in info.items():
                 print(f"{key}: {value}")
             print()
@@ -111,30 +115,29 @@ def main():
             print(f"總列數: {len(df4)}")
             print(df4.head())
             
-            # 刪除 T 欄為空值的列
-            df4_cleaned = df4.dropna(subset=[df4.columns[1]])  # T 欄是第二欄（索引 1）
-            df4_cleaned =  df4_cleaned.iloc[2:]
-            # 刪除最後一列
-            df4_cleaned = df4_cleaned.iloc[:-1]
-            
-            # 從 config 讀取欄位名稱對應
-            df4_cleaned.columns = [COLUMN_RENAME_MAP[i] for i in range(len(df4_cleaned.columns))]
-            
-            # 排序項次（格式為 "數字-數字"）
-            # 將項次拆分為兩個數字欄位進行排序
-            df4_cleaned['sort_key1'] = df4_cleaned['項次'].astype(str).str.split('-').str[0].astype(float)
-            df4_cleaned['sort_key2'] = df4_cleaned['項次'].astype(str).str.split('-').str[1].astype(float)
-            df4_cleaned = df4_cleaned.sort_values(by=['sort_key1', 'sort_key2'])
-            # 移除排序用的輔助欄位
-            df4_cleaned = df4_cleaned.drop(columns=['sort_key1', 'sort_key2'])
-            # 重置索引
-            df4_cleaned = df4_cleaned.reset_index(drop=True)
+            # 依 config 的清理規則：刪除 T 欄空值、前兩列與最後一列，重新命名欄位並依項次排序
+            # （工作表已讀入，直接以一次遮罩與 take 完成；不需顯示原始資料時可改用
+            #   CleaningSpec.from_config().read(reader, sheet_name) 在讀取時完成篩選）
+            spec = CleaningSpec.from_config()
+            df4_cleaned = spec.clean(df4)
             
             print(f"\n刪除前兩列和 T 欄空值後的資料（已排序）:")
             print(f"總列數: {len(df4_cleaned)}")
             print(df4_cleaned.head(100))
             print()
             
+            # 同一工作表的多次讀取由快取提供，只會從磁碟解析一次
+            cache = reader.cache_info()
+            print(f"工作表快取: 命中 {cache['hits']} 次，未命中 {cache['misses']} 次")
+            print()
+            
+            # 精簡表示：項次改為類別、數量與複價依範圍縮減型別
+            print("=" * 50)
+            print("記憶體用量比較（精簡表示）:")
+            print("=" * 50)
+            print(memory_report(df4_cleaned, compact_material_frame(df4_cleaned)))
+            print()
+            
             # 7. 儲存處理後的資料到新的 Excel 檔案
             print("=" * 50)
             print("儲存處理後的資料:")
@@ -148,6 +151,12 @@ def main():
             # 儲存檔案
             save_to_excel(df4_cleaned, output_path, sheet_name='處理後資料')
             
+            # 同時存入處理後資料快取，之後的執行可直接載入而不必重新解析 Excel
+            cache = ProcessedDataCache(CACHE_DIR)
+            cache_key = cache.key(file_path, DEFAULT_SHEET_INDEX, **spec.cache_params())
+            cache.store(cache_key, df4_cleaned)
+            print(f"✓ 已更新處理後資料快取: {CACHE_DIR}")
+            
     except FileNotFoundError as e:
         print(f"錯誤: {e}")
         print("請確保 Excel 檔案存在於指定路徑")
@@ -158,4 +167,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
\ No newline at end of file
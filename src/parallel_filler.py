@@ -0,0 +1,187 @@
+"""多瀏覽器平行填寫模組"""
+
+from web_form_filler import WebFormFiller
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import logging
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def shard_by_page(df: pd.DataFrame, grid: dict, workers: int) -> List[pd.DataFrame]:
+    """
+    依項次所在的表格分頁將 DataFrame 切成區段，同一頁的項次一定在同一個區段
+    
+    各工作者只填寫並儲存自己的分頁，儲存時送出的頁面上不會有其他工作者負責的列。
+    
+    Args:
+        df: 已依項次排序的 DataFrame
+        grid: scan_pages() 的結果（正規化項次 → {'page', ...}）
+        workers: 區段數量上限（不超過分頁數）
+    
+    Returns:
+        DataFrame 區段列表（空區段會被略過），各區段索引從 0 開始；
+        表格中找不到的項次放在第一個區段，填寫時回報為未找到
+    """
+    from data_pipeline import normalize_items
+    
+    page_of = {item: row['page'] for item, row in grid.items()}
+    pages = normalize_items(df['項次']).map(page_of)
+    known = sorted(pages.dropna().unique())
+    groups = [group for group in np.array_split(np.array(known), max(1, workers)) if len(group)]
+    
+    shards = [df[pages.isin(group).to_numpy()] for group in groups] or [df.iloc[:0]]
+    shards[0] = pd.concat([shards[0], df[pages.isna().to_numpy()]]).sort_index()
+    return [shard.reset_index(drop=True) for shard in shards if len(shard)]
+
+
+def _open_with_cookies(url: str, cookies: Optional[List[dict]], headless: bool,
+                       wait_time: int) -> WebFormFiller:
+    """啟動瀏覽器並開啟網頁，載入 cookies 後重新開啟以套用登入狀態"""
+    filler = WebFormFiller(headless=headless)
+    filler.open_url(url, wait_time=wait_time)
+    if cookies:
+        # cookies 只能加入目前網域，加入後重新載入頁面以套用登入狀態
+        filler.load_cookies(cookies)
+        filler.open_url(url, wait_time=wait_time)
+    return filler
+
+
+def _run_worker(worker_id: int, shard: pd.DataFrame, url: str, cookies: Optional[List[dict]],
+                headless: bool, wait_time: int, delay: float, batch_size: Optional[int],
+                save_button_id: Optional[str], on_worker_done: Optional[Callable]) -> dict:
+    """單一工作者：啟動自己的瀏覽器，載入 cookies 後填寫分配到的分頁，每填完一頁就儲存"""
+    started = time.time()
+    filler = None
+    
+    def save_page(page: int):
+        if filler.click_and_wait(save_button_id):
+            logger.info(f"✓ 工作者 {worker_id} 已儲存第 {page} 頁")
+        else:
+            logger.warning(f"✗ 工作者 {worker_id} 儲存第 {page} 頁失敗")
+    
+    try:
+        filler = _open_with_cookies(url, cookies, headless, wait_time)
+        results = filler.process_dataframe(shard, delay=delay, batch_size=batch_size,
+                                           on_page_done=save_page if save_button_id else None)
+        
+        # 讓呼叫端在關閉瀏覽器前進行後續操作（例如點擊儲存按鈕）
+        if on_worker_done:
+            on_worker_done(worker_id, filler)
+    
+    except Exception as e:
+        logger.warning(f"✗ 工作者 {worker_id} 發生錯誤: {e}")
+        results = {
+            'total': len(shard),
+            'success': 0,
+            'failed': len(shard),
+            'not_found': 0,
+            'failed_items': [{'item': str(item).strip(), 'reason': f'工作者發生錯誤: {e}'}
+                             for item in shard['項次']]
+        }
+    
+    finally:
+        if filler is not None:
+            filler.close_browser()
+    
+    results['worker'] = worker_id
+    results['elapsed'] = time.time() - started
+    return results
+
+
+def fill_in_parallel(df: pd.DataFrame, url: str, workers: int = 2,
+                     cookies: Optional[List[dict]] = None, headless: bool = True,
+                     wait_time: int = 10, delay: float = 0.5, batch_size: Optional[int] = None,
+                     save_button_id: Optional[str] = None, grid: Optional[dict] = None,
+                     on_worker_done: Optional[Callable] = None) -> dict:
+    """
+    以多個瀏覽器平行填寫網頁表單
+    
+    先依 scan_pages 的結果把 DataFrame 依表格分頁切成最多 workers 個區段
+    （shard_by_page），每個工作者使用獨立的瀏覽器，並載入已登入瀏覽器的 cookies
+    以沿用驗證狀態。工作者每填完一頁，就在該頁按下 save_button_id 儲存；
+    送出的頁面只有這一頁的列，不會覆蓋其他工作者負責的分頁。
+    
+    表格沒有分頁時所有項次都在同一頁，只會有一個工作者。
+    
+    限制:
+      - 所有工作者共用同一組登入 cookies，也就是同一個 ASP.NET 工作階段；
+        ASP.NET 會依序處理同一工作階段的請求，postback 等待時間無法平行化，
+        主要節省的是瀏覽器端的輸入時間
+      - 未提供 save_button_id 時不會儲存，關閉瀏覽器後填寫內容即遺失
+    
+    Args:
+        df: 包含「項次」、「數量」、「複價」欄位且已依項次排序的 DataFrame
+        url: 網頁 URL
+        workers: 平行的瀏覽器數量
+        cookies: 已登入瀏覽器的 cookies（WebFormFiller.get_cookies() 的結果）
+        headless: 是否使用無頭模式
+        wait_time: 等待頁面載入的最長時間（秒）
+        delay: 每筆資料之間的延遲時間（秒）
+        batch_size: 批次模式每批的筆數，None 表示逐筆填寫
+        save_button_id: 儲存按鈕的元素 id，None 表示不儲存
+        grid: 已登入瀏覽器 scan_pages() 的結果，None 表示另開一個瀏覽器掃描
+        on_worker_done: 各工作者填寫完成後呼叫的函式，參數為 (工作者編號, WebFormFiller)
+    
+    Returns:
+        與 process_dataframe 相同格式的結果字典，另含各工作者統計的 'workers' 列表
+    """
+    if save_button_id is None:
+        logger.warning("⚠ 未提供 save_button_id：各工作者的填寫內容不會儲存，關閉瀏覽器後即遺失")
+    
+    if grid is None:
+        scanner = _open_with_cookies(url, cookies, headless, wait_time)
+        try:
+            grid = scanner.scan_pages()
+        finally:
+            scanner.close_browser()
+    
+    shards = shard_by_page(df, grid, workers)
+    
+    logger.info(f"✓ 已依表格分頁將 {len(df)} 筆資料分配給 {len(shards)} 個工作者")
+    
+    with ThreadPoolExecutor(max_workers=len(shards) or 1) as executor:
+        futures = [
+            executor.submit(_run_worker, worker_id, shard, url, cookies, headless,
+                            wait_time, delay, batch_size, save_button_id, on_worker_done)
+            for worker_id, shard in enumerate(shards)
+        ]
+        worker_results = [future.result() for future in futures]
+    
+    results = {
+        'total': len(df),
+        'success': 0,
+        'failed': 0,
+        'not_found': 0,
+        'failed_items': [],
+        'workers': []
+    }
+    
+    for shard, worker in zip(shards, worker_results):
+        for key in ('success', 'failed', 'not_found'):
+            results[key] += worker[key]
+        results['failed_items'].extend(worker['failed_items'])
+        results['workers'].append({
+            'worker': worker['worker'],
+            'first_item': str(shard['項次'].iloc[0]).strip(),
+            'last_item': str(shard['項次'].iloc[-1]).strip(),
+            'total': worker['total'],
+            'success': worker['success'],
+            'failed': worker['failed'],
+            'not_found': worker['not_found'],
+            'elapsed': worker['elapsed']
+        })
+    
+    logger.info("\n" + "=" * 50)
+    logger.info("平行處理完成！")
+    logger.info("=" * 50)
+    for worker in results['workers']:
+        logger.info(f"工作者 {worker['worker']}（{worker['first_item']} ~ {worker['last_item']}）: "
+                    f"成功 {worker['success']}/{worker['total']} 筆，耗時 {worker['elapsed']:.2f} 秒")
+    logger.info(f"總計: 成功 {results['success']} 筆，失敗 {results['failed']} 筆，"
+                f"未找到 {results['not_found']} 筆")
+    
+    return results
@@ -0,0 +1,133 @@
+"""管線化執行模組 - 瀏覽器啟動與 Excel 解析同時進行"""
+
+from web_form_filler import WebFormFiller
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundBrowser:
+    """
+    在背景執行緒啟動瀏覽器並開啟網址
+    
+    啟動 Chrome 與載入頁面大多在等待 ChromeDriver 與網路，期間主執行緒可以
+    繼續解析與清理 Excel；準備好的瀏覽器經由佇列交給主執行緒。
+    """
+    
+    def __init__(self, filler: WebFormFiller, url: str, wait_time: int = 10):
+        """
+        初始化並立即在背景開始啟動瀏覽器
+        
+        Args:
+            filler: 尚未啟動的 WebFormFiller
+            url: 要開啟的網頁 URL
+            wait_time: 等待頁面載入的最長時間（秒）
+        """
+        self.filler = filler
+        self.url = url
+        self.wait_time = wait_time
+        self.elapsed = None
+        self._ready = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._launch, name="browser-launcher", daemon=True)
+        self._thread.start()
+    
+    def _launch(self):
+        """背景執行緒：啟動瀏覽器並開啟網址，完成（或失敗）後放入佇列"""
+        started = time.perf_counter()
+        try:
+            self.filler.open_url(self.url, wait_time=self.wait_time)
+            error = None
+        except Exception as e:
+            error = e
+        self.elapsed = time.perf_counter() - started
+        self._ready.put(error)
+    
+    def wait(self, timeout: Optional[float] = None) -> WebFormFiller:
+        """
+        等待瀏覽器準備完成
+        
+        Args:
+            timeout: 最長等待時間（秒），None 表示一直等待
+        
+        Returns:
+            已開啟網址的 WebFormFiller
+        
+        Raises:
+            TimeoutError: 在時限內未準備完成
+            Exception: 背景啟動瀏覽器時發生的錯誤
+        """
+        try:
+            error = self._ready.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"瀏覽器在 {timeout} 秒內未準備完成")
+        # 放回佇列，重複呼叫 wait 時得到相同的結果
+        self._ready.put(error)
+        if error is not None:
+            raise error
+        return self.filler
+    
+    def close(self):
+        """等待背景啟動結束後關閉瀏覽器"""
+        self._thread.join()
+        self.filler.close_browser()
+
+
+def fill_web_form_pipelined(load_data: Callable[[], pd.DataFrame], url: str,
+                            headless: bool = False, wait_time: int = 10, delay: float = 0.5,
+                            batch_size: Optional[int] = None,
+                            before_fill: Optional[Callable[[WebFormFiller], None]] = None,
+                            **process_options) -> dict:
+    """
+    同時準備資料與瀏覽器，兩者都完成後立即開始填寫
+    
+    瀏覽器在背景執行緒啟動並開啟網址，主執行緒同時執行 load_data 解析與清理
+    Excel，整體等待時間為兩者中較長者，而不是兩者相加。
+    
+    Args:
+        load_data: 返回包含「項次」、「數量」、「複價」欄位 DataFrame 的函式，
+                   例如 lambda: load_material_data(...)
+        url: 網頁 URL
+        headless: 是否使用無頭模式
+        wait_time: 等待頁面載入的最長時間（秒）
+        delay: 每筆資料之間的延遲時間（秒）
+        batch_size: 批次模式每批的筆數，None 表示逐筆填寫
+        before_fill: 資料與瀏覽器都準備好後、開始填寫前呼叫的函式，參數為 WebFormFiller
+                     （例如等待使用者登入）
+        **process_options: 傳給 process_dataframe 的其他參數（journal、only_changed 等）
+    
+    Returns:
+        process_dataframe 的結果字典，另含 'pipeline'：資料準備、瀏覽器啟動的耗時（秒）
+        與資料準備完成後等待瀏覽器的時間
+    """
+    started = time.perf_counter()
+    browser = BackgroundBrowser(WebFormFiller(headless=headless), url, wait_time=wait_time)
+    
+    try:
+        df = load_data()
+        prepared = time.perf_counter() - started
+        logger.info(f"✓ 已載入 {len(df)} 筆資料（{prepared:.2f} 秒）")
+        
+        filler = browser.wait()
+        waited = time.perf_counter() - started - prepared
+        logger.info(f"✓ 瀏覽器已就緒（啟動 {browser.elapsed:.2f} 秒，"
+                    f"資料準備後再等待 {waited:.2f} 秒）")
+        
+        if before_fill:
+            before_fill(filler)
+        
+        results = filler.process_dataframe(df, delay=delay, batch_size=batch_size, **process_options)
+    finally:
+        browser.close()
+    
+    results['pipeline'] = {
+        'prepare': prepared,
+        'browser': browser.elapsed,
+        'browser_wait': waited
+    }
+    return results
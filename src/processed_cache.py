@@ -0,0 +1,162 @@
+"""處理後資料快取模組 - 以來源檔案內容雜湊為鍵，儲存為二進位欄式格式"""
+
+import hashlib
+import json
+import logging
+import pandas as pd
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from data_pipeline import normalize_items
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessedDataCache:
+    """
+    處理後 DataFrame 的磁碟快取
+    
+    快取鍵由來源檔案的內容雜湊、工作表與處理設定組成，來源檔案內容一改變，
+    舊的快取就不會再被命中。以 Feather 格式（需要 pyarrow）儲存；不使用 pickle，
+    因為快取目錄可能位於共用的文件資料夾，載入 pickle 檔等同執行其中的程式碼。
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        初始化 ProcessedDataCache
+        
+        Args:
+            cache_dir: 快取目錄，不存在時會自動建立
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 檔案大小與修改時間未變時沿用上次的雜湊，避免每次重新讀取整個來源檔案
+        self._hash_index_path = self.cache_dir / "source_hashes.json"
+    
+    def file_hash(self, path: Union[str, Path]) -> str:
+        """
+        計算檔案內容的 SHA-256 雜湊
+        
+        Args:
+            path: 檔案路徑
+        
+        Returns:
+            十六進位雜湊字串
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        signature = [stat.st_size, stat.st_mtime_ns]
+        
+        index = self._load_hash_index()
+        entry = index.get(str(path))
+        if entry and entry['signature'] == signature:
+            return entry['sha256']
+        
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        
+        index[str(path)] = {'signature': signature, 'sha256': digest.hexdigest()}
+        self._hash_index_path.write_text(json.dumps(index, ensure_ascii=False), encoding='utf-8')
+        return digest.hexdigest()
+    
+    def _load_hash_index(self) -> dict:
+        """讀取來源檔案雜湊索引，檔案損毀時視為空索引"""
+        try:
+            return json.loads(self._hash_index_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def key(self, source_path: Union[str, Path], sheet: Union[str, int], **params) -> str:
+        """
+        產生快取鍵
+        
+        Args:
+            source_path: 來源 Excel 檔案路徑
+            sheet: 工作表名稱或索引
+            **params: 影響處理結果的設定（例如 usecols、rename_map）
+        
+        Returns:
+            快取鍵字串
+        """
+        payload = json.dumps({
+            'source': self.file_hash(source_path),
+            'sheet': sheet,
+            'params': params
+        }, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+    
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / f"{key}{suffix}"
+    
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        讀取快取
+        
+        Args:
+            key: 快取鍵
+        
+        Returns:
+            快取的 DataFrame，未命中時返回 None
+        """
+        feather_path = self._path(key, '.feather')
+        if feather_path.exists():
+            return pd.read_feather(feather_path)
+        
+        return None
+    
+    def store(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        儲存快取
+        
+        項次欄位先正規化為字串：清理後的項次混有文字（"2-1"）與數字（3），
+        Arrow 無法儲存混合型別的欄位。其他欄位仍無法轉換時不儲存快取。
+        
+        Args:
+            key: 快取鍵
+            df: 要儲存的 DataFrame
+        
+        Returns:
+            實際儲存的 DataFrame（與之後從快取載入的內容相同）
+        """
+        df = df.reset_index(drop=True)
+        if '項次' in df.columns:
+            df['項次'] = normalize_items(df['項次'])
+        
+        path = self._path(key, '.feather')
+        try:
+            df.to_feather(path)
+        except (ImportError, TypeError, ValueError) as e:
+            path.unlink(missing_ok=True)
+            logger.warning(f"⚠ 無法以 Feather 格式儲存快取（{e}），本次不使用快取")
+        return df
+    
+    def load_or_build(self, source_path: Union[str, Path], sheet: Union[str, int],
+                      builder: Callable[[], pd.DataFrame], **params) -> pd.DataFrame:
+        """
+        讀取快取，未命中時呼叫 builder 產生資料並存入快取
+        
+        Args:
+            source_path: 來源 Excel 檔案路徑
+            sheet: 工作表名稱或索引
+            builder: 產生處理後 DataFrame 的函式
+            **params: 影響處理結果的設定
+        
+        Returns:
+            處理後的 DataFrame
+        """
+        key = self.key(source_path, sheet, **params)
+        
+        df = self.load(key)
+        if df is not None:
+            logger.info(f"✓ 已從快取載入處理後資料（{len(df)} 筆）")
+            return df
+        
+        return self.store(key, builder())
+    
+    def clear(self):
+        """刪除所有快取檔案"""
+        for path in self.cache_dir.iterdir():
+            if path.suffix in ('.feather', '.json'):
+                path.unlink()
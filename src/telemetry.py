@@ -0,0 +1,139 @@
+"""執行遙測模組 - 記錄每筆資料各階段的耗時"""
+
+import csv
+import json
+import time
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union
+
+
+class RunTelemetry:
+    """
+    記錄一次填寫作業中每筆資料各階段的耗時
+    
+    以三個 array 儲存（列號、階段代碼、秒數），每個 span 只佔 13 個位元組，
+    數千筆資料的完整記錄也只需數十 KB。
+    """
+    
+    # 階段代碼對應的名稱
+    PHASES = (
+        'lookup',         # 查找項次索引
+        'qty_entry',      # 填入數量
+        'readback',       # 讀取自動計算的複價
+        'amount_entry',   # 手動填入複價
+        'overlay_wait',   # 等待 please wait 遮罩消失
+        'batch_fill',     # 批次填入（一批一筆記錄）
+        'row_total',      # 每筆資料的總耗時
+        'page_change',    # 切換表格分頁（一頁一筆記錄）
+        'postback',       # HTTP 模式送出表單（一次請求一筆記錄）
+    )
+    
+    def __init__(self):
+        """初始化 RunTelemetry"""
+        self._rows = array('i')
+        self._phases = array('B')
+        self._durations = array('d')
+        self.started = time.time()
+    
+    def record(self, row: int, phase: str, seconds: float):
+        """
+        記錄一個 span
+        
+        Args:
+            row: 資料列號（從 0 開始）
+            phase: 階段名稱，須為 PHASES 之一
+            seconds: 耗時（秒）
+        """
+        self._rows.append(row)
+        self._phases.append(self.PHASES.index(phase))
+        self._durations.append(seconds)
+    
+    @contextmanager
+    def span(self, row: int, phase: str):
+        """
+        以 with 語句測量一個階段的耗時
+        
+        Args:
+            row: 資料列號
+            phase: 階段名稱
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(row, phase, time.perf_counter() - started)
+    
+    def __len__(self) -> int:
+        return len(self._durations)
+    
+    def summary(self) -> dict:
+        """
+        計算各階段的統計
+        
+        Returns:
+            以階段名稱為鍵的字典，值包含 count、total、p50、p95、max（秒）
+        """
+        import numpy as np
+        
+        phases = np.frombuffer(self._phases, dtype=np.uint8) if len(self) else np.array([], dtype=np.uint8)
+        durations = np.frombuffer(self._durations, dtype=np.float64) if len(self) else np.array([])
+        
+        result = {}
+        for code, name in enumerate(self.PHASES):
+            values = durations[phases == code]
+            if not len(values):
+                continue
+            result[name] = {
+                'count': int(len(values)),
+                'total': float(values.sum()),
+                'p50': float(np.percentile(values, 50)),
+                'p95': float(np.percentile(values, 95)),
+                'max': float(values.max())
+            }
+        return result
+    
+    def to_records(self) -> list:
+        """
+        取得所有 span
+        
+        Returns:
+            (列號, 階段名稱, 秒數) 的列表
+        """
+        return [(row, self.PHASES[phase], seconds)
+                for row, phase, seconds in zip(self._rows, self._phases, self._durations)]
+    
+    def to_json(self, path: Union[str, Path]):
+        """
+        匯出為 JSON 檔案（包含統計與所有 span）
+        
+        Args:
+            path: 輸出檔案路徑
+        """
+        payload = {
+            'started': self.started,
+            'summary': self.summary(),
+            'spans': self.to_records()
+        }
+        Path(path).write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
+    
+    def to_csv(self, path: Union[str, Path]):
+        """
+        匯出為 CSV 檔案（每個 span 一列）
+        
+        Args:
+            path: 輸出檔案路徑
+        """
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(['row', 'phase', 'seconds'])
+            writer.writerows(self.to_records())
+    
+    def format_summary(self) -> str:
+        """將統計整理為可閱讀的文字表格"""
+        lines = [f"{'階段':<14}{'次數':>6}{'總計(秒)':>10}{'p50':>8}{'p95':>8}{'max':>8}"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<14}{stats['count']:>6}{stats['total']:>10.2f}"
+                         f"{stats['p50']:>8.3f}{stats['p95']:>8.3f}{stats['max']:>8.3f}")
+        return '\n'.join(lines)
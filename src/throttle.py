@@ -0,0 +1,99 @@
+"""自適應節流模組 - 依實際的 postback 延遲調整每筆資料之間的等待時間"""
+
+import time
+
+
+class AdaptiveThrottle:
+    """
+    依伺服器回應速度調整每筆資料之間的延遲
+    
+    伺服器回應快時延遲逐次減半，直到低於 step 後歸零；postback 超過
+    target_latency、遮罩等待逾時或填寫失敗時延遲加倍（至少 step，最多
+    max_delay）。固定延遲在伺服器很快時白白等待，在伺服器忙碌時又不夠長。
+    """
+    
+    def __init__(self, initial: float = 0.5, min_delay: float = 0.0, max_delay: float = 5.0,
+                 target_latency: float = 1.0, step: float = 0.05):
+        """
+        初始化 AdaptiveThrottle
+        
+        Args:
+            initial: 起始延遲（秒）
+            min_delay: 最短延遲（秒）
+            max_delay: 最長延遲（秒）
+            target_latency: postback 超過此時間（秒）即視為伺服器變慢
+            step: 退避時的最小延遲（秒）；減速後低於此值時直接降為 min_delay
+        """
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.target_latency = target_latency
+        self.step = step
+        self.delay = min(max(initial, min_delay), max_delay)
+        
+        self.rows = 0
+        self.errors = 0
+        self.slow_postbacks = 0
+        self.postbacks = 0
+        self.postback_seconds = 0.0
+        self.slept = 0.0
+        self.peak_delay = self.delay
+        self._row_slow = False
+    
+    def observe_postback(self, seconds: float, settled: bool):
+        """
+        記錄一次 postback 的等待時間
+        
+        Args:
+            seconds: 觸發到遮罩消失的時間（秒）
+            settled: postback 是否在時限內完成
+        """
+        self.postbacks += 1
+        self.postback_seconds += seconds
+        if not settled or seconds > self.target_latency:
+            self.slow_postbacks += 1
+            self._row_slow = True
+    
+    def row_done(self, ok: bool = True):
+        """
+        一筆（或一批）資料處理完成，依結果調整延遲
+        
+        Args:
+            ok: 是否填寫成功
+        """
+        self.rows += 1
+        if not ok:
+            self.errors += 1
+        
+        if not ok or self._row_slow:
+            self.delay = min(self.max_delay, max(self.delay * 2, self.step))
+            self.peak_delay = max(self.peak_delay, self.delay)
+        else:
+            self.delay /= 2
+            if self.delay < self.step:
+                self.delay = self.min_delay
+            self.delay = max(self.delay, self.min_delay)
+        self._row_slow = False
+    
+    def wait(self):
+        """依目前的延遲等待"""
+        if self.delay > 0:
+            time.sleep(self.delay)
+            self.slept += self.delay
+    
+    def summary(self) -> dict:
+        """
+        取得節流統計
+        
+        Returns:
+            包含目前延遲、最高延遲、累計等待、postback 次數與平均延遲等的字典（秒）
+        """
+        return {
+            'delay': self.delay,
+            'peak_delay': self.peak_delay,
+            'slept': self.slept,
+            'rows': self.rows,
+            'errors': self.errors,
+            'postbacks': self.postbacks,
+            'slow_postbacks': self.slow_postbacks,
+            'mean_postback': self.postback_seconds / self.postbacks if self.postbacks else 0.0
+        }
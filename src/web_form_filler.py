@@ -1,44 +1,386 @@
-"""網頁表單自動填寫模組"""
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
+"""網頁表單自動填寫模組
+
+selenium、webdriver_manager 與 pandas 載入需要數百毫秒，改在第一次使用時才匯入，
+只匯入本模組（例如只執行 Excel 步驟或 --help）時不會載入這些套件。
+"""
+
+from __future__ import annotations
+
+from fill_journal import FillJournal
+from telemetry import RunTelemetry
+from throttle import AdaptiveThrottle
+from contextlib import nullcontext
+import json
+import logging
 import time
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, List, Tuple, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from selenium.webdriver.chrome.service import Service
+
+logger = logging.getLogger(__name__)
+
+
+# ChromeDriver 路徑的磁碟快取，避免每次啟動都查詢版本或下載
+DRIVER_CACHE_FILE = Path.home() / ".cache" / "mrs" / "chromedriver.json"
+
+# 快取的 ChromeDriver 路徑在此時間內直接使用，不再向網路查詢（秒）
+DRIVER_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+# 一次取得表格中所有項次標籤的 (索引, 文字)，並在第一個標籤上留下標記
+# 若表格被 postback 重新產生，標記會隨舊元素一起消失
+_ITEM_INDEX_SCRIPT = """
+var prefix = 'gvReceive_lblItem_';
+var nodes = document.querySelectorAll('[id^="' + prefix + '"]');
+var items = [];
+for (var i = 0; i < nodes.length; i++) {
+    var index = parseInt(nodes[i].id.substring(prefix.length), 10);
+    if (!isNaN(index)) {
+        items.push([index, (nodes[i].textContent || '').trim()]);
+    }
+}
+if (nodes.length) {
+    nodes[0].setAttribute('data-mrs-indexed', '1');
+}
+return items;
+"""
+
+# 檢查項次標籤上的標記是否仍在（不在代表表格已重新產生）
+_ITEM_INDEX_STALE_SCRIPT = """
+var node = document.querySelector('[id^="gvReceive_lblItem_"]');
+return !node || node.getAttribute('data-mrs-indexed') !== '1';
+"""
+
+
+# 一次填入多列數量：設定值後觸發頁面自動計算所監聽的事件，並回讀數量與複價
+_BATCH_FILL_SCRIPT = """
+var entries = arguments[0];
+var results = [];
+function fire(element, type) {
+    element.dispatchEvent(new Event(type, {bubbles: true}));
+}
+for (var i = 0; i < entries.length; i++) {
+    var index = entries[i][0];
+    var qty = document.getElementById('gvReceive_txtRecvQty_' + index);
+    var amt = document.getElementById('gvReceive_txtRecvAmt_' + index);
+    if (!qty || !amt) {
+        results.push([index, null, null]);
+        continue;
+    }
+    qty.focus();
+    qty.value = entries[i][1];
+    fire(qty, 'input');
+    fire(qty, 'keyup');
+    fire(qty, 'change');
+    fire(qty, 'blur');
+    results.push([index, qty.value, amt.value]);
+}
+return results;
+"""
+
+
+# 一次讀取表格中每列的 (索引, 項次, 數量, 複價)
+_GRID_VALUES_SCRIPT = """
+var prefix = 'gvReceive_lblItem_';
+var nodes = document.querySelectorAll('[id^="' + prefix + '"]');
+var rows = [];
+for (var i = 0; i < nodes.length; i++) {
+    var index = nodes[i].id.substring(prefix.length);
+    var qty = document.getElementById('gvReceive_txtRecvQty_' + index);
+    var amt = document.getElementById('gvReceive_txtRecvAmt_' + index);
+    rows.push([parseInt(index, 10), (nodes[i].textContent || '').trim(),
+               qty ? qty.value : null, amt ? amt.value : null]);
+}
+return rows;
+"""
+
+# 讀取 GridView 分頁列：postback 目標、目前頁碼與分頁連結上的所有頁碼
+# 分頁連結為 javascript:__doPostBack('gvReceive','Page$N')；只有一頁時 GridView 不顯示分頁列
+_PAGER_SCRIPT = """
+var grid = document.getElementById('gvReceive') || document;
+var links = grid.querySelectorAll('a[href*="Page$"]');
+var pattern = /__doPostBack\\('([^']*)','Page\\$(\\d+)'\\)/;
+var target = null, pages = [], pagerRow = null;
+for (var i = 0; i < links.length; i++) {
+    var match = pattern.exec(decodeURIComponent(links[i].getAttribute('href') || ''));
+    if (!match) continue;
+    target = target || match[1];
+    pagerRow = pagerRow || links[i].closest('tr') || links[i].parentNode;
+    pages.push(parseInt(match[2], 10));
+}
+if (!target) return null;
+var current = null;
+var spans = pagerRow.querySelectorAll('span');
+for (var j = 0; j < spans.length && current === null; j++) {
+    var text = (spans[j].textContent || '').trim();
+    if (/^\\d+$/.test(text)) current = parseInt(text, 10);
+}
+if (current === null) current = 1;
+pages.push(current);
+return {target: target, current: current, pages: pages};
+"""
+
+# 觸發 GridView 換頁的 postback
+_PAGE_POSTBACK_SCRIPT = """
+__doPostBack(arguments[0], arguments[1]);
+"""
+
+# please wait 遮罩的預設 CSS 選擇器（ASP.NET UpdateProgress 與 ModalPopup 常見樣式）
+DEFAULT_OVERLAY_SELECTOR = (
+    '[id*="UpdateProgress"], .modalBackground, [id*="wait" i], [id*="loading" i]'
+)
+
+# 頁面上沒有符合選擇器的元素時，改以文字找出遮罩：文字含 wait 或 loading 的元素（不分大小寫）。
+# 只在安裝監聽時（每次載入頁面一次）查詢並記住找到的元素，輪詢時只檢查這些元素是否可見
+_OVERLAY_TEXT_XPATH = (
+    "//*[contains(translate(text(), 'PLEASEWAIT', 'pleasewait'), 'wait')"
+    " or contains(translate(text(), 'LOADING', 'loading'), 'loading')]"
+)
+
+# 安裝 postback 監聽：記錄 PageRequestManager 的開始/結束次數與最後一次 DOM 變動時間，
+# 選擇器找不到遮罩元素時以文字找出一次並記住
+_WAIT_HOOK_SCRIPT = """
+if (!window.__mrsWait) {
+    var state = {begun: 0, ended: 0, lastMutation: Date.now(), textOverlays: []};
+    window.__mrsWait = state;
+    if (!document.querySelector(arguments[0])) {
+        var found = document.evaluate(arguments[1], document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var node = found.snapshotItem(i);
+            if (node.tagName !== 'SCRIPT' && node.tagName !== 'STYLE') {
+                state.textOverlays.push(node);
+            }
+        }
+    }
+    try {
+        var prm = Sys.WebForms.PageRequestManager.getInstance();
+        prm.add_beginRequest(function () { state.begun++; });
+        prm.add_endRequest(function () {
+            state.ended++;
+            state.lastMutation = Date.now();
+        });
+    } catch (e) {}
+    if (window.MutationObserver && document.body) {
+        new MutationObserver(function () { state.lastMutation = Date.now(); }).observe(
+            document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+    }
+}
+return window.__mrsWait.begun;
+"""
+
+# 讀取目前的 postback 狀態與遮罩是否可見（符合選擇器的元素與安裝監聽時以文字找到的元素）
+_WAIT_STATE_SCRIPT = """
+var state = window.__mrsWait;
+function visible(node) {
+    var style = window.getComputedStyle(node);
+    return node.getClientRects().length > 0
+        && style.display !== 'none' && style.visibility !== 'hidden';
+}
+var overlay = false;
+var nodes = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < nodes.length && !overlay; i++) {
+    overlay = visible(nodes[i]);
+}
+var textOverlays = state ? state.textOverlays : [];
+for (var j = 0; j < textOverlays.length && !overlay; j++) {
+    overlay = visible(textOverlays[j]);
+}
+var inAsync = false;
+try {
+    inAsync = Sys.WebForms.PageRequestManager.getInstance().get_isInAsyncPostBack();
+} catch (e) {}
+return {
+    hooked: !!state,
+    ready: document.readyState === 'complete',
+    begun: state ? state.begun : 0,
+    ended: state ? state.ended : 0,
+    inAsync: inAsync,
+    overlay: overlay,
+    quiet: state ? Date.now() - state.lastMutation : 0
+};
+"""
+
+
+def _to_number(value) -> float:
+    """
+    將儲存格的值轉換為浮點數，移除千分位逗號與空白
+    
+    Raises:
+        ValueError, TypeError: 無法轉換為數字時
+    """
+    if isinstance(value, str):
+        value = value.replace(',', '').strip()
+    return float(value)
+
+
+def _parse_number(text) -> Optional[float]:
+    """將網頁欄位的文字轉換為數字（忽略千分位逗號），空白或無法解析時返回 None"""
+    try:
+        return _to_number(text) if text not in (None, '') else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _is_whole_amount(text) -> bool:
+    """判斷網頁自動計算的複價是否為整數（小數點後全為 0）"""
+    try:
+        value = float(text.replace(',', '').strip()) if text else 0
+    except (ValueError, AttributeError):
+        return False
+    return value == int(value)
+
+
+def _resolve_driver_path(refresh: bool = False) -> Optional[str]:
+    """
+    取得 ChromeDriver 路徑，優先使用磁碟快取
+    
+    快取在 DRIVER_CACHE_MAX_AGE 內直接使用；過期或 refresh 時經由
+    ChromeDriverManager 重新解析。無法連線時退回快取的路徑，
+    連快取都沒有則返回 None，交由 Selenium Manager 尋找。
+    
+    Args:
+        refresh: 是否忽略快取重新解析
+    
+    Returns:
+        ChromeDriver 執行檔路徑，或 None
+    """
+    cached = None
+    age = None
+    try:
+        cached = json.loads(DRIVER_CACHE_FILE.read_text(encoding='utf-8'))
+        if not Path(cached['path']).exists():
+            cached = None
+        else:
+            age = time.time() - float(cached.get('resolved_at', 0))
+    except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+        cached = None
+    
+    if cached and not refresh and age < DRIVER_CACHE_MAX_AGE:
+        return cached['path']
+    
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    try:
+        path = ChromeDriverManager().install()
+    except Exception as e:
+        if cached:
+            logger.warning(f"⚠ 無法更新 ChromeDriver（{e}），使用快取的版本")
+            return cached['path']
+        logger.warning(f"⚠ 無法取得 ChromeDriver（{e}），改由 Selenium Manager 尋找")
+        return None
+    
+    try:
+        DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_CACHE_FILE.write_text(json.dumps({'path': path, 'resolved_at': time.time()}),
+                                     encoding='utf-8')
+    except OSError:
+        pass
+    return path
+
+
+def _chrome_service(driver_path: Optional[str]) -> Service:
+    """建立 ChromeDriver 服務（路徑為 None 時由 Selenium Manager 尋找）"""
+    from selenium.webdriver.chrome.service import Service
+    
+    return Service(driver_path) if driver_path else Service()
+
+
+class FillRecord:
+    """
+    精簡模式下的單筆失敗紀錄
+    
+    以 __slots__ 取代每筆一個字典，並支援 record['item'] 的存取方式，
+    讀取 results['failed_items'] 的程式不需修改。
+    """
+    
+    __slots__ = ('item', 'reason')
+    
+    def __init__(self, item: str, reason: str):
+        self.item = item
+        self.reason = reason
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+    
+    def keys(self):
+        return self.__slots__
+    
+    def __repr__(self):
+        return f"FillRecord(item={self.item!r}, reason={self.reason!r})"
 
 
 class WebFormFiller:
     """自動填寫網頁表單的類別"""
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, overlay_selector: str = DEFAULT_OVERLAY_SELECTOR,
+                 debugger_address: Optional[str] = None,
+                 user_data_dir: Optional[Union[str, Path]] = None):
         """
         初始化 WebFormFiller
         
         Args:
             headless: 是否使用無頭模式（不顯示瀏覽器視窗）
+            overlay_selector: please wait 遮罩元素的 CSS 選擇器（頁面上沒有符合的元素時改以文字找出遮罩）
+            debugger_address: 連接已在執行的 Chrome（以 --remote-debugging-port 啟動），
+                              例如 "127.0.0.1:9222"；連接時沿用該瀏覽器的登入狀態，
+                              關閉時也不會關掉該瀏覽器
+            user_data_dir: Chrome 使用者資料目錄，保留 cookies 與登入狀態供下次執行使用
         """
         self.driver = None
         self.headless = headless
+        self.overlay_selector = overlay_selector
+        self.debugger_address = debugger_address
+        self.user_data_dir = user_data_dir
+        # 項次 → 網頁索引的對照表，於第一次查找時建立
+        self._item_index = None
+        # 最近一次 process_dataframe 的各階段耗時記錄
+        self.telemetry = None
+        self._current_row = 0
+        self._journal = None
+        self._compact = False
+        # 自適應節流（process_dataframe 的 adaptive=True 時建立）
+        self.throttle = None
+        # 表格分頁狀態：分頁列資訊（未分頁為 None）、目前頁碼與跨頁的「項次 → (頁碼, 索引)」對照表
+        self._pager = None
+        self._current_page = 1
+        self._page_map = None
     
     def start_browser(self):
-        """啟動瀏覽器"""
+        """啟動瀏覽器，或連接到 debugger_address 指定的已執行瀏覽器"""
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException
+        
         options = webdriver.ChromeOptions()
-        if self.headless:
-            options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
+        if self.debugger_address:
+            options.debugger_address = self.debugger_address
+        else:
+            if self.headless:
+                options.add_argument('--headless')
+            if self.user_data_dir:
+                options.add_argument(f'--user-data-dir={self.user_data_dir}')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+        
+        driver_path = _resolve_driver_path()
+        try:
+            self.driver = webdriver.Chrome(service=_chrome_service(driver_path), options=options)
+        except SessionNotCreatedException:
+            # Chrome 更新後快取的 ChromeDriver 版本可能不符，重新解析一次
+            driver_path = _resolve_driver_path(refresh=True)
+            self.driver = webdriver.Chrome(service=_chrome_service(driver_path), options=options)
         
-        # 自動下載並使用最新的 ChromeDriver
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
-        print("✓ 瀏覽器已啟動")
+        if self.debugger_address:
+            logger.info(f"✓ 已連接到執行中的瀏覽器: {self.debugger_address}")
+        else:
+            logger.info("✓ 瀏覽器已啟動")
     
     def open_url(self, url: str, wait_time: int = 10):
         """
@@ -46,16 +388,263 @@ class WebFormFiller:
         
         Args:
             url: 網頁 URL
-            wait_time: 等待頁面載入的時間（秒）
+            wait_time: 等待頁面載入的最長時間（秒）
         """
         if not self.driver:
             self.start_browser()
         
         self.driver.get(url)
-        print(f"✓ 已開啟網址: {url}")
+        self.invalidate_item_index()
+        self._page_map = None
+        logger.info(f"✓ 已開啟網址: {url}")
         
-        # 等待頁面載入
-        time.sleep(wait_time)
+        # 等待頁面載入完成（載入完成即返回，不再固定等待）
+        self.wait_for_page_load(timeout=wait_time)
+    
+    def wait_for_page_load(self, timeout: float = 10) -> bool:
+        """
+        等待 document.readyState 為 complete，並安裝 postback 監聽
+        
+        Args:
+            timeout: 最長等待時間（秒）
+        
+        Returns:
+            頁面在時限內載入完成返回 True，否則返回 False
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            logger.warning(f"⚠ 等待頁面載入超時（{timeout} 秒），繼續執行")
+            return False
+        
+        self._install_wait_hooks()
+        return True
+    
+    def _install_wait_hooks(self) -> int:
+        """
+        在頁面上安裝 PageRequestManager 與 MutationObserver 監聽
+        
+        Returns:
+            目前已開始的非同步 postback 次數，作為 wait_for_postback 的起點
+        """
+        from selenium.common.exceptions import WebDriverException
+        
+        try:
+            return int(self.driver.execute_script(_WAIT_HOOK_SCRIPT, self.overlay_selector,
+                                                  _OVERLAY_TEXT_XPATH) or 0)
+        except WebDriverException:
+            return 0
+    
+    def wait_for_postback(self, since: int, timeout: float = 30,
+                          quiet: float = 0.2, start_grace: float = 0.3) -> bool:
+        """
+        等待觸發的 postback 完成（please wait 遮罩消失）
+        
+        頁面使用 ASP.NET AJAX 時，以 PageRequestManager 的 beginRequest/endRequest
+        計數判斷：觀察到新的 postback 結束即返回。無法取得 PageRequestManager 時，
+        改為等待遮罩元素不可見且 DOM 在 quiet 秒內沒有變動。
+        
+        Args:
+            since: 觸發前由 _install_wait_hooks 取得的 postback 次數
+            timeout: 最長等待時間（秒）
+            quiet: 未觀察到 postback 時，DOM 需保持靜止的時間（秒）
+            start_grace: 未觀察到 postback 時，至少等待的時間（秒）
+        
+        Returns:
+            postback 在時限內完成返回 True，超時返回 False
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
+        started = time.time()
+        
+        def settled(driver):
+            state = driver.execute_script(_WAIT_STATE_SCRIPT, self.overlay_selector)
+            if not state['ready'] or state['overlay']:
+                return False
+            if not state['hooked']:
+                # 整頁 postback 後舊頁面的監聽已消失，新頁面載入完成即可
+                self._install_wait_hooks()
+                return True
+            if state['inAsync'] or state['ended'] < state['begun']:
+                return False
+            if state['begun'] > since:
+                return True
+            # 尚未觀察到 postback：等待寬限期過後且 DOM 保持靜止
+            return (time.time() - started >= start_grace
+                    and state['quiet'] >= quiet * 1000)
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05,
+                          ignored_exceptions=(WebDriverException,)).until(settled)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _enter_amount_manually(self, amt_element, amt_text: str):
+        """手動填入複價（要輸入的整數文字），並等待頁面的 postback 處理完成"""
+        from selenium.webdriver.common.keys import Keys
+        
+        with self._span('amount_entry'):
+            since = self._install_wait_hooks()
+            
+            amt_element.clear()
+            amt_element.send_keys(amt_text)
+            logger.debug(f"    ✓ 已手動填入複價: {amt_text}")
+            amt_element.send_keys(Keys.TAB)
+        
+        # 等待 please wait 遮罩消失
+        logger.debug(f"    ⏳ 等待頁面處理中...")
+        wait_started = time.perf_counter()
+        with self._span('overlay_wait'):
+            settled = self.wait_for_postback(since)
+        if self.throttle is not None:
+            self.throttle.observe_postback(time.perf_counter() - wait_started, settled)
+        if settled:
+            logger.debug(f"    ✓ 頁面反應完成")
+        else:
+            logger.warning(f"    ⚠ 等待頁面反應超時，繼續執行")
+    
+    def click_and_wait(self, element_id: str, timeout: float = 30) -> bool:
+        """
+        點擊按鈕（例如儲存）並等待其觸發的 postback 完成
+        
+        Args:
+            element_id: 按鈕的元素 id
+            timeout: 等待 postback 的最長時間（秒）
+        
+        Returns:
+            點擊後 postback 在時限內完成返回 True，找不到按鈕或超時返回 False
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import WebDriverException
+        
+        since = self._install_wait_hooks()
+        try:
+            self.driver.find_element(By.ID, element_id).click()
+        except WebDriverException as e:
+            logger.warning(f"✗ 無法點擊 '{element_id}': {e}")
+            return False
+        
+        if not self.wait_for_postback(since, timeout=timeout):
+            logger.warning(f"⚠ 點擊 '{element_id}' 後等待頁面反應超時")
+            return False
+        self.invalidate_item_index()
+        # postback 後表格可能回到其他分頁
+        if self._pager:
+            pager = self.discover_pager()
+            self._current_page = pager['current'] if pager else 1
+        return True
+    
+    def _ensure_started(self):
+        """確認瀏覽器已啟動，否則拋出 RuntimeError"""
+        if not self.driver:
+            raise RuntimeError("瀏覽器尚未啟動，請先呼叫 start_browser() 或 open_url()")
+    
+    def _pause(self, delay: float, ok: bool = True):
+        """每筆（或每批）之間的延遲：啟用自適應節流時依回應速度調整，否則固定等待 delay 秒"""
+        if self.throttle is None:
+            time.sleep(delay)
+            return
+        self.throttle.row_done(ok)
+        self.throttle.wait()
+    
+    def _span(self, phase: str):
+        """測量目前資料列某個階段的耗時（未在 process_dataframe 中時不記錄）"""
+        if self.telemetry is None:
+            return nullcontext()
+        return self.telemetry.span(self._current_row, phase)
+    
+    def get_cookies(self) -> List[dict]:
+        """
+        取得目前瀏覽器的 cookies（例如登入後的驗證 cookies）
+        
+        Returns:
+            Selenium 格式的 cookie 字典列表
+        """
+        return self.driver.get_cookies()
+    
+    def load_cookies(self, cookies: List[dict]):
+        """
+        將 cookies 加入目前瀏覽器，需先開啟同網域的網頁
+        
+        Args:
+            cookies: get_cookies() 取得的 cookie 字典列表
+        """
+        from selenium.common.exceptions import WebDriverException
+        
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException as e:
+                logger.warning(f"⚠ 無法加入 cookie '{cookie.get('name')}': {e}")
+        logger.info(f"✓ 已載入 {len(cookies)} 個 cookies")
+    
+    def build_item_index(self) -> dict:
+        """
+        一次讀取網頁上所有 gvReceive_lblItem_* 的項次，建立「項次 → 索引」對照表
+        
+        以單一 execute_script 呼叫取得整個表格的項次，取代逐一 find_element 的查找。
+        對照表會保留至頁面重新載入或表格被 postback 重新產生為止。
+        
+        Returns:
+            以正規化項次為鍵、網頁索引為值的字典
+        """
+        from data_pipeline import normalize_item
+        
+        entries = self.driver.execute_script(_ITEM_INDEX_SCRIPT) or []
+        
+        index_map = {}
+        for index, text in entries:
+            # 同一項次重複出現時保留第一筆，與逐列查找的結果一致
+            index_map.setdefault(normalize_item(text), int(index))
+        
+        self._item_index = index_map
+        logger.debug(f"  ✓ 已建立項次索引，共 {len(index_map)} 筆")
+        return index_map
+    
+    def read_grid_values(self) -> dict:
+        """
+        以單一 execute_script 呼叫讀取表格中每列目前的數量與複價
+        
+        同時以讀到的項次更新項次索引。
+        
+        Returns:
+            正規化項次 → {'index', 'quantity', 'amount'} 的字典（數量與複價為欄位上的文字）
+        """
+        from data_pipeline import normalize_item
+        
+        rows = self.driver.execute_script(_GRID_VALUES_SCRIPT) or []
+        
+        values = {}
+        for index, text, quantity, amount in rows:
+            values.setdefault(normalize_item(text), {
+                'index': int(index),
+                'quantity': quantity,
+                'amount': amount
+            })
+        
+        self._item_index = {item: row['index'] for item, row in values.items()}
+        return values
+    
+    def invalidate_item_index(self):
+        """清除項次索引，下次查找時重新建立"""
+        self._item_index = None
+    
+    def _refresh_item_index_if_stale(self):
+        """檢查表格是否已被 postback 重新產生，若是則清除項次索引"""
+        if self._item_index is None:
+            return
+        try:
+            if self.driver.execute_script(_ITEM_INDEX_STALE_SCRIPT):
+                self.invalidate_item_index()
+        except Exception:
+            self.invalidate_item_index()
     
     def find_item_index(self, item_value: str) -> Optional[int]:
         """
@@ -67,39 +656,105 @@ class WebFormFiller:
         Returns:
             找到的索引，若未找到則返回 None
         """
+        from data_pipeline import normalize_item
+        
         try:
-            # 移除項次值的空白
-            item_value = str(item_value).strip()
+            item_value = normalize_item(item_value)
             
-            # 嘗試查找所有可能的 gvReceive_lblItem 元素
-            index = 0
-            while True:
-                try:
-                    element_id = f"gvReceive_lblItem_{index}"
-                    element = self.driver.find_element(By.ID, element_id)
-                    element_text = element.text.strip()
-                    
-                    if element_text == item_value:
-                        print(f"  ✓ 找到項次 '{item_value}' 在索引 {index}")
-                        return index
-                    
-                    index += 1
-                    
-                    # 設定最大搜尋範圍避免無限循環
-                    if index > 1000:
-                        break
-                        
-                except NoSuchElementException:
-                    # 沒有更多元素了
-                    break
+            if self._item_index is None:
+                self.build_item_index()
             
-            print(f"  ✗ 未找到項次 '{item_value}'")
+            index = self._item_index.get(item_value)
+            if index is not None:
+                logger.debug(f"  ✓ 找到項次 '{item_value}' 在索引 {index}")
+                return index
+            
+            logger.warning(f"  ✗ 未找到項次 '{item_value}'")
             return None
             
         except Exception as e:
-            print(f"  ✗ 查找項次時發生錯誤: {e}")
+            logger.warning(f"  ✗ 查找項次時發生錯誤: {e}")
             return None
     
+    def discover_pager(self) -> Optional[dict]:
+        """
+        讀取表格的分頁列
+        
+        Returns:
+            {'target': postback 目標, 'current': 目前頁碼, 'pages': 排序後的頁碼列表}，
+            表格沒有分頁時返回 None
+        """
+        pager = self.driver.execute_script(_PAGER_SCRIPT)
+        if not pager:
+            return None
+        pager['pages'] = sorted(set(int(page) for page in pager['pages']))
+        pager['current'] = int(pager['current'])
+        return pager
+    
+    def go_to_page(self, page: int, timeout: float = 30) -> bool:
+        """
+        切換到表格的指定分頁，並等待 postback 完成
+        
+        Args:
+            page: 頁碼（從 1 開始）
+            timeout: 等待 postback 的最長時間（秒）
+        
+        Returns:
+            已在指定分頁返回 True，否則返回 False
+        """
+        if self._pager is None or page == self._current_page:
+            return page == self._current_page
+        
+        since = self._install_wait_hooks()
+        with self._span('page_change'):
+            self.driver.execute_script(_PAGE_POSTBACK_SCRIPT, self._pager['target'], f'Page${page}')
+            self.wait_for_postback(since, timeout=timeout)
+        self.invalidate_item_index()
+        
+        pager = self.discover_pager()
+        self._current_page = pager['current'] if pager else 1
+        if self._current_page != page:
+            logger.warning(f"  ⚠ 無法切換到第 {page} 頁（目前在第 {self._current_page} 頁）")
+            return False
+        logger.debug(f"  ✓ 已切換到第 {page} 頁")
+        return True
+    
+    def scan_pages(self) -> dict:
+        """
+        走訪表格的每一頁，各讀取一次數量與複價，建立跨頁的「項次 → (頁碼, 索引)」對照表
+        
+        從目前頁開始，再依頁碼順序走訪其餘各頁；分頁列只顯示部分頁碼時（例如 "..."），
+        每到一頁都會加入新出現的頁碼。表格沒有分頁時只讀取目前頁面。
+        
+        Returns:
+            正規化項次 → {'page', 'index', 'quantity', 'amount'} 的字典；
+            同一項次出現在多頁時保留第一筆
+        """
+        self._pager = self.discover_pager()
+        self._current_page = self._pager['current'] if self._pager else 1
+        
+        values = {}
+        pending = [self._current_page]
+        seen = {self._current_page}
+        while pending:
+            page = pending.pop(0)
+            if not self.go_to_page(page):
+                continue
+            
+            for item, row in self.read_grid_values().items():
+                row['page'] = page
+                values.setdefault(item, row)
+            
+            pager = self.discover_pager() if self._pager else None
+            if pager:
+                pending = sorted(set(pending) | (set(pager['pages']) - seen))
+                seen.update(pager['pages'])
+        
+        self._page_map = {item: (row['page'], row['index']) for item, row in values.items()}
+        if self._pager:
+            logger.info(f"✓ 已掃描表格 {len(seen)} 頁，共 {len(values)} 個項次")
+        return values
+    
     def fill_quantity_and_amount(self, index: int, quantity: float, amount: float) -> bool:
         """
         填入數量和複價
@@ -112,215 +767,449 @@ class WebFormFiller:
         Returns:
             填寫成功返回 True，失敗返回 False
         """
+        # 轉換為數字格式，移除千分位逗號等，輸入純數字的整數文字
+        try:
+            qty_text = str(int(_to_number(quantity)))
+            amt_text = str(int(_to_number(amount)))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"    ✗ 數值轉換錯誤: {e}")
+            return False
+        
+        return self._fill_row(index, qty_text, amt_text)
+    
+    def _fill_row(self, index: int, qty_text: str, amt_text: str) -> bool:
+        """
+        以要輸入的整數文字（prepare_fill_data 的 qty_text、amt_text）填入一列的數量和複價
+        
+        Returns:
+            填寫成功返回 True，失敗返回 False
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        
         try:
-            # 轉換為數字格式，移除千分位逗號等
-            try:
-                # 如果是字串，先移除逗號和空白
-                if isinstance(quantity, str):
-                    quantity = quantity.replace(',', '').strip()
-                quantity_value = float(quantity)
-                
-                if isinstance(amount, str):
-                    amount = amount.replace(',', '').strip()
-                amount_value = float(amount)
-            except (ValueError, TypeError) as e:
-                print(f"    ✗ 數值轉換錯誤: {e}")
-                return False
-            
             # 填入數量
-            qty_element_id = f"gvReceive_txtRecvQty_{index}"
-            qty_element = self.driver.find_element(By.ID, qty_element_id)
-            qty_element.clear()
-            # 使用純數字格式（不含千分位逗號）
-            qty_element.send_keys(str(int(quantity_value)))
-            print(f"    ✓ 已填入數量: {int(quantity_value)}")
-            
-            # 模擬按下 Tab 鍵
-            qty_element.send_keys(Keys.TAB)
-            time.sleep(0.1)  # 等待頁面自動計算複價
+            with self._span('qty_entry'):
+                qty_element_id = f"gvReceive_txtRecvQty_{index}"
+                qty_element = self.driver.find_element(By.ID, qty_element_id)
+                qty_element.clear()
+                qty_element.send_keys(qty_text)
+                logger.debug(f"    ✓ 已填入數量: {qty_text}")
+                
+                # 模擬按下 Tab 鍵
+                qty_element.send_keys(Keys.TAB)
+                time.sleep(0.1)  # 等待頁面自動計算複價
             
             # 讀取自動計算的複價值
-            amt_element_id = f"gvReceive_txtRecvAmt_{index}"
-            amt_element = self.driver.find_element(By.ID, amt_element_id)
-            auto_calculated_value = amt_element.get_attribute('value')
+            with self._span('readback'):
+                amt_element_id = f"gvReceive_txtRecvAmt_{index}"
+                amt_element = self.driver.find_element(By.ID, amt_element_id)
+                auto_calculated_value = amt_element.get_attribute('value')
             
             # 判斷是否需要手動填入複價
-            try:
-                # 將自動計算的值轉換為浮點數
-                auto_value_float = float(auto_calculated_value.replace(',', '').strip()) if auto_calculated_value else 0
-                
-                # 檢查小數點後是否全為 0
-                if auto_value_float == int(auto_value_float):
-                    # 小數點後全為 0，直接按 Tab
-                    print(f"    ✓ 複價已自動計算: {int(auto_value_float)}")
-                    amt_element.send_keys(Keys.TAB)
-                else:
-                    # 小數點後不為 0，需要手動填入
-                    amt_element.clear()
-                    amt_element.send_keys(str(int(amount_value)))
-                    print(f"    ✓ 已手動填入複價: {int(amount_value)}")
-                    amt_element.send_keys(Keys.TAB)
-                    
-                    # 等待 please wait 遮罩消失
-                    print(f"    ⏳ 等待頁面處理中...")
-                    time.sleep(0.3)  # 先等待 0.3 秒讓 please wait 出現
-                    
-                    # 嘗試檢查常見的 loading/please wait 元素
-                    max_wait = 30
-                    start_time = time.time()
-                    
-                    while time.time() - start_time < max_wait:
-                        try:
-                            # 檢查是否有包含 "wait" 或 "loading" 文字的可見元素
-                            loading_elements = self.driver.find_elements(By.XPATH, 
-                                "//*[contains(translate(text(), 'PLEASEWAIT', 'pleasewait'), 'wait') or contains(translate(text(), 'LOADING', 'loading'), 'loading')]")
-                            
-                            # 過濾出可見的元素
-                            visible_loading = [elem for elem in loading_elements if elem.is_displayed()]
-                            
-                            if not visible_loading:
-                                # 沒有可見的 loading 元素，再等待 1 秒確認
-                                time.sleep(1)
-                                loading_elements = self.driver.find_elements(By.XPATH, 
-                                    "//*[contains(translate(text(), 'PLEASEWAIT', 'pleasewait'), 'wait') or contains(translate(text(), 'LOADING', 'loading'), 'loading')]")
-                                visible_loading = [elem for elem in loading_elements if elem.is_displayed()]
-                                
-                                if not visible_loading:
-                                    print(f"    ✓ 頁面反應完成")
-                                    break
-                        except:
-                            pass
-                        
-                        time.sleep(0.1)
-                    else:
-                        print(f"    ⚠ 等待頁面反應超時，繼續執行")
-                    
-            except (ValueError, AttributeError):
-                # 如果無法解析，則手動填入
-                amt_element.clear()
-                amt_element.send_keys(str(int(amount_value)))
-                print(f"    ✓ 已手動填入複價: {int(amount_value)}")
+            if _is_whole_amount(auto_calculated_value):
+                # 小數點後全為 0，直接按 Tab
+                logger.debug(f"    ✓ 複價已自動計算: {auto_calculated_value}")
                 amt_element.send_keys(Keys.TAB)
-                
-                # 等待頁面反應
-                print(f"    ⏳ 等待頁面處理中...")
-                time.sleep(1)
-                
-                max_wait = 30
-                start_time = time.time()
-                
-                while time.time() - start_time < max_wait:
-                    try:
-                        loading_elements = self.driver.find_elements(By.XPATH, 
-                            "//*[contains(translate(text(), 'PLEASEWAIT', 'pleasewait'), 'wait') or contains(translate(text(), 'LOADING', 'loading'), 'loading')]")
-                        visible_loading = [elem for elem in loading_elements if elem.is_displayed()]
-                        
-                        if not visible_loading:
-                            time.sleep(1)
-                            loading_elements = self.driver.find_elements(By.XPATH, 
-                                "//*[contains(translate(text(), 'PLEASEWAIT', 'pleasewait'), 'wait') or contains(translate(text(), 'LOADING', 'loading'), 'loading')]")
-                            visible_loading = [elem for elem in loading_elements if elem.is_displayed()]
-                            
-                            if not visible_loading:
-                                print(f"    ✓ 頁面反應完成")
-                                break
-                    except:
-                        pass
-                    
-                    time.sleep(0.1)
-                else:
-                    print(f"    ⚠ 等待頁面反應超時，繼續執行")
-            
-            #amt_element.send_keys(Keys.TAB)
-           
-            # 短暫延遲，確保數據已輸入
-            #time.sleep(0.3)
+            else:
+                # 小數點後不為 0（或無法解析），需要手動填入
+                self._enter_amount_manually(amt_element, amt_text)
+                # 手動填入複價會觸發 postback，表格可能已重新產生
+                self._refresh_item_index_if_stale()
             
             return True
             
         except Exception as e:
-            print(f"    ✗ 填入數據時發生錯誤: {e}")
+            logger.warning(f"    ✗ 填入數據時發生錯誤: {e}")
             return False
     
-    def process_dataframe(self, df: pd.DataFrame, delay: float = 0.5) -> dict:
+    def fill_batch(self, entries: List[Tuple[int, float, float]]) -> List[dict]:
         """
-        處理整個 DataFrame，自動填寫表單
+        批次填入多列數量，以單一 execute_script 呼叫完成
+        
+        每列設定數量後會觸發 input/keyup/change/blur 事件讓頁面自動計算複價，
+        並在同一次呼叫中回讀數量與複價。自動計算的複價含小數時不在批次中處理，
+        因為手動填入複價會觸發 postback，需交由 _fill_row 逐列處理。
         
         Args:
-            df: 包含「項次」、「數量」、「複價」欄位的 DataFrame
-            delay: 每筆資料之間的延遲時間（秒）
+            entries: (索引, 數量, 複價) 的列表，數量為數字或要輸入的整數文字
         
         Returns:
-            包含處理結果的字典
+            每列一個字典，包含 index、quantity、amount（網頁上的值）與 needs_manual
         """
-        if not self.driver:
-            raise RuntimeError("瀏覽器尚未啟動，請先呼叫 start_browser() 或 open_url()")
+        payload = [[index, quantity if isinstance(quantity, str) else str(int(quantity))]
+                   for index, quantity, _ in entries]
+        returned = self.driver.execute_script(_BATCH_FILL_SCRIPT, payload) or []
         
-        results = {
-            'total': len(df),
-            'success': 0,
-            'failed': 0,
-            'not_found': 0,
-            'failed_items': []
+        results = []
+        for index, qty_text, amt_text in returned:
+            found = qty_text is not None
+            results.append({
+                'index': int(index),
+                'found': found,
+                'quantity': qty_text,
+                'amount': amt_text,
+                'needs_manual': found and not _is_whole_amount(amt_text)
+            })
+        return results
+    
+    def _add_failure(self, results: dict, item: str, reason: str):
+        """記錄一筆失敗的項次（精簡模式使用 FillRecord，否則使用字典）"""
+        if self._compact:
+            results['failed_items'].append(FillRecord(item, reason))
+        else:
+            results['failed_items'].append({'item': item, 'reason': reason})
+    
+    def _journal_success(self, item: str, quantity, amount):
+        """將成功填入的項次寫入填寫日誌（未提供日誌時不動作）"""
+        if self._journal is None:
+            return
+        from data_pipeline import normalize_item
+        
+        try:
+            self._journal.append(normalize_item(item), int(_to_number(quantity)), _to_number(amount))
+        except (ValueError, TypeError):
+            pass
+    
+    def _skip_journaled_rows(self, df: pd.DataFrame, results: dict, grid: dict) -> pd.DataFrame:
+        """
+        略過填寫日誌中已完成、且網頁上仍是相同數值的項次
+        
+        以 scan_pages 的表格內容確認，網頁已重新載入（數值遺失）的項次會重新填寫；
+        日誌記錄的值與試算表目前的數量、複價不同（試算表已修改）的項次也會重新填寫。
+        """
+        import pandas as pd
+        from data_pipeline import normalize_items
+        from grid_compare import values_match
+        
+        completed = self._journal.entries()
+        if not completed:
+            return df
+        
+        verified = {
+            item for item, record in completed.items()
+            if item in grid and values_match(grid[item]['quantity'], grid[item]['amount'],
+                                             record['quantity'], record['amount'])
         }
         
-        print("\n" + "=" * 50)
-        print("開始處理 DataFrame 資料...")
-        print("=" * 50)
+        items = normalize_items(df['項次'])
+        skip = pd.Series([
+            item in verified and values_match(str(completed[item]['quantity']),
+                                              str(completed[item]['amount']), quantity, amount)
+            for item, quantity, amount in zip(items, df['數量'], df['複價'])
+        ], index=df.index, dtype=bool)
+        results['resumed'] = int(skip.sum())
+        results['success'] += results['resumed']
+        logger.info(f"✓ 依填寫日誌略過 {results['resumed']} 筆已完成的項次"
+                    f"（日誌 {len(completed)} 筆，網頁確認 {len(verified)} 筆）")
+        return df[~skip]
+    
+    def _skip_unchanged_rows(self, df: pd.DataFrame, results: dict, grid: dict) -> pd.DataFrame:
+        """
+        只保留網頁上的值與試算表不同的列
+        
+        以 scan_pages 取得的所有數量與複價做向量化比對，找出需要填寫的列。
+        """
+        from grid_compare import grid_to_frame, changed_mask
+        
+        mask = changed_mask(df, grid_to_frame(grid))
+        
+        results['unchanged'] = int((~mask).sum())
+        results['success'] += results['unchanged']
+        logger.info(f"✓ 網頁上已有 {results['unchanged']} 筆相同的數值，"
+                    f"只需填寫 {int(mask.sum())} 筆")
+        return df[mask]
+    
+    def _process_by_row(self, df: pd.DataFrame, results: dict, delay: float,
+                        offset: int = 0, total: Optional[int] = None):
+        """
+        逐筆處理 prepare_fill_data 準備好的資料，結果累加至 results
         
-        for idx, row in df.iterrows():
-            item = str(row['項次']).strip()
-            quantity = row['數量']
-            amount = row['複價']
+        offset 與 total 為分頁處理時這一組在全部資料中的起始位置與總筆數，
+        用於遙測的列號與進度顯示。
+        """
+        rows = df[['項次', '數量', '複價', 'qty_text', 'amt_text']].itertuples(index=False, name=None)
+        total = len(df) if total is None else total
+        
+        for position, (item, quantity_value, amount_value, qty_text, amt_text) in enumerate(rows, start=offset):
+            self._current_row = position
+            row_started = time.perf_counter()
             
-            print(f"\n[{idx + 1}/{len(df)}] 處理項次: {item}")
+            logger.debug(f"\n[{position + 1}/{total}] 處理項次: {item}")
             
             # 查找項次對應的索引
-            web_index = self.find_item_index(item)
+            with self._span('lookup'):
+                web_index = self.find_item_index(item)
             
             if web_index is None:
                 results['not_found'] += 1
-                results['failed_items'].append({
-                    'item': item,
-                    'reason': '網頁中未找到此項次'
-                })
+                self._add_failure(results, item, '網頁中未找到此項次')
                 continue
             
             # 填入數量和複價
-            success = self.fill_quantity_and_amount(web_index, quantity, amount)
+            success = self._fill_row(web_index, qty_text, amt_text)
             
             if success:
                 results['success'] += 1
+                self._journal_success(item, quantity_value, amount_value)
             else:
                 results['failed'] += 1
-                results['failed_items'].append({
-                    'item': item,
-                    'reason': '填入數據時發生錯誤'
-                })
+                self._add_failure(results, item, '填入數據時發生錯誤')
+            self.telemetry.record(position, 'row_total', time.perf_counter() - row_started)
             
             # 延遲，避免操作過快
-            time.sleep(delay)
+            self._pause(delay, success)
+    
+    def _process_in_batches(self, df: pd.DataFrame, results: dict, batch_size: int, delay: float,
+                            offset: int = 0, total: Optional[int] = None):
+        """以批次模式處理 prepare_fill_data 準備好的資料，結果累加至 results（offset、total 同 _process_by_row）"""
+        rows = list(df[['項次', '數量', '複價', 'qty_text', 'amt_text']].itertuples(index=False, name=None))
+        total = len(df) if total is None else total
+        
+        for chunk_start in range(0, len(rows), batch_size):
+            chunk = rows[chunk_start:chunk_start + batch_size]
+            start = offset + chunk_start
+            logger.debug(f"\n[{start + 1}-{start + len(chunk)}/{total}] 批次處理 {len(chunk)} 筆")
+            
+            entries = []
+            pending = []
+            for position, (item, quantity_value, amount_value, qty_text, amt_text) in enumerate(chunk, start=start):
+                self._current_row = position
+                with self._span('lookup'):
+                    web_index = self.find_item_index(item)
+                
+                if web_index is None:
+                    results['not_found'] += 1
+                    self._add_failure(results, item, '網頁中未找到此項次')
+                    continue
+                
+                entries.append((web_index, qty_text, amount_value))
+                pending.append((position, item, quantity_value, amount_value, qty_text, amt_text))
+            
+            if not entries:
+                continue
+            
+            try:
+                self._current_row = start
+                with self._span('batch_fill'):
+                    filled = self.fill_batch(entries)
+            except Exception as e:
+                logger.warning(f"    ✗ 批次填入時發生錯誤: {e}")
+                filled = [{'index': index, 'found': False, 'needs_manual': False}
+                          for index, _, _ in entries]
+            
+            batch_ok = True
+            for entry, (position, item, quantity_value, amount_value, qty_text, amt_text) in zip(filled, pending):
+                self._current_row = position
+                if not entry['found']:
+                    success = False
+                elif entry['needs_manual']:
+                    # 複價含小數，需逐列手動填入（會觸發 postback）
+                    success = self._fill_row(entry['index'], qty_text, amt_text)
+                else:
+                    logger.debug(f"    ✓ {item}: 數量 {entry['quantity']}，複價已自動計算: {entry['amount']}")
+                    success = True
+                
+                if success:
+                    results['success'] += 1
+                    self._journal_success(item, quantity_value, amount_value)
+                else:
+                    results['failed'] += 1
+                    self._add_failure(results, item, '填入數據時發生錯誤')
+                    batch_ok = False
+            
+            # 延遲，避免操作過快
+            self._pause(delay, batch_ok)
+    
+    def _process_by_page(self, df: pd.DataFrame, results: dict, batch_size: Optional[int], delay: float,
+                         on_page_done: Optional[Callable[[int], None]] = None):
+        """
+        依項次所在的分頁分組處理，每一頁只切換一次
+        
+        先處理目前頁，再依頁碼順序處理其餘各頁。scan_pages 中沒有的項次
+        在目前頁處理（查找不到時回報為未找到）。無法切換到的分頁，該頁的
+        項次全部記為失敗。每處理完一頁，在切換到下一頁之前呼叫 on_page_done。
+        """
+        page_of = {item: page for item, (page, _) in self._page_map.items()}
+        pages = df['項次'].map(page_of).fillna(self._current_page).astype(int).to_numpy()
+        order = sorted(set(pages), key=lambda page: (page != self._current_page, page))
+        
+        offset = 0
+        for page in order:
+            group = df[pages == page]
+            if not self.go_to_page(page):
+                logger.warning(f"✗ 無法切換到第 {page} 頁，此頁 {len(group)} 筆記為失敗")
+                results['failed'] += len(group)
+                for item in group['項次']:
+                    self._add_failure(results, item, f'無法切換到第 {page} 頁')
+                offset += len(group)
+                continue
+            
+            logger.info(f"第 {page} 頁: {len(group)} 筆")
+            if batch_size:
+                self._process_in_batches(group, results, batch_size, delay, offset, len(df))
+            else:
+                self._process_by_row(group, results, delay, offset, len(df))
+            offset += len(group)
+            if on_page_done is not None:
+                on_page_done(page)
+    
+    def process_dataframe(self, df: pd.DataFrame, delay: float = 0.5,
+                          batch_size: Optional[int] = None,
+                          journal: Optional[FillJournal] = None,
+                          only_changed: bool = False,
+                          compact: bool = False,
+                          adaptive: bool = False,
+                          on_page_done: Optional[Callable[[int], None]] = None) -> dict:
+        """
+        處理整個 DataFrame，自動填寫表單
+        
+        Args:
+            df: 包含「項次」、「數量」、「複價」欄位的 DataFrame
+            delay: 每筆資料之間的延遲時間（秒）；批次模式下為每批之間的延遲
+            batch_size: 批次模式每批的筆數，None 表示逐筆填寫
+            journal: 填寫日誌；提供時每完成一筆就寫入日誌，並略過日誌中
+                     已完成且網頁上仍是相同數值的項次（結果中的 'resumed' 筆數）
+            only_changed: 是否只填寫網頁上數值與試算表不同的列
+                          （相同的列計入結果中的 'unchanged' 筆數）
+            compact: 精簡模式，failed_items 以 __slots__ 的 FillRecord 取代字典
+            adaptive: 自適應節流，以 delay 為起始延遲，依 postback 延遲與錯誤自動調整
+                      （統計見結果中的 'throttle'）
+            on_page_done: 每填完表格的一頁、切換到下一頁之前呼叫，參數為頁碼
+                          （例如在該頁按下儲存）；表格沒有分頁時在全部填完後呼叫一次
+        
+        表格分頁時會先以 scan_pages 走訪各頁建立跨頁的項次對照表，再依項次所在的
+        頁分組填寫，每一頁只切換一次。切換分頁前填入的值須由頁面保存（例如每次
+        修改都會 postback 的頁面），否則換頁後會遺失。
         
-        print("\n" + "=" * 50)
-        print("處理完成！")
-        print("=" * 50)
-        print(f"總計: {results['total']} 筆")
-        print(f"成功: {results['success']} 筆")
-        print(f"失敗: {results['failed']} 筆")
-        print(f"未找到: {results['not_found']} 筆")
+        Returns:
+            包含處理結果的字典；'timing' 為各階段耗時的 p50/p95/max 統計，
+            完整記錄可由 self.telemetry 匯出為 JSON/CSV；'rate' 為實際填寫的筆數/秒
+        """
+        self._ensure_started()
+        
+        self.telemetry = RunTelemetry()
+        started = time.perf_counter()
+        
+        results = {
+            'total': len(df),
+            'success': 0,
+            'failed': 0,
+            'not_found': 0,
+            'failed_items': []
+        }
+        
+        logger.info("\n" + "=" * 50)
+        logger.info("開始處理 DataFrame 資料...")
+        logger.info("=" * 50)
+        
+        # 使用者可能在開啟網址後手動登入或切換頁面，重新建立項次索引
+        self.invalidate_item_index()
+        
+        self._compact = compact
+        self.throttle = AdaptiveThrottle(initial=delay) if adaptive else None
+        
+        from data_pipeline import prepare_fill_data
+        
+        # 先把數量與複價一次轉換為數字，無法轉換的列在瀏覽器操作前就回報
+        df, invalid = prepare_fill_data(df)
+        for item in invalid['項次']:
+            logger.warning(f"  ✗ 項次 '{item}' 的數量或複價無法轉換為數字")
+            results['failed'] += 1
+            self._add_failure(results, str(item).strip(), '數量或複價無法轉換為數字')
+        
+        # 一次走訪表格（分頁時每頁一次），取得跨頁的項次位置與目前的數量、複價
+        grid = self.scan_pages()
+        
+        self._journal = journal
+        try:
+            if journal is not None:
+                df = self._skip_journaled_rows(df, results, grid)
+            
+            if only_changed:
+                df = self._skip_unchanged_rows(df, results, grid)
+            
+            if self._pager:
+                self._process_by_page(df, results, batch_size, delay, on_page_done)
+            else:
+                if batch_size:
+                    self._process_in_batches(df, results, batch_size, delay)
+                else:
+                    self._process_by_row(df, results, delay)
+                if on_page_done is not None:
+                    on_page_done(self._current_page)
+        finally:
+            self._journal = None
+        
+        results['elapsed'] = time.perf_counter() - started
+        results['rate'] = len(df) / results['elapsed'] if results['elapsed'] else 0.0
+        results['timing'] = self.telemetry.summary()
+        if self.throttle is not None:
+            results['throttle'] = self.throttle.summary()
+        
+        logger.info("\n" + "=" * 50)
+        logger.info("處理完成！")
+        logger.info("=" * 50)
+        logger.info(f"總計: {results['total']} 筆")
+        logger.info(f"成功: {results['success']} 筆")
+        logger.info(f"失敗: {results['failed']} 筆")
+        logger.info(f"未找到: {results['not_found']} 筆")
+        logger.info(f"耗時: {results['elapsed']:.2f} 秒（{results['rate']:.2f} 筆/秒）")
+        if self.throttle is not None:
+            throttle = results['throttle']
+            logger.info(f"節流: 目前延遲 {throttle['delay']:.2f} 秒，最高 {throttle['peak_delay']:.2f} 秒，"
+                        f"累計等待 {throttle['slept']:.2f} 秒，慢速 postback {throttle['slow_postbacks']} 次")
+        logger.info("\n各階段耗時:\n" + self.telemetry.format_summary())
         
         if results['failed_items']:
-            print("\n失敗的項次:")
+            logger.info("\n失敗的項次:")
             for item in results['failed_items']:
-                print(f"  - {item['item']}: {item['reason']}")
+                logger.info(f"  - {item['item']}: {item['reason']}")
         
         return results
     
+    def reconcile(self, df: pd.DataFrame, output_path: Optional[Union[str, Path]] = None) -> pd.DataFrame:
+        """
+        核對網頁表格目前的數量與複價是否與試算表一致
+        
+        以一次表格讀取（分頁時每頁一次）取得所有欄位值，再以項次向量化比對。
+        
+        Args:
+            df: 包含「項次」、「數量」、「複價」欄位的 DataFrame
+            output_path: 報告輸出路徑（.xlsx 或 .csv），None 表示不輸出檔案
+        
+        Returns:
+            不一致項次的 DataFrame（狀態為網頁缺少、網頁多出、網頁未填、數量不符或複價不符），
+            全部一致時為空的 DataFrame
+        """
+        from grid_compare import grid_to_frame, reconcile, save_reconciliation
+        
+        started = time.perf_counter()
+        report = reconcile(df, grid_to_frame(self.scan_pages()))
+        
+        if report.empty:
+            logger.info(f"✓ 核對完成：網頁與試算表一致（{time.perf_counter() - started:.2f} 秒）")
+        else:
+            counts = report['狀態'].value_counts()
+            logger.warning(f"✗ 核對完成：{len(report)} 個項次不一致（"
+                           + "，".join(f"{status} {count}" for status, count in counts.items())
+                           + f"，{time.perf_counter() - started:.2f} 秒）")
+        
+        if output_path is not None:
+            output_path = save_reconciliation(report, output_path)
+            logger.info(f"✓ 核對報告已儲存至: {output_path}")
+        return report
+    
     def close_browser(self):
-        """關閉瀏覽器"""
+        """關閉瀏覽器（連接到執行中的瀏覽器時只中斷連線，保留瀏覽器與登入狀態）"""
         if self.driver:
-            self.driver.quit()
-            print("\n✓ 瀏覽器已關閉")
+            if self.debugger_address:
+                self.driver.service.stop()
+                logger.info("\n✓ 已中斷與瀏覽器的連線")
+            else:
+                self.driver.quit()
+                logger.info("\n✓ 瀏覽器已關閉")
+            self.driver = None
     
     def __enter__(self):
         """支援 with 語句"""
@@ -333,7 +1222,11 @@ class WebFormFiller:
 
 
 def fill_web_form_from_dataframe(df: pd.DataFrame, url: str, headless: bool = False, 
-                                  wait_time: int = 10, delay: float = 0.5) -> dict:
+                                  wait_time: int = 10, delay: float = 0.5,
+                                  batch_size: Optional[int] = None,
+                                  only_changed: bool = False,
+                                  compact: bool = False,
+                                  adaptive: bool = False) -> dict:
     """
     便捷函式：從 DataFrame 自動填寫網頁表單
     
@@ -343,12 +1236,18 @@ def fill_web_form_from_dataframe(df: pd.DataFrame, url: str, headless: bool = Fa
         headless: 是否使用無頭模式
         wait_time: 等待頁面載入的時間（秒）
         delay: 每筆資料之間的延遲時間（秒）
+        batch_size: 批次模式每批的筆數，None 表示逐筆填寫
+        only_changed: 是否只填寫網頁上數值與試算表不同的列
+        compact: 是否以精簡結構記錄失敗項目（大量資料時降低記憶體用量）
+        adaptive: 是否依伺服器回應速度自動調整每筆之間的延遲（delay 為起始值）
     
     Returns:
         包含處理結果的字典
     """
     with WebFormFiller(headless=headless) as filler:
         filler.open_url(url, wait_time=wait_time)
-        results = filler.process_dataframe(df, delay=delay)
+        results = filler.process_dataframe(df, delay=delay, batch_size=batch_size,
+                                           only_changed=only_changed, compact=compact,
+                                           adaptive=adaptive)
     
     return results